@@ -39,10 +39,13 @@ __all__ = [
     "array_list",
     "association",
     "binary_heap",
+    "compact_graph",
     "container",
     "dfs_edge_classification",
     "doubly_linked_list",
+    "dynamic_minimum_spanning_tree",
     "entry",
+    "gomory_hu_tree",
     "graph",
     "graph_algorithms",
     "graph_edge",
@@ -52,11 +55,13 @@ __all__ = [
     "iterator",
     "linked_list",
     "linked_list_iterator",
+    "max_flow",
     "max_heap",
     "min_heap",
     "minimum_spanning_tree",
     "partition",
     "queue",
+    "reachability",
     "singly_linked_list",
     "stack",
     "string_visitor",
@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 by Brian Horn, trycatchhorn@gmail.com.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Provides a compact, array based view of a graph.
+"""
+
+__author__ = "Brian Horn"
+__copyright__ = "Copyright (c) 2015 Brian Horn"
+__credits__ = "Brian Horn"
+__license__ = "MIT"
+__version__ = "1.0.2"
+__maintainer__ = "Brian Horn"
+__email__ = "trycatchhorn@gmail.com"
+__status__ = "Prototype"
+
+
+class CompactGraph(object):
+
+    """
+    A read-only, array based view of a graph.
+
+    The arcs of the graph are stored in compressed sparse row
+    (CSR) format. The arcs emanating from the vertex with index i
+    are found at the positions offsets[i] up to, but not including,
+    offsets[i + 1] in the targets, weights and edges arrays. An
+    undirected graph stores each edge in both directions, which is
+    also the case for the adjacency lists of the graph.
+
+    The view is built in O(n + m) time, where n is the number of
+    vertices and m is the number of edges, by walking the adjacency
+    lists of the graph once. Afterwards, the successors of a vertex
+    can be enumerated in time proportional to its out-degree.
+    """
+
+    def __init__(self, graph, transpose=False):
+        """
+        Constructs a compact view of the specified graph. If the
+        transpose parameter is True, the view holds the arcs of
+        the graph in the reverse direction, that is, the arcs
+        emanating from a vertex in the view are the arcs incident
+        to the vertex in the graph.
+
+        @param graph: The graph of which the view is constructed.
+        @type: L{Graph}
+        @param transpose: Specifies if the arcs should be reversed.
+        @type: C{bool}
+        """
+        self.graph = graph
+        self.transpose = transpose
+        self.number_of_vertices = graph.get_number_of_vertices()
+        self.offsets = [0] * (self.number_of_vertices + 1)
+        self.targets = []
+        self.weights = []
+        self.edges = []
+
+        weighted = graph.is_weighted()
+        sources = []
+        targets = []
+        weights = []
+        edges = []
+        for i in xrange(self.number_of_vertices):
+            ptr = graph.adjacency_list[i].head
+            while ptr is not None:
+                edge = ptr.data
+                if edge is not None:
+                    sources.append(edge.head_vertex.vertex_number)
+                    targets.append(edge.tail_vertex.vertex_number)
+                    if weighted:
+                        weights.append(edge.get_weight())
+                    else:
+                        weights.append(1)
+                    edges.append(edge)
+                ptr = ptr.next
+        if transpose:
+            sources, targets = targets, sources
+
+        # Counting sort of the arcs by their source vertex, which
+        # keeps the order of the adjacency lists for each vertex.
+        number_of_arcs = len(sources)
+        for source in sources:
+            self.offsets[source + 1] += 1
+        for i in xrange(self.number_of_vertices):
+            self.offsets[i + 1] += self.offsets[i]
+        position = self.offsets[:-1]
+        self.targets = [0] * number_of_arcs
+        self.weights = [0] * number_of_arcs
+        self.edges = [None] * number_of_arcs
+        for i in xrange(number_of_arcs):
+            index = position[sources[i]]
+            position[sources[i]] += 1
+            self.targets[index] = targets[i]
+            self.weights[index] = weights[i]
+            self.edges[index] = edges[i]
+
+    def __len__(self):
+        """
+        Returns the number of vertices contained in this view.
+
+        @return: The number of vertices in the view.
+        @rtype: C{int}
+        """
+        return self.number_of_vertices
+
+    def __getitem__(self, index):
+        """
+        Returns the vertex of the graph at the specified index.
+
+        @param index: The index of the vertex.
+        @type: C{int}
+        @return: The vertex at the specified index.
+        @rtype: L{GraphVertex}
+        """
+        return self.graph.vertices[index]
+
+    def get_graph(self):
+        """
+        Returns the graph from where this view was constructed.
+
+        @return: The graph of the view.
+        @rtype: L{Graph}
+        """
+        return self.graph
+
+    def get_number_of_vertices(self):
+        """
+        Returns the number of vertices contained in this view.
+
+        @return: The number of vertices in the view.
+        @rtype: C{int}
+        """
+        return self.number_of_vertices
+
+    def get_number_of_arcs(self):
+        """
+        Returns the number of arcs contained in this view. For
+        an undirected graph this is twice the number of edges.
+
+        @return: The number of arcs in the view.
+        @rtype: C{int}
+        """
+        return len(self.targets)
+
+    def get_offsets(self):
+        """
+        Returns the offsets array of this view.
+
+        @return: The offsets array of the view.
+        @rtype: C{list}
+        """
+        return self.offsets
+
+    def get_targets(self):
+        """
+        Returns the targets array of this view.
+
+        @return: The targets array of the view.
+        @rtype: C{list}
+        """
+        return self.targets
+
+    def get_weights(self):
+        """
+        Returns the weights array of this view. The weight of
+        an arc in an unweighted graph is one.
+
+        @return: The weights array of the view.
+        @rtype: C{list}
+        """
+        return self.weights
+
+    def get_edges(self):
+        """
+        Returns the array of graph edges backing the arcs of
+        this view.
+
+        @return: The edges array of the view.
+        @rtype: C{list}
+        """
+        return self.edges
+
+    def get_out_degree(self, index):
+        """
+        Returns the number of arcs emanating the vertex with the
+        specified index in this view.
+
+        @param index: The index of the vertex.
+        @type: C{int}
+        @return: The number of arcs emanating the vertex.
+        @rtype: C{int}
+        """
+        return self.offsets[index + 1] - self.offsets[index]
+
+    def get_successors(self, index):
+        """
+        Returns the indices of the vertices reached by the arcs
+        emanating the vertex with the specified index.
+
+        @param index: The index of the vertex.
+        @type: C{int}
+        @return: The indices of the successors of the vertex.
+        @rtype: C{list}
+        """
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def breadth_first_distances(self, start):
+        """
+        Returns the number of arcs on a shortest path from the
+        vertex with the specified index to every vertex in this
+        view. Unreachable vertices have the distance -1.
+
+        @param start: The index of the vertex from where the search begins.
+        @type: C{int}
+        @return: The hop distance to every vertex.
+        @rtype: C{list}
+        """
+        offsets = self.offsets
+        targets = self.targets
+        distances = [-1] * self.number_of_vertices
+        distances[start] = 0
+        frontier = [start]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for vertex in frontier:
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    successor = targets[i]
+                    if distances[successor] < 0:
+                        distances[successor] = distance
+                        next_frontier.append(successor)
+            frontier = next_frontier
+        return distances
+
+    def topological_order(self):
+        """
+        Returns the indices of the vertices in this view in a
+        topological order, where every arc leads from a vertex to a
+        later vertex, found by Kahn's algorithm. If the view has a
+        cycle, there is no topological order.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of arcs.
+
+        @return: The vertices in topological order, or None if the view has a cycle.
+        @rtype: C{list}
+        """
+        offsets = self.offsets
+        targets = self.targets
+        in_degree = [0] * self.number_of_vertices
+        for successor in targets:
+            in_degree[successor] += 1
+        order = [i for i in xrange(self.number_of_vertices)
+                 if in_degree[i] == 0]
+        # The order list is used as the queue of vertices with no
+        # remaining incoming arcs.
+        position = 0
+        while position < len(order):
+            vertex = order[position]
+            position += 1
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                successor = targets[i]
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    order.append(successor)
+        if len(order) != self.number_of_vertices:
+            return None
+        return order
@@ -302,6 +302,47 @@ class DFSEdgeClassification(object):
         """
         return self.classification.has_cross_edges()
 
+    def get_low(self):
+        """
+        Returns the dictionary holding the lowlink value
+        of each vertex in this edge classification.
+
+        @return: The lowlink dictionary of the classification.
+        @rtype: C{dictionary}
+        """
+        return self.classification.get_low()
+
+    def get_articulation_points(self):
+        """
+        Returns the articulation points found by this edge
+        classification. The articulation points are returned
+        in a set.
+
+        @return: The articulation points in the classification.
+        @rtype: C{set}
+        """
+        return self.classification.get_articulation_points()
+
+    def get_bridges(self):
+        """
+        Returns the bridges found by this edge classification.
+        The bridges are returned in a set.
+
+        @return: The bridges in the classification.
+        @rtype: C{set}
+        """
+        return self.classification.get_bridges()
+
+    def get_biconnected_components(self):
+        """
+        Returns the biconnected components found by this edge
+        classification. Each component is a list of edges.
+
+        @return: The biconnected components in the classification.
+        @rtype: C{list}
+        """
+        return self.classification.get_biconnected_components()
+
     def dfs_recursive_directed(self):
         """
         Performs a recursive depth-first traversal of the
@@ -431,6 +472,113 @@ class DFSEdgeClassification(object):
         results.finishing_time[vertex_u] = results.time
         results.order.append(vertex_u)
 
+    def dfs_iterative_undirected(self):
+        """
+        Performs an iterative depth-first traversal of the
+        undirected graph in this edge classification, which
+        classifies the edges as tree edges or back edges, like
+        L{dfs_recursive_undirected}, and additionally computes
+        the articulation points, the bridges and the biconnected
+        components of the graph (Hopcroft-Tarjan).
+
+        Besides the discovery time, each vertex u is given a
+        lowlink value low(u), being the smallest discovery time
+        of a vertex reachable from the subtree of u in the
+        depth-first tree by following at most one back edge.
+        When the traversal of a child v of u has finished:
+
+        1) If low(v) >= d(u), then no vertex in the subtree of v
+        can reach a proper ancestor of u without passing u. The
+        edges pushed onto the edge stack since the tree edge (u, v)
+        form a biconnected component, and u is an articulation
+        point unless it is the root of the depth-first tree.
+
+        2) If low(v) > d(u), then the tree edge (u, v) is a bridge.
+
+        The root of a depth-first tree is an articulation point if
+        it has more than one child in the tree.
+
+        The traversal keeps an explicit stack of positions in the
+        adjacency lists instead of recursing, so the depth of the
+        graph is not limited by the recursion limit of Python.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+        """
+        results = self.classification
+        parent = results.parent
+        discovery_time = results.discovery_time
+        low = results.low
+        vertices = self.graph.vertices
+        adjacency_list = self.graph.adjacency_list
+        for root in self.graph.get_vertices():
+            if root in parent:
+                continue
+            parent[root] = None
+            results.time += 1
+            discovery_time[root] = results.time
+            low[root] = results.time
+            root_children = 0
+            edge_stack = []
+            # Each frame holds: the vertex, the tree edge leading to
+            # the vertex, the position in its adjacency list, and if
+            # the reverse of the tree edge has been skipped.
+            stack = [[root, None, adjacency_list[root.vertex_number].head, False]]
+            while stack:
+                frame = stack[-1]
+                vertex_u = frame[0]
+                ptr = frame[2]
+                if ptr is None:
+                    stack.pop()
+                    results.time += 1
+                    results.finishing_time[vertex_u] = results.time
+                    results.order.append(vertex_u)
+                    tree_edge = frame[1]
+                    if tree_edge is not None:
+                        vertex_p = parent[vertex_u]
+                        if low[vertex_u] < low[vertex_p]:
+                            low[vertex_p] = low[vertex_u]
+                        if low[vertex_u] >= discovery_time[vertex_p]:
+                            if parent[vertex_p] is not None:
+                                results.articulation_points.add(vertex_p)
+                            component = []
+                            while True:
+                                edge = edge_stack.pop()
+                                component.append(edge)
+                                if edge is tree_edge:
+                                    break
+                            results.biconnected_components.append(component)
+                        if low[vertex_u] > discovery_time[vertex_p]:
+                            results.bridges.add(tree_edge)
+                    continue
+                frame[2] = ptr.next
+                edge = ptr.data
+                if edge is None:
+                    continue
+                vertex_v = vertices[edge.tail_vertex.vertex_number]
+                if vertex_v not in parent:
+                    parent[vertex_v] = vertex_u
+                    results.time += 1
+                    discovery_time[vertex_v] = results.time
+                    low[vertex_v] = results.time
+                    results.edges[edge] = EdgeClassification.TREE_EDGE
+                    edge_stack.append(edge)
+                    if vertex_u is root:
+                        root_children += 1
+                    stack.append([vertex_v, edge,
+                                  adjacency_list[vertex_v.vertex_number].head, False])
+                elif vertex_v == parent[vertex_u] and not frame[3]:
+                    # The reverse of the tree edge leading to u.
+                    frame[3] = True
+                elif discovery_time[vertex_v] < discovery_time[vertex_u]:
+                    results.edges[edge] = EdgeClassification.BACK_EDGE
+                    edge_stack.append(edge)
+                    if discovery_time[vertex_v] < low[vertex_u]:
+                        low[vertex_u] = discovery_time[vertex_v]
+            if root_children > 1:
+                results.articulation_points.add(root)
+        return self.classification
+
 
 class DFSResult(object):
 
@@ -450,6 +598,10 @@ class DFSResult(object):
         self.edges = {}
         self.order = []
         self.time = 0
+        self.low = {}
+        self.articulation_points = set()
+        self.bridges = set()
+        self.biconnected_components = []
 
     def clear(self):
         """
@@ -462,6 +614,10 @@ class DFSResult(object):
         self.edges = {}
         self.order = []
         self.time = 0
+        self.low = {}
+        self.articulation_points = set()
+        self.bridges = set()
+        self.biconnected_components = []
 
     def get_parent(self):
         """
@@ -515,6 +671,47 @@ class DFSResult(object):
         """
         return self.order
 
+    def get_low(self):
+        """
+        Returns the dictionary holding the lowlink value
+        of each vertex in this edge classification.
+
+        @return: The lowlink dictionary of the classification.
+        @rtype: C{dictionary}
+        """
+        return self.low
+
+    def get_articulation_points(self):
+        """
+        Returns the articulation points found by this edge
+        classification. The articulation points are returned
+        in a set.
+
+        @return: The articulation points in the classification.
+        @rtype: C{set}
+        """
+        return self.articulation_points
+
+    def get_bridges(self):
+        """
+        Returns the bridges found by this edge classification.
+        The bridges are returned in a set.
+
+        @return: The bridges in the classification.
+        @rtype: C{set}
+        """
+        return self.bridges
+
+    def get_biconnected_components(self):
+        """
+        Returns the biconnected components found by this edge
+        classification. Each component is a list of edges.
+
+        @return: The biconnected components in the classification.
+        @rtype: C{list}
+        """
+        return self.biconnected_components
+
     def get_parent_of_vertex(self, vertex):
         """
         Returns the parent vertex of the specified
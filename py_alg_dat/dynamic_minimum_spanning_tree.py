@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 by Brian Horn, trycatchhorn@gmail.com.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Provides a minimum spanning tree maintained under edge updates.
+"""
+
+__author__ = "Brian Horn"
+__copyright__ = "Copyright (c) 2015 Brian Horn"
+__credits__ = "Brian Horn"
+__license__ = "MIT"
+__version__ = "1.0.2"
+__maintainer__ = "Brian Horn"
+__email__ = "trycatchhorn@gmail.com"
+__status__ = "Prototype"
+
+from py_alg_dat.compact_graph import CompactGraph
+from py_alg_dat.graph_edge import UnDirectedWeightedGraphEdge
+from py_alg_dat.minimum_spanning_tree import MinimumSpanningTree
+from py_alg_dat.partition import ArrayPartition
+
+
+class DynamicMinimumSpanningTree(object):
+
+    """
+    Maintains a minimum spanning forest of a weighted undirected graph
+    while edges are inserted, removed and change weight, without
+    recomputing it from scratch.
+
+    The weight of every edge is kept in a dictionary keyed by the pair
+    of vertex numbers of its end points, with the lower number first,
+    and the tree edges in an adjacency dictionary per vertex. The
+    weights are owned by this structure, so the edges of the graph
+    are left unchanged by the updates.
+
+    An edge which is inserted or made lighter replaces the heaviest
+    edge on the tree path between its end points, if that edge is
+    heavier. When a tree edge is removed or made heavier, the tree is
+    split in two, and the lightest edge reconnecting the two parts is
+    searched among the non-tree edges. Both cases take O(n) time for
+    the tree search, and the replacement search O(m) time, where n is
+    the number of vertices and m is the number of edges.
+    """
+
+    def __init__(self, graph):
+        """
+        Constructs the dynamic minimum spanning tree of the specified
+        graph. The initial tree is found by Kruskal's algorithm. If
+        there are several edges between two vertices, the lightest is
+        used. The edges are taken from a L{CompactGraph}, which walks
+        the adjacency lists of the graph once.
+
+        Time complexity: O(n + m log(m)), where n is the number of
+        vertices and m is the number of edges.
+
+        @param graph: The graph from where the minimum spanning tree is computed.
+        @type: L{UnDirectedWeightedGraph}
+        """
+        self.graph = graph
+        self.number_of_vertices = graph.get_number_of_vertices()
+        self.weights = {}
+        for edge in CompactGraph(graph).get_edges():
+            key = self.get_key(edge.head_vertex.vertex_number,
+                               edge.tail_vertex.vertex_number)
+            if key[0] != key[1]:
+                weight = edge.get_weight()
+                if key not in self.weights or weight < self.weights[key]:
+                    self.weights[key] = weight
+        self.tree = [{} for _ in xrange(self.number_of_vertices)]
+        self.total_weight = 0
+        partition = ArrayPartition(self.number_of_vertices)
+        for key in sorted(self.weights, key=self.weights.__getitem__):
+            if partition.union(key[0], key[1]):
+                self.link(key[0], key[1], self.weights[key])
+
+    def __len__(self):
+        """
+        Returns the number of edges in this minimum spanning tree.
+
+        @return: The number of tree edges.
+        @rtype: C{int}
+        """
+        return sum(len(x) for x in self.tree) // 2
+
+    @staticmethod
+    def get_key(vertex_u, vertex_v):
+        """
+        Returns the key of the edge between the specified vertices.
+
+        @param vertex_u: The number of the first end point.
+        @type: C{int}
+        @param vertex_v: The number of the second end point.
+        @type: C{int}
+        @return: The pair of vertex numbers with the lower number first.
+        @rtype: C{tuple}
+        """
+        if vertex_u < vertex_v:
+            return (vertex_u, vertex_v)
+        return (vertex_v, vertex_u)
+
+    def link(self, vertex_u, vertex_v, weight):
+        """
+        Adds the edge between the specified vertices to the tree.
+
+        @param vertex_u: The number of the first end point.
+        @type: C{int}
+        @param vertex_v: The number of the second end point.
+        @type: C{int}
+        @param weight: The weight of the edge.
+        @type: C{int}
+        """
+        self.tree[vertex_u][vertex_v] = weight
+        self.tree[vertex_v][vertex_u] = weight
+        self.total_weight += weight
+
+    def cut(self, vertex_u, vertex_v):
+        """
+        Removes the edge between the specified vertices from the tree.
+
+        @param vertex_u: The number of the first end point.
+        @type: C{int}
+        @param vertex_v: The number of the second end point.
+        @type: C{int}
+        """
+        self.total_weight -= self.tree[vertex_u].pop(vertex_v)
+        del self.tree[vertex_v][vertex_u]
+
+    def is_tree_edge(self, vertex_u, vertex_v):
+        """
+        Returns if the edge between the specified vertices is in the
+        minimum spanning tree.
+
+        @param vertex_u: The first end point.
+        @type: L{UnWeightedGraphVertex}
+        @param vertex_v: The second end point.
+        @type: L{UnWeightedGraphVertex}
+        @return: True if the edge is a tree edge, false otherwise.
+        @rtype: C{bool}
+        """
+        return vertex_v.vertex_number in self.tree[vertex_u.vertex_number]
+
+    def heaviest_path_edge(self, vertex_u, vertex_v):
+        """
+        Finds the heaviest edge on the tree path between the specified
+        vertices, by a breadth-first search in the tree from vertex_u
+        which stops when vertex_v is reached.
+
+        Time complexity: O(n), where n is the number of vertices.
+
+        @param vertex_u: The number of the first end point.
+        @type: C{int}
+        @param vertex_v: The number of the second end point.
+        @type: C{int}
+        @return: The key of the heaviest edge, or None if the vertices are not connected.
+        @rtype: C{tuple}
+        """
+        parent = {vertex_u: vertex_u}
+        frontier = [vertex_u]
+        while frontier and vertex_v not in parent:
+            next_frontier = []
+            for vertex in frontier:
+                for other in self.tree[vertex]:
+                    if other not in parent:
+                        parent[other] = vertex
+                        next_frontier.append(other)
+            frontier = next_frontier
+        if vertex_v not in parent:
+            return None
+        heaviest = None
+        vertex = vertex_v
+        while vertex != vertex_u:
+            weight = self.tree[vertex][parent[vertex]]
+            if heaviest is None or weight > heaviest[0]:
+                heaviest = (weight, vertex, parent[vertex])
+            vertex = parent[vertex]
+        return self.get_key(heaviest[1], heaviest[2])
+
+    def reconnect(self, vertex_u):
+        """
+        Reconnects the tree part holding the specified vertex, after a
+        tree edge leaving it has been removed, by the lightest edge
+        leaving the part, if there is any.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param vertex_u: The number of a vertex in the part.
+        @type: C{int}
+        """
+        inside = [False] * self.number_of_vertices
+        inside[vertex_u] = True
+        stack = [vertex_u]
+        while stack:
+            vertex = stack.pop()
+            for other in self.tree[vertex]:
+                if not inside[other]:
+                    inside[other] = True
+                    stack.append(other)
+        best = None
+        for key, weight in self.weights.iteritems():
+            if inside[key[0]] != inside[key[1]]:
+                if best is None or weight < self.weights[best]:
+                    best = key
+        if best is not None:
+            self.link(best[0], best[1], self.weights[best])
+
+    def update_edge(self, vertex_u, vertex_v, weight):
+        """
+        Inserts the edge between the specified vertices with the
+        specified weight, or changes its weight if it is already
+        present, and updates the minimum spanning tree.
+
+        Time complexity: O(n) for an insertion or a weight decrease,
+        and O(n + m) for a weight increase of a tree edge, where n is
+        the number of vertices and m is the number of edges.
+
+        @param vertex_u: The first end point.
+        @type: L{UnWeightedGraphVertex}
+        @param vertex_v: The second end point.
+        @type: L{UnWeightedGraphVertex}
+        @param weight: The new weight of the edge.
+        @type: C{int}
+        @raises: ValueError if the end points are the same vertex.
+        @type: C{ValueError}
+        """
+        number_u = vertex_u.vertex_number
+        number_v = vertex_v.vertex_number
+        if number_u == number_v:
+            raise ValueError
+        key = self.get_key(number_u, number_v)
+        old_weight = self.weights.get(key)
+        self.weights[key] = weight
+        if number_v in self.tree[number_u]:
+            self.cut(number_u, number_v)
+            if weight <= old_weight:
+                self.link(number_u, number_v, weight)
+            else:
+                self.reconnect(number_u)
+            return
+        heaviest = self.heaviest_path_edge(number_u, number_v)
+        if heaviest is None:
+            self.link(number_u, number_v, weight)
+        elif weight < self.tree[heaviest[0]][heaviest[1]]:
+            self.cut(heaviest[0], heaviest[1])
+            self.link(number_u, number_v, weight)
+
+    def insert_edge(self, vertex_u, vertex_v, weight):
+        """
+        Inserts the edge between the specified vertices with the
+        specified weight, and updates the minimum spanning tree.
+
+        @param vertex_u: The first end point.
+        @type: L{UnWeightedGraphVertex}
+        @param vertex_v: The second end point.
+        @type: L{UnWeightedGraphVertex}
+        @param weight: The weight of the edge.
+        @type: C{int}
+        @raises: KeyError if the edge is already present.
+        @type: C{KeyError}
+        """
+        key = self.get_key(vertex_u.vertex_number, vertex_v.vertex_number)
+        if key in self.weights:
+            raise KeyError
+        self.update_edge(vertex_u, vertex_v, weight)
+
+    def remove_edge(self, vertex_u, vertex_v):
+        """
+        Removes the edge between the specified vertices, and updates
+        the minimum spanning tree.
+
+        Time complexity: O(n + m) for a tree edge, otherwise O(1),
+        where n is the number of vertices and m is the number of edges.
+
+        @param vertex_u: The first end point.
+        @type: L{UnWeightedGraphVertex}
+        @param vertex_v: The second end point.
+        @type: L{UnWeightedGraphVertex}
+        @raises: KeyError if the edge is not present.
+        @type: C{KeyError}
+        """
+        number_u = vertex_u.vertex_number
+        number_v = vertex_v.vertex_number
+        del self.weights[self.get_key(number_u, number_v)]
+        if number_v in self.tree[number_u]:
+            self.cut(number_u, number_v)
+            self.reconnect(number_u)
+
+    def get_weight(self, vertex_u, vertex_v):
+        """
+        Returns the current weight of the edge between the specified
+        vertices.
+
+        @param vertex_u: The first end point.
+        @type: L{UnWeightedGraphVertex}
+        @param vertex_v: The second end point.
+        @type: L{UnWeightedGraphVertex}
+        @raises: KeyError if the edge is not present.
+        @type: C{KeyError}
+        @return: The weight of the edge.
+        @rtype: C{int}
+        """
+        return self.weights[self.get_key(vertex_u.vertex_number,
+                                         vertex_v.vertex_number)]
+
+    def get_total_weight(self):
+        """
+        Returns the total weight of the minimum spanning tree.
+
+        @return: The total weight of the minimum spanning tree.
+        @rtype: C{int}
+        """
+        return self.total_weight
+
+    def get_minimum_spanning_tree(self):
+        """
+        Returns the current minimum spanning tree, with each tree edge
+        directed from the lower to the higher vertex number.
+
+        Time complexity: O(n), where n is the number of vertices.
+
+        @return: The minimum spanning tree.
+        @rtype: L{MinimumSpanningTree}
+        """
+        mst = MinimumSpanningTree(self.graph)
+        for vertex_u in xrange(self.number_of_vertices):
+            for vertex_v, weight in sorted(self.tree[vertex_u].iteritems()):
+                if vertex_u < vertex_v:
+                    mst.add_edge(UnDirectedWeightedGraphEdge(
+                        self.graph, self.graph[vertex_u],
+                        self.graph[vertex_v], weight))
+        return mst
@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 by Brian Horn, trycatchhorn@gmail.com.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Provides a Gomory-Hu tree answering minimum cut queries between all
+pairs of vertices.
+"""
+
+__author__ = "Brian Horn"
+__copyright__ = "Copyright (c) 2015 Brian Horn"
+__credits__ = "Brian Horn"
+__license__ = "MIT"
+__version__ = "1.0.2"
+__maintainer__ = "Brian Horn"
+__email__ = "trycatchhorn@gmail.com"
+__status__ = "Prototype"
+
+from copy import copy
+from functools import partial
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from py_alg_dat.max_flow import FlowNetwork
+
+# The network shared by the workers of a process pool, see share_network.
+NETWORK = None
+
+
+class GomoryHuTree(object):
+
+    """
+    A Gomory-Hu tree of an undirected weighted graph, where the weight
+    of each edge is its capacity. The tree has the same vertices as
+    the graph, and for every pair of vertices u and v, the smallest
+    weight on the tree path between u and v is the value of a minimum
+    cut separating u and v in the graph. Removing that tree edge splits
+    the vertices into the two sides of such a cut.
+
+    The tree is built by Gusfield's algorithm, which needs n - 1
+    maximum flow computations on the graph itself instead of on
+    contracted graphs. Every vertex s > 0 starts with the parent 0. For
+    s = 1, 2, ..., n - 1, a minimum cut between s and its parent t is
+    found, the vertices on the side of s whose parent is t are moved
+    below s, and if the parent of t is on the side of s, s takes the
+    place of t in the tree.
+
+    The cut for s only depends on the current parent of s, so the cuts
+    for a batch of consecutive vertices are computed at the same time
+    in a worker pool, assuming their parents do not change. The cuts
+    are then applied in order, and a cut whose parent was changed by an
+    earlier cut in the batch is computed again.
+
+    The tree is stored as a parent -and a weight list indexed by vertex
+    number, together with the depth of every vertex, so a query walks
+    up the tree from both vertices to their nearest common ancestor.
+    """
+
+    def __init__(self, graph, pool=None, processes=None, threads=False,
+                 batch_size=8):
+        """
+        Constructs the Gomory-Hu tree of the specified graph. If a pool
+        -or a number of processes is specified, the maximum flows for
+        batches of batch_size vertices are computed by the workers of
+        the pool, see L{minimum_cuts}. If only the number of processes
+        is specified, a pool with that number of workers is created for
+        the call, either a process pool or, if the threads flag is True,
+        a thread pool. A created process pool receives the network once
+        per worker through its initializer, see L{share_network}, so
+        the tasks only hold the pairs of vertices, while the network is
+        bound to the tasks of a specified pool -or a thread pool.
+
+        Time complexity: O(n * F), where n is the number of vertices and
+        F is the time of a maximum flow computation by Dinic's algorithm.
+
+        @param graph: The graph of which the tree is constructed.
+        @type: L{UnDirectedWeightedGraph}
+        @param pool: The pool used to compute the maximum flows.
+        @type: L{multiprocessing.pool.Pool}
+        @param processes: The number of workers in a created pool.
+        @type: C{int}
+        @param threads: Flag indicating if a created pool uses threads.
+        @type: C{bool}
+        @param batch_size: The number of maximum flows computed at once by a pool.
+        @type: C{int}
+        @raises: Exception if the graph is directed, if an edge has a
+        negative weight, or if the batch size is not positive.
+        @type: C{ValueError}
+        """
+        if graph.is_directed() or batch_size < 1:
+            raise ValueError
+        self.graph = graph
+        number_of_vertices = graph.get_number_of_vertices()
+        self.parent = [0] * number_of_vertices
+        self.weight = [None] * number_of_vertices
+        if number_of_vertices > 0:
+            self.parent[0] = -1
+        network = FlowNetwork(graph)
+
+        workers = pool
+        function = partial(minimum_cuts, network=network)
+        if pool is None and processes is not None:
+            if threads:
+                workers = ThreadPool(processes)
+            else:
+                workers = Pool(processes, initializer=share_network,
+                               initargs=(network,))
+                function = minimum_cuts
+        if workers is None:
+            batch_size = 1
+        try:
+            first = 1
+            while first < number_of_vertices:
+                batch = range(first, min(first + batch_size,
+                                         number_of_vertices))
+                tasks = [[(source, self.parent[source])] for source in batch]
+                if workers is None:
+                    results = [minimum_cuts(task, network) for task in tasks]
+                else:
+                    results = workers.map(function, tasks)
+                for source, task, result in zip(batch, tasks, results):
+                    if task[0][1] != self.parent[source]:
+                        result = minimum_cuts(
+                            [(source, self.parent[source])], network)
+                    self.apply_cut(source, result[0])
+                first += batch_size
+        finally:
+            if pool is None and workers is not None:
+                workers.close()
+                workers.join()
+
+        # The root stays at vertex 0, since no step moves a vertex above it.
+        self.depth = [0] * number_of_vertices
+        for vertex in xrange(number_of_vertices):
+            path = []
+            current = vertex
+            while current > 0 and self.depth[current] == 0:
+                path.append(current)
+                current = self.parent[current]
+            depth = self.depth[current]
+            for other in reversed(path):
+                depth += 1
+                self.depth[other] = depth
+
+    def apply_cut(self, source, cut):
+        """
+        Updates the tree by Gusfield's step for the specified vertex,
+        given a minimum cut between the vertex and its current parent.
+
+        @param source: The vertex number of the vertex.
+        @type: C{int}
+        @param cut: The value of the cut -and the side flags of the cut.
+        @type: C{tuple}
+        """
+        value, side = cut
+        parent = self.parent
+        sink = parent[source]
+        self.weight[source] = value
+        for vertex in xrange(len(parent)):
+            if vertex != source and side[vertex] and parent[vertex] == sink:
+                parent[vertex] = source
+        if parent[sink] >= 0 and side[parent[sink]]:
+            parent[source] = parent[sink]
+            parent[sink] = source
+            self.weight[source] = self.weight[sink]
+            self.weight[sink] = value
+
+    def get_parent(self, vertex):
+        """
+        Returns the parent of the specified vertex in this tree, or
+        None for the root.
+
+        @param vertex: The vertex which parent is returned.
+        @type: L{UnWeightedGraphVertex}
+        @return: The parent of the vertex.
+        @rtype: L{UnWeightedGraphVertex}
+        """
+        parent = self.parent[vertex.vertex_number]
+        if parent < 0:
+            return None
+        return self.graph.vertices[parent]
+
+    def get_weight(self, vertex):
+        """
+        Returns the weight of the tree edge from the specified vertex
+        to its parent, or None for the root.
+
+        @param vertex: The vertex which edge weight is returned.
+        @type: L{UnWeightedGraphVertex}
+        @return: The weight of the edge to the parent.
+        @rtype: C{int}
+        """
+        return self.weight[vertex.vertex_number]
+
+    def get_edges(self):
+        """
+        Returns the edges of this tree as tuples holding a vertex, its
+        parent -and the weight of the edge between them.
+
+        @return: The edges of the tree.
+        @rtype: C{list}
+        """
+        vertices = self.graph.vertices
+        return [(vertices[vertex], vertices[parent], self.weight[vertex])
+                for vertex, parent in enumerate(self.parent) if parent >= 0]
+
+    def lightest_path_edge(self, vertex_u, vertex_v):
+        """
+        Returns the vertex number of the lower endpoint of the tree
+        edge with the smallest weight on the path between the specified
+        vertices, or -1 if the vertices are equal.
+
+        Time complexity: O(h), where h is the height of the tree.
+
+        @param vertex_u: The vertex number of the first vertex.
+        @type: C{int}
+        @param vertex_v: The vertex number of the second vertex.
+        @type: C{int}
+        @return: The lower endpoint of the lightest edge.
+        @rtype: C{int}
+        """
+        lightest = -1
+        while vertex_u != vertex_v:
+            if self.depth[vertex_u] < self.depth[vertex_v]:
+                vertex_u, vertex_v = vertex_v, vertex_u
+            if lightest < 0 or self.weight[vertex_u] < self.weight[lightest]:
+                lightest = vertex_u
+            vertex_u = self.parent[vertex_u]
+        return lightest
+
+    def minimum_cut_value(self, vertex_u, vertex_v):
+        """
+        Returns the value of a minimum cut separating the specified
+        vertices in the graph, which is the smallest weight on the tree
+        path between them.
+
+        Time complexity: O(h), where h is the height of the tree.
+
+        @param vertex_u: The first vertex.
+        @type: L{UnWeightedGraphVertex}
+        @param vertex_v: The second vertex.
+        @type: L{UnWeightedGraphVertex}
+        @return: The value of the minimum cut.
+        @rtype: C{int}
+        @raises: Exception if the vertices are equal.
+        @type: C{ValueError}
+        """
+        lightest = self.lightest_path_edge(vertex_u.vertex_number,
+                                           vertex_v.vertex_number)
+        if lightest < 0:
+            raise ValueError
+        return self.weight[lightest]
+
+    def minimum_cut(self, vertex_u, vertex_v):
+        """
+        Returns the side of a minimum cut separating the specified
+        vertices in the graph which holds vertex_u, found by removing
+        the lightest tree edge on the path between them.
+
+        Time complexity: O(n), where n is the number of vertices.
+
+        @param vertex_u: The first vertex.
+        @type: L{UnWeightedGraphVertex}
+        @param vertex_v: The second vertex.
+        @type: L{UnWeightedGraphVertex}
+        @return: The vertices on the side of vertex_u.
+        @rtype: C{set}
+        @raises: Exception if the vertices are equal.
+        @type: C{ValueError}
+        """
+        lightest = self.lightest_path_edge(vertex_u.vertex_number,
+                                           vertex_v.vertex_number)
+        if lightest < 0:
+            raise ValueError
+        # The subtree below the lightest edge, found by walking up
+        # from every vertex.
+        number_of_vertices = len(self.parent)
+        below = [None] * number_of_vertices
+        below[lightest] = True
+        for vertex in xrange(number_of_vertices):
+            path = []
+            current = vertex
+            while below[current] is None:
+                path.append(current)
+                parent = self.parent[current]
+                if parent < 0:
+                    below[current] = False
+                    break
+                current = parent
+            for other in path:
+                below[other] = below[current]
+        inside = below[vertex_u.vertex_number]
+        vertices = self.graph.vertices
+        return set(vertices[vertex] for vertex in xrange(number_of_vertices)
+                   if below[vertex] == inside)
+
+
+def share_network(network):
+    """
+    Stores the specified flow network in the module, so the workers of
+    a process pool receive it once when they start instead of with
+    every task. Used as the initializer of the pools created by
+    L{GomoryHuTree}.
+
+    @param network: The network used by L{minimum_cuts}.
+    @type: L{FlowNetwork}
+    """
+    global NETWORK
+    NETWORK = network
+
+
+def minimum_cuts(pairs, network=None):
+    """
+    Computes minimum cuts in a flow network, as used by L{GomoryHuTree},
+    between each of the specified pairs of source -and sink vertex
+    numbers. If no network is specified, the network stored by
+    L{share_network} is used. A shallow copy of the network is solved,
+    so the tasks can share the network in a thread pool. The function
+    is defined at the top level of the module, so it can be sent to the
+    workers of a process pool.
+
+    @param pairs: The pairs of vertex numbers.
+    @type: C{list}
+    @param network: The network in which the cuts are found.
+    @type: L{FlowNetwork}
+    @return: The value of each cut -and the flags of the vertices on the side of the source.
+    @rtype: C{list}
+    """
+    if network is None:
+        network = NETWORK
+    network = copy(network)
+    cuts = []
+    for source, sink in pairs:
+        value = network.dinic(source, sink)
+        cuts.append((value, network.residual_reachable(source)))
+    return cuts
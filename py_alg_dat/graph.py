@@ -41,6 +41,7 @@ __status__ = "Prototype"
 import copy
 from abc import abstractmethod
 from py_alg_dat.array_list import ArrayList
+from py_alg_dat.compact_graph import CompactGraph
 from py_alg_dat.container import Container
 from py_alg_dat.doubly_linked_list import DoublyLinkedList
 from py_alg_dat.dfs_edge_classification import DFSEdgeClassification
@@ -603,20 +604,10 @@ class Graph(Container):
         @type: C{int}
         """
         assert isinstance(visitor, Visitor)
-        number_of_vertices = self.get_number_of_vertices()
-        enqueued = ArrayList(number_of_vertices)
-        for vertex in xrange(number_of_vertices):
-            enqueued[vertex] = False
-        queue = Queue()
-        queue.enqueue(self[start])
-        enqueued[start] = True
-        while not queue.is_empty() and not visitor.is_done():
-            vertex = queue.dequeue()
+        for vertex, _, _ in self.bfs(start):
+            if visitor.is_done():
+                break
             visitor.visit(vertex)
-            for successor in vertex.get_successors():
-                if not enqueued[successor.get_vertex_number()]:
-                    queue.enqueue(successor)
-                    enqueued[successor.get_vertex_number()] = True
 
     def depth_first_traversal(self, visitor, start):
         """
@@ -647,6 +638,83 @@ class Graph(Container):
                     visited[successor.get_vertex_number()] = True
                     stack.push(successor)
 
+    def bfs(self, start):
+        """
+        Returns a generator performing a lazy Breadth-First-Search
+        of this graph starting from the given vertex. For each
+        vertex reached by the search a tuple (vertex, depth, parent)
+        is generated, where depth is the number of edges on the path
+        from the start vertex in the breadth-first tree and parent is
+        the predecessor of the vertex in the tree. The parent of the
+        start vertex is None.
+
+        The successors of a vertex are only explored when the next
+        vertex is requested from the generator, so the search can be
+        stopped early without traversing the remaining graph.
+
+        @param start: The index of the vertex from where the search begins.
+        @type: C{int}
+        @return: Generator enumerating the vertices in breadth-first order.
+        @rtype: C{object}
+        """
+        enqueued = [False] * self.get_number_of_vertices()
+        enqueued[start] = True
+        level = [(self[start], None)]
+        depth = 0
+        while level:
+            next_level = []
+            for vertex, parent in level:
+                yield vertex, depth, parent
+                ptr = self.adjacency_list[vertex.vertex_number].head
+                while ptr is not None:
+                    if ptr.data is not None:
+                        index = ptr.data.tail_vertex.vertex_number
+                        if not enqueued[index]:
+                            enqueued[index] = True
+                            next_level.append((self.vertices[index], vertex))
+                    ptr = ptr.next
+            level = next_level
+            depth += 1
+
+    def dfs(self, start):
+        """
+        Returns a generator performing a lazy Depth-First-Search
+        of this graph starting from the given vertex. For each
+        vertex reached by the search a tuple (vertex, depth, parent)
+        is generated in preorder, where depth is the depth of the
+        vertex in the depth-first tree and parent is the predecessor
+        of the vertex in the tree. The parent of the start vertex
+        is None.
+
+        The search keeps an explicit stack of positions in the
+        adjacency lists, so it does not recurse and only advances
+        when the next vertex is requested from the generator.
+
+        @param start: The index of the vertex from where the search begins.
+        @type: C{int}
+        @return: Generator enumerating the vertices in depth-first order.
+        @rtype: C{object}
+        """
+        visited = [False] * self.get_number_of_vertices()
+        visited[start] = True
+        root = self[start]
+        yield root, 0, None
+        stack = [(root, 0, self.adjacency_list[start].head)]
+        while stack:
+            vertex, depth, ptr = stack[-1]
+            while ptr is not None and \
+                    (ptr.data is None or visited[ptr.data.tail_vertex.vertex_number]):
+                ptr = ptr.next
+            if ptr is None:
+                stack.pop()
+                continue
+            stack[-1] = (vertex, depth, ptr.next)
+            index = ptr.data.tail_vertex.vertex_number
+            visited[index] = True
+            successor = self.vertices[index]
+            yield successor, depth + 1, vertex
+            stack.append((successor, depth + 1, self.adjacency_list[index].head))
+
     def classify_edges(self):
         """
         Performs a classification of the edges contained
@@ -740,14 +808,20 @@ class DirectedGraph(Graph):
         @return: True, if the directed graph is strongly connected.
         @rtype: C{bool}
         """
-        for vertex in self.get_vertices():
-            visitor = VertexVisitor()
-            visited = []
-            self.depth_first_traversal(visitor, vertex.get_vertex_number())
-            visited = visitor.get_visited()
-            if len(visited) != self.get_number_of_vertices():
-                return False
-        return True
+        number_of_vertices = self.get_number_of_vertices()
+        if number_of_vertices == 0:
+            return True
+        # The graph is strongly connected if every vertex can be
+        # reached from vertex 0, and vertex 0 can be reached from
+        # every vertex, i.e. every vertex is reachable from vertex 0
+        # when the direction of the edges is reversed.
+        reached = 0
+        for _ in self.dfs(0):
+            reached += 1
+        if reached != number_of_vertices:
+            return False
+        distances = CompactGraph(self, True).breadth_first_distances(0)
+        return -1 not in distances
 
     def topological_order_traversal(self, visitor):
         """
@@ -782,6 +856,47 @@ class DirectedGraph(Graph):
                 if in_degree[successor.get_vertex_number()] == 0:
                     queue.enqueue(successor)
 
+    def levels(self):
+        """
+        Returns a generator enumerating the vertices in this directed
+        graph in topological order, in batches called levels. The first
+        level holds the vertices with no incoming edges, and each of the
+        following levels holds the vertices whose in-degree drops to
+        zero when the edges leaving the previous level are removed.
+        The vertices in a level do not depend on each other, so they
+        can be processed together.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @raises: ValueError when the levels are exhausted if the graph has a cycle.
+        @type: C{ValueError}
+        @return: Generator enumerating the levels as lists of vertices.
+        @rtype: C{object}
+        """
+        compact_graph = CompactGraph(self)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        number_of_vertices = compact_graph.get_number_of_vertices()
+        in_degree = [0] * number_of_vertices
+        for successor in targets:
+            in_degree[successor] += 1
+        level = [i for i in xrange(number_of_vertices) if in_degree[i] == 0]
+        number_of_visited = 0
+        while level:
+            yield [self.vertices[i] for i in level]
+            number_of_visited += len(level)
+            next_level = []
+            for vertex in level:
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    successor = targets[i]
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        next_level.append(successor)
+            level = next_level
+        if number_of_visited != number_of_vertices:
+            raise ValueError
+
     def is_cyclic(self):
         """
         Returns if this directed graph contains one or more cycles.
@@ -1055,11 +1170,22 @@ class UnDirectedGraph(Graph):
         @return: True if the graph is connected, false otherwise.
         @rtype: C{bool}
         """
-        visitor = VertexVisitor()
-        self.depth_first_traversal(visitor, 0)
-        visited = []
-        visited = visitor.get_visited()
-        return len(visited) == self.get_number_of_vertices()
+        reached = 0
+        for _ in self.dfs(0):
+            reached += 1
+        return reached == self.get_number_of_vertices()
+
+    def classify_biconnectivity(self):
+        """
+        Performs an iterative depth-first classification of the
+        edges in this undirected graph, which additionally finds
+        the articulation points, the bridges and the biconnected
+        components of the graph in a single pass.
+
+        @return: The result of the classification.
+        @rtype: L{DFSResult}
+        """
+        return DFSEdgeClassification(self).dfs_iterative_undirected()
 
     def is_cyclic(self):
         """
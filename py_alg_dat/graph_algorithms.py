@@ -35,13 +35,25 @@ __maintainer__ = "Brian Horn"
 __email__ = "trycatchhorn@gmail.com"
 __status__ = "Prototype"
 
+from functools import partial
+from math import log
+from math import sqrt
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from random import Random
+from time import time
 from py_alg_dat.array_list import ArrayList
 from py_alg_dat.association import Association
+from py_alg_dat.compact_graph import CompactGraph
 from py_alg_dat.entry import Entry
 from py_alg_dat.graph_edge import UnDirectedWeightedGraphEdge
 from py_alg_dat.graph_path import GraphPath
+from py_alg_dat.graph_vertex import UnWeightedGraphVertex
+from py_alg_dat.max_flow import FlowNetwork
+from py_alg_dat.max_flow import MinCostFlowNetwork
 from py_alg_dat.min_heap import MinHeap
 from py_alg_dat.minimum_spanning_tree import MinimumSpanningTree
+from py_alg_dat.partition import ArrayPartition
 from py_alg_dat.partition import Partition
 
 
@@ -124,6 +136,140 @@ class GraphAlgorithms(object):
                 mst.add_edge(edge)
         return mst
 
+    @staticmethod
+    def adjacency_matrix(graph, compact_graph=None):
+        """
+        Returns the adjacency matrix of the specified weighted graph as
+        a list of rows indexed by vertex number, where entry (u, v) is
+        the weight of the edge from u to v, or None if there is no such
+        edge. If there are several edges from u to v, the smallest
+        weight is used. The matrix is filled from the arrays of a
+        L{CompactGraph} of the graph, which is built unless specified.
+
+        Time complexity: O(n^2 + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph from where the matrix is built.
+        @type: L{Graph}
+        @param compact_graph: The compact view of the graph.
+        @type: L{CompactGraph}
+        @return: The adjacency matrix of the graph.
+        @rtype: C{list}
+        """
+        if compact_graph is None:
+            compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        weights = compact_graph.get_weights()
+        number_of_vertices = compact_graph.get_number_of_vertices()
+        matrix = [[None] * number_of_vertices
+                  for _ in xrange(number_of_vertices)]
+        for vertex in xrange(number_of_vertices):
+            row = matrix[vertex]
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                column = targets[i]
+                weight = weights[i]
+                if row[column] is None or weight < row[column]:
+                    row[column] = weight
+        return matrix
+
+    @staticmethod
+    def prims_algorithm_dense(graph, start, matrix=None):
+        """
+        Implements Prim's algorithm used to find the minimum spanning
+        tree for the specified connected weighted undirected graph,
+        using an adjacency matrix and an array holding the key of every
+        vertex, being the weight of the lightest edge connecting it to
+        the tree, instead of a min-heap. In each of the n steps, the
+        vertex with the smallest key is found by a scan of the key
+        array, and the keys are updated from its row in the matrix.
+        This is faster than the heap based implementation on dense
+        graphs, where m is close to n^2.
+
+        If no adjacency matrix is specified, it is built from the graph.
+        The minimum spanning tree has the same layout as the one found
+        by L{prims_algorithm}.
+
+        Time complexity: O(n^2), where n is the number of vertices.
+
+        @param graph: The graph from where the minimum spanning tree is computed.
+        @type: L{UnDirectedWeightedGraph}
+        @param start: The vertex from where Prim's algorithm begins.
+        @type: L{UnWeightedGraphVertex}
+        @param matrix: The adjacency matrix of the graph.
+        @type: C{list}
+        @return: The minimum spanning tree for the graph.
+        @rtype: L{MinimumSpanningTree}
+        """
+        if matrix is None:
+            matrix = GraphAlgorithms.adjacency_matrix(graph)
+        number_of_vertices = graph.get_number_of_vertices()
+        infinity = float("inf")
+        key = [infinity] * number_of_vertices
+        distance = [None] * number_of_vertices
+        parent = [-1] * number_of_vertices
+        in_tree = [False] * number_of_vertices
+        key[start.vertex_number] = 0
+        vertices = xrange(number_of_vertices)
+        for _ in vertices:
+            vertex = min(vertices, key=key.__getitem__)
+            if key[vertex] == infinity:
+                break
+            distance[vertex] = key[vertex]
+            key[vertex] = infinity
+            in_tree[vertex] = True
+            row = matrix[vertex]
+            for other in vertices:
+                weight = row[other]
+                if weight is not None and weight < key[other] and \
+                        not in_tree[other]:
+                    key[other] = weight
+                    parent[other] = vertex
+
+        mst = MinimumSpanningTree(graph)
+        for i in vertices:
+            if parent[i] >= 0:
+                edge = UnDirectedWeightedGraphEdge(
+                    graph, graph[i], graph[parent[i]], distance[i])
+                mst.add_edge(edge)
+        return mst
+
+    @staticmethod
+    def prims_algorithm_auto(graph, start):
+        """
+        Finds the minimum spanning tree for the specified connected
+        weighted undirected graph by Prim's algorithm, choosing between
+        the heap based and the dense implementation from the density of
+        the graph. The dense implementation is used when the m log(n)
+        cost of the heap based one exceeds the n^2 cost of the dense.
+
+        The number of edges m is found from a L{CompactGraph} of the
+        graph, which holds every undirected edge in both directions, so
+        m is half its number of arcs. The same view is used to build the
+        adjacency matrix for the dense implementation.
+
+        Time complexity: O(n + m) to choose, where n is the number of
+        vertices and m is the number of edges, followed by the time of
+        the chosen implementation.
+
+        @param graph: The graph from where the minimum spanning tree is computed.
+        @type: L{UnDirectedWeightedGraph}
+        @param start: The vertex from where Prim's algorithm begins.
+        @type: L{UnWeightedGraphVertex}
+        @return: The minimum spanning tree for the graph.
+        @rtype: L{MinimumSpanningTree}
+        """
+        compact_graph = CompactGraph(graph)
+        number_of_vertices = compact_graph.get_number_of_vertices()
+        number_of_edges = compact_graph.get_number_of_arcs()
+        if not graph.is_directed():
+            number_of_edges //= 2
+        if number_of_edges * max(1, number_of_vertices.bit_length()) > \
+                number_of_vertices * number_of_vertices:
+            matrix = GraphAlgorithms.adjacency_matrix(graph, compact_graph)
+            return GraphAlgorithms.prims_algorithm_dense(graph, start, matrix)
+        return GraphAlgorithms.prims_algorithm(graph, start)
+
     @staticmethod
     def kruskals_algorithm(graph):
         """
@@ -173,6 +319,233 @@ class GraphAlgorithms(object):
                 mst.add_edge(edge_v_u)
         return mst
 
+    @staticmethod
+    def undirected_edge_arrays(graph):
+        """
+        Returns the edges of the specified undirected graph together
+        with flat arrays holding the end points and the weight of each
+        edge. Each edge is stored in both directions in the graph, but
+        is only included once, directed from the lower to the higher
+        vertex number. Self-loops are left out. The edges are taken
+        from a L{CompactGraph}, which walks the adjacency lists once.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph from where the edges are taken.
+        @type: L{UnDirectedWeightedGraph}
+        @return: The edges, their head vertex numbers, tail vertex numbers and weights.
+        @rtype: C{tuple}
+        """
+        edges = []
+        for edge in CompactGraph(graph).get_edges():
+            if edge.head_vertex.vertex_number < edge.tail_vertex.vertex_number:
+                edges.append(edge)
+        vertex_u = [edge.head_vertex.vertex_number for edge in edges]
+        vertex_v = [edge.tail_vertex.vertex_number for edge in edges]
+        weights = [edge.get_weight() for edge in edges]
+        return edges, vertex_u, vertex_v, weights
+
+    @staticmethod
+    def sort_by_weight(indices, weights):
+        """
+        Returns the specified edge indices ordered by the weight of the
+        edges, where edges with the same weight keep their order. If
+        all weights are integers within a range not larger than the
+        number of edges, a bucket sort is used.
+
+        Time complexity: O(m) for integer weights in a small range,
+        otherwise O(m log(m)), where m is the number of edges.
+
+        @param indices: The indices of the edges to be sorted.
+        @type: C{list}
+        @param weights: The weight of each edge.
+        @type: C{list}
+        @return: The sorted edge indices.
+        @rtype: C{list}
+        """
+        if not indices:
+            return []
+        integral = True
+        for i in indices:
+            if not isinstance(weights[i], (int, long)):
+                integral = False
+                break
+        if integral:
+            lowest = min(weights[i] for i in indices)
+            highest = max(weights[i] for i in indices)
+            if highest - lowest <= len(indices):
+                buckets = [[] for _ in xrange(highest - lowest + 1)]
+                for i in indices:
+                    buckets[weights[i] - lowest].append(i)
+                return [i for bucket in buckets for i in bucket]
+        return sorted(indices, key=weights.__getitem__)
+
+    @staticmethod
+    def kruskals_algorithm_sorted(graph):
+        """
+        Implements Kruskal's algorithm used to find the minimum spanning
+        tree for the specified weighted undirected graph, where the
+        edges are sorted once by weight instead of being extracted from
+        a min-heap of associations. The edges are kept in flat arrays
+        and the components in an array based union-find, see
+        L{undirected_edge_arrays}. The algorithm stops as soon as n - 1
+        edges have been accepted.
+
+        Time complexity: O(n + m log(m)), where n is the number of
+        vertices and m is the number of edges, or O(n + m) for integer
+        weights in a range not larger than m.
+
+        @param graph: The graph from where the minimum spanning tree is computed.
+        @type: L{UnDirectedWeightedGraph}
+        @return: The minimum spanning tree for the graph.
+        @rtype: L{MinimumSpanningTree}
+        """
+        edges, vertex_u, vertex_v, weights = \
+            GraphAlgorithms.undirected_edge_arrays(graph)
+        number_of_vertices = graph.get_number_of_vertices()
+        partition = ArrayPartition(number_of_vertices)
+        mst = MinimumSpanningTree(graph)
+        accepted = 0
+        for i in GraphAlgorithms.sort_by_weight(range(len(edges)), weights):
+            if accepted >= number_of_vertices - 1:
+                break
+            if partition.union(vertex_u[i], vertex_v[i]):
+                accepted += 1
+                edge = edges[i]
+                mst.add_edge(UnDirectedWeightedGraphEdge(
+                    graph, edge.head_vertex, edge.tail_vertex, weights[i]))
+        return mst
+
+    @staticmethod
+    def filter_kruskals_algorithm(graph, threshold=64):
+        """
+        Implements the filter-Kruskal algorithm used to find the minimum
+        spanning tree for the specified weighted undirected graph.
+
+        Instead of sorting all edges, the edges are partitioned around
+        a pivot weight, chosen as the median of three, into the lighter
+        edges, the edges with the pivot weight and the heavier edges,
+        which are handled in that order. Before a group of edges is
+        handled, the edges with both end points in the same component
+        are filtered out, so many of the heavy edges are discarded
+        without ever being sorted. Groups with no more edges than the
+        threshold are sorted and handled as in Kruskal's algorithm.
+        The groups are kept on an explicit stack, and the algorithm
+        stops as soon as n - 1 edges have been accepted. The edges are
+        kept in flat arrays, see L{undirected_edge_arrays}.
+
+        Time complexity: O(n + m + n log(n) log(m / n)) expected for
+        random weights, where m is the number of edges and n is the
+        number of vertices.
+
+        @param graph: The graph from where the minimum spanning tree is computed.
+        @type: L{UnDirectedWeightedGraph}
+        @param threshold: The largest group of edges which is sorted directly.
+        @type: C{int}
+        @return: The minimum spanning tree for the graph.
+        @rtype: L{MinimumSpanningTree}
+        """
+        edges, vertex_u, vertex_v, weights = \
+            GraphAlgorithms.undirected_edge_arrays(graph)
+        number_of_vertices = graph.get_number_of_vertices()
+        partition = ArrayPartition(number_of_vertices)
+        mst = MinimumSpanningTree(graph)
+        accepted = 0
+        # Each group is a list of edge indices in increasing order and
+        # a flag telling if all its edges have the same weight.
+        stack = [(range(len(edges)), False)]
+        while stack and accepted < number_of_vertices - 1:
+            group, uniform = stack.pop()
+            group = [i for i in group
+                     if partition.find(vertex_u[i]) != partition.find(vertex_v[i])]
+            if not uniform and len(group) > threshold:
+                pivot = sorted([weights[group[0]],
+                                weights[group[len(group) // 2]],
+                                weights[group[-1]]])[1]
+                lighter = []
+                equal = []
+                heavier = []
+                for i in group:
+                    if weights[i] < pivot:
+                        lighter.append(i)
+                    elif weights[i] > pivot:
+                        heavier.append(i)
+                    else:
+                        equal.append(i)
+                stack.append((heavier, False))
+                stack.append((equal, True))
+                stack.append((lighter, False))
+                continue
+            if not uniform:
+                group = GraphAlgorithms.sort_by_weight(group, weights)
+            for i in group:
+                if accepted >= number_of_vertices - 1:
+                    break
+                if partition.union(vertex_u[i], vertex_v[i]):
+                    accepted += 1
+                    edge = edges[i]
+                    mst.add_edge(UnDirectedWeightedGraphEdge(
+                        graph, edge.head_vertex, edge.tail_vertex, weights[i]))
+        return mst
+
+    @staticmethod
+    def boruvka(graph):
+        """
+        Implements Boruvka's algorithm used to find the minimum spanning
+        tree for the specified weighted undirected graph. The edges are
+        kept in flat arrays of end points and weights, and the
+        components in an array based union-find.
+
+        The algorithm works in rounds. In each round, a single pass over
+        the edge arrays finds the cheapest edge leaving every component,
+        where ties are broken by edge number, so the selected edges
+        never form a cycle. The selected edges are added to the tree,
+        their components are merged, and edges inside a component are
+        dropped from the arrays. As each round at least halves the
+        number of components, there are at most O(log(n)) rounds. If
+        the graph is not connected, a minimum spanning forest is found.
+
+        Time complexity: O(m log(n)), where m is the number of edges and
+        n is the number of vertices.
+
+        @param graph: The graph from where the minimum spanning tree is computed.
+        @type: L{UnDirectedWeightedGraph}
+        @return: The minimum spanning tree for the graph.
+        @rtype: L{MinimumSpanningTree}
+        """
+        edges, vertex_u, vertex_v, weights = \
+            GraphAlgorithms.undirected_edge_arrays(graph)
+        live = range(len(edges))
+
+        number_of_vertices = graph.get_number_of_vertices()
+        partition = ArrayPartition(number_of_vertices)
+        mst = MinimumSpanningTree(graph)
+        while live:
+            component = [partition.find(i) for i in xrange(number_of_vertices)]
+            cheapest = [-1] * number_of_vertices
+            remaining = []
+            for i in live:
+                component_u = component[vertex_u[i]]
+                component_v = component[vertex_v[i]]
+                if component_u == component_v:
+                    continue
+                remaining.append(i)
+                weight = weights[i]
+                for root in (component_u, component_v):
+                    best = cheapest[root]
+                    if best < 0 or weight < weights[best] or \
+                            (weight == weights[best] and i < best):
+                        cheapest[root] = i
+            live = remaining
+            for root in xrange(number_of_vertices):
+                i = cheapest[root]
+                if i >= 0 and partition.union(vertex_u[i], vertex_v[i]):
+                    edge = edges[i]
+                    mst.add_edge(UnDirectedWeightedGraphEdge(
+                        graph, edge.head_vertex, edge.tail_vertex, weights[i]))
+        return mst
+
     @staticmethod
     def dijkstras_algorithm(graph, source):
         """
@@ -272,6 +645,477 @@ class GraphAlgorithms(object):
                 end = table[end.predecessor.get_vertex_number()]
         return path
 
+    @staticmethod
+    def dag_shortest_paths(graph, source):
+        """
+        Finds the shortest paths from the specified source vertex to
+        all other vertices in the directed acyclic graph, by relaxing
+        the edges leaving each vertex in topological order. Negative
+        edge weights are allowed. The edges of an unweighted graph have
+        the weight 1.
+
+        The result is returned as two lists indexed by vertex number:
+        the distance from the source, or None for unreachable vertices,
+        and the number of the predecessor on the shortest path, or -1
+        for the source and unreachable vertices.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph from where the shortest paths are computed.
+        @type: L{DirectedWeightedGraph}
+        @param source: The vertex from where the paths begin.
+        @type: L{UnWeightedGraphVertex}
+        @raises: ValueError if the graph has a cycle.
+        @type: C{ValueError}
+        @return: The distance -and predecessor tables.
+        @rtype: C{tuple}
+        """
+        return GraphAlgorithms.dag_paths(graph, source, False)
+
+    @staticmethod
+    def dag_longest_path(graph, source=None):
+        """
+        Finds the longest paths in the directed acyclic graph, by
+        relaxing the edges leaving each vertex in topological order. If
+        a source vertex is specified, the paths begin at the source.
+        Otherwise, the paths may begin at any vertex, and the largest
+        distance is the length of a critical path, which ends at the
+        vertex with the largest distance and is found by following the
+        predecessors. The edges of an unweighted graph have the weight 1.
+
+        The result is returned as two lists indexed by vertex number:
+        the length of the longest path to the vertex, or None for
+        vertices unreachable from the source, and the number of the
+        predecessor on the path, or -1 where the path begins.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph from where the longest paths are computed.
+        @type: L{DirectedWeightedGraph}
+        @param source: The vertex from where the paths begin.
+        @type: L{UnWeightedGraphVertex}
+        @raises: ValueError if the graph has a cycle.
+        @type: C{ValueError}
+        @return: The distance -and predecessor tables.
+        @rtype: C{tuple}
+        """
+        return GraphAlgorithms.dag_paths(graph, source, True)
+
+    @staticmethod
+    def dag_paths(graph, source, longest):
+        """
+        Finds the shortest or longest paths in the directed acyclic
+        graph by relaxing the edges in topological order. If no source
+        vertex is specified, every vertex begins a path of length 0.
+
+        @param graph: The graph from where the paths are computed.
+        @type: L{DirectedWeightedGraph}
+        @param source: The vertex from where the paths begin, or None.
+        @type: L{UnWeightedGraphVertex}
+        @param longest: Flag indicating if the longest paths are found.
+        @type: C{bool}
+        @raises: ValueError if the graph has a cycle.
+        @type: C{ValueError}
+        @return: The distance -and predecessor tables.
+        @rtype: C{tuple}
+        """
+        compact_graph = CompactGraph(graph)
+        order = compact_graph.topological_order()
+        if order is None:
+            raise ValueError
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        weights = compact_graph.get_weights()
+        number_of_vertices = compact_graph.get_number_of_vertices()
+        predecessor = [-1] * number_of_vertices
+        if source is None:
+            distance = [0] * number_of_vertices
+        else:
+            distance = [None] * number_of_vertices
+            distance[source.vertex_number] = 0
+        for vertex in order:
+            if distance[vertex] is None:
+                continue
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                successor = targets[i]
+                path_distance = distance[vertex] + weights[i]
+                if distance[successor] is None:
+                    better = True
+                elif longest:
+                    better = path_distance > distance[successor]
+                else:
+                    better = path_distance < distance[successor]
+                if better:
+                    distance[successor] = path_distance
+                    predecessor[successor] = vertex
+        return distance, predecessor
+
+    @staticmethod
+    def topological_schedule(graph, function, pool=None, processes=None,
+                             threads=True):
+        """
+        Applies the specified function to every vertex in the directed
+        acyclic graph, such that the function is applied to a vertex
+        only after it has returned for all vertices with an edge to the
+        vertex. The levels found by L{DirectedGraph.levels} are handed
+        to a worker pool one at a time, so the vertices within a level
+        are processed in parallel.
+
+        The function is called with the vertex number of each vertex,
+        not the vertex itself, since a vertex refers to its graph and
+        would send the whole graph to a process pool with every task.
+        The function resolves the number to the data it needs, for
+        instance graph[number] in a thread pool.
+
+        If no pool is specified, a pool with the specified number of
+        workers is created for the call, either a thread pool or, if
+        the threads flag is False, a process pool. With a process pool,
+        the function must be defined at the top level of a module, and
+        the results must be picklable.
+
+        @param graph: The graph whose vertices are processed.
+        @type: L{DirectedGraph}
+        @param function: The function applied to the number of each vertex.
+        @type: C{function}
+        @param pool: The pool used to run the function.
+        @type: L{multiprocessing.pool.Pool}
+        @param processes: The number of workers in a created pool.
+        @type: C{int}
+        @param threads: Flag indicating if a created pool uses threads.
+        @type: C{bool}
+        @raises: ValueError if the graph has a cycle.
+        @type: C{ValueError}
+        @return: The result of the function for each vertex indexed by vertex number.
+        @rtype: C{list}
+        """
+        results = [None] * graph.get_number_of_vertices()
+        if pool is None:
+            if threads:
+                workers = ThreadPool(processes)
+            else:
+                workers = Pool(processes)
+        else:
+            workers = pool
+        try:
+            for level in graph.levels():
+                numbers = [vertex.vertex_number for vertex in level]
+                for number, result in zip(numbers,
+                                          workers.map(function, numbers)):
+                    results[number] = result
+        finally:
+            if pool is None:
+                workers.close()
+                workers.join()
+        return results
+
+    @staticmethod
+    def masked_shortest_path(compact_graph, source, destination,
+                             removed_vertices=None, removed_arcs=None):
+        """
+        Finds a shortest path from the specified source vertex to the
+        specified destination vertex in the compact view of a weighted
+        graph by Dijkstra's algorithm, ignoring the masked vertices and
+        arcs. The search stops as soon as the destination is reached.
+
+        Time complexity: O(m log(n)), where m is the number of edges and
+        n is the number of vertices.
+
+        @param compact_graph: The compact view of the graph.
+        @type: L{CompactGraph}
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @param destination: The index of the destination vertex.
+        @type: C{int}
+        @param removed_vertices: Flags indexed by vertex number marking vertices to ignore.
+        @type: C{list}
+        @param removed_arcs: The indices of the arcs to ignore.
+        @type: C{set}
+        @return: The length of the path and the indices of its arcs, or None if there is no path.
+        @rtype: C{tuple}
+        """
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        weights = compact_graph.get_weights()
+        number_of_vertices = compact_graph.get_number_of_vertices()
+        if removed_vertices is None:
+            removed_vertices = [False] * number_of_vertices
+        if removed_arcs is None:
+            removed_arcs = set()
+        distance = [None] * number_of_vertices
+        parent = [-1] * number_of_vertices
+        parent_arc = [-1] * number_of_vertices
+        settled = [False] * number_of_vertices
+        distance[source] = 0
+        queue = MinHeap()
+        queue.insert(Association(0, source))
+        while not queue.is_empty():
+            vertex = queue.heap_extract_min().get_value()
+            if settled[vertex]:
+                continue
+            settled[vertex] = True
+            if vertex == destination:
+                arcs = []
+                while vertex != source:
+                    arcs.append(parent_arc[vertex])
+                    vertex = parent[vertex]
+                arcs.reverse()
+                return distance[destination], arcs
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                successor = targets[i]
+                if removed_vertices[successor] or i in removed_arcs:
+                    continue
+                path_distance = distance[vertex] + weights[i]
+                if distance[successor] is None or \
+                        path_distance < distance[successor]:
+                    distance[successor] = path_distance
+                    parent[successor] = vertex
+                    parent_arc[successor] = i
+                    queue.insert(Association(path_distance, successor))
+        return None
+
+    @staticmethod
+    def k_shortest_paths(graph, source, destination, k):
+        """
+        Implements Yen's algorithm for finding the k shortest loopless
+        paths from the specified source vertex to the specified
+        destination vertex in the weighted graph, where the weights
+        must be nonnegative.
+
+        The first path is a shortest path. Each following path is found
+        from the previous one, by trying every vertex on it as a spur
+        vertex. The root path leading up to the spur vertex is kept,
+        and a shortest spur path from the spur vertex to the destination
+        is searched, where the vertices of the root path are masked, and
+        so are the arcs leaving the spur vertex on the paths already
+        found which share the same root path. Instead of copying the
+        graph, the masks are flags given to L{masked_shortest_path} on
+        a single L{CompactGraph}. The candidate paths are kept in a
+        min-heap ordered by length, where a path found from several
+        spur vertices is only added once.
+
+        The paths are returned in order of increasing length, with the
+        same layout as the path returned by L{shortest_path}. Fewer
+        than k paths are returned if there are no more loopless paths.
+
+        Time complexity: O(k * n * m log(n)), where m is the number of
+        edges and n is the number of vertices.
+
+        @param graph: The graph from where the paths are computed.
+        @type: L{DirectedWeightedGraph}
+        @param source: The source vertex of the paths.
+        @type: L{UnWeightedGraphVertex}
+        @param destination: The destination vertex of the paths.
+        @type: L{UnWeightedGraphVertex}
+        @param k: The number of paths to find.
+        @type: C{int}
+        @return: The k shortest paths between source -and destination vertex.
+        @rtype: C{list}
+        """
+        compact_graph = CompactGraph(graph)
+        targets = compact_graph.get_targets()
+        weights = compact_graph.get_weights()
+        edges = compact_graph.get_edges()
+        source_number = source.vertex_number
+        destination_number = destination.vertex_number
+        found = []
+        if k > 0:
+            first = GraphAlgorithms.masked_shortest_path(
+                compact_graph, source_number, destination_number)
+            if first is not None:
+                found.append(first[1])
+        seen = set(tuple(x) for x in found)
+        candidates = MinHeap()
+        removed_vertices = [False] * compact_graph.get_number_of_vertices()
+        while found and len(found) < k:
+            previous = found[-1]
+            path_vertices = [source_number] + [targets[x] for x in previous]
+            root_length = 0
+            for i in xrange(len(previous)):
+                spur = path_vertices[i]
+                root = previous[:i]
+                removed_arcs = set()
+                for path in found:
+                    if len(path) > i and path[:i] == root:
+                        removed_arcs.add(path[i])
+                for vertex in path_vertices[:i]:
+                    removed_vertices[vertex] = True
+                spur_path = GraphAlgorithms.masked_shortest_path(
+                    compact_graph, spur, destination_number,
+                    removed_vertices, removed_arcs)
+                for vertex in path_vertices[:i]:
+                    removed_vertices[vertex] = False
+                if spur_path is not None:
+                    candidate = tuple(root + spur_path[1])
+                    if candidate not in seen:
+                        seen.add(candidate)
+                        candidates.insert(Association(
+                            (root_length + spur_path[0], candidate), candidate))
+                root_length += weights[previous[i]]
+            if candidates.is_empty():
+                break
+            found.append(list(candidates.heap_extract_min().get_value()))
+
+        result = []
+        for arcs in found:
+            path = GraphPath(graph)
+            path.add_vertex(destination)
+            for arc in reversed(arcs):
+                edge = edges[arc]
+                path.add_vertex(edge.get_head_vertex())
+                path.add_edge(edge)
+            result.append(path)
+        return result
+
+    @staticmethod
+    def update_shortest_paths(graph, table, changes):
+        """
+        Repairs the table of single-source shortest paths computed by
+        L{dijkstras_algorithm} after a batch of edge insertions, removals
+        and weight changes, in the style of the Ramalingam-Reps
+        algorithm. The graph must already hold the updated edges, and
+        the changes are given as pairs of the end points of each
+        changed edge. A weight change is done in the graph by removing
+        the edge and adding it with the new weight.
+
+        The repair works in three steps:
+
+        1) A tree edge which has been removed or made heavier makes
+        the distance of its subtree in the shortest path tree invalid.
+        The vertices in these subtrees are marked as affected and their
+        entries are reset.
+
+        2) Each affected vertex gets the shortest distance over its
+        incoming edges from unaffected reachable vertices, and every
+        inserted or lighter edge is relaxed.
+
+        3) The vertices whose distance was lowered in step 2 are put
+        into a min-heap, and the distances are propagated by Dijkstra's
+        algorithm, which only visits vertices whose distance changes.
+
+        Only the affected subtrees and the vertices whose distance
+        decreases are explored by the min-heap. The incoming edges of
+        the affected vertices are found in a transposed L{CompactGraph}
+        built once in linear time.
+
+        Time complexity: O(n + m + k log(k)) in the worst case, where
+        n is the number of vertices, m is the number of edges and k
+        is the number of edges leaving the vertices whose distance
+        changes.
+
+        @param graph: The graph from where the shortest path is computed.
+        @type: L{DirectedWeightedGraph}
+        @param table: Table of entries found by Dijkstra's algorithm.
+        @type: L{ArrayList}
+        @param changes: Pairs of the end points of the changed edges.
+        @type: C{list}
+        @return: The repaired table of entries.
+        @rtype: L{ArrayList}
+        """
+        number_of_vertices = graph.get_number_of_vertices()
+        vertices = graph.vertices
+        adjacency_list = graph.adjacency_list
+        pairs = []
+        for vertex_u, vertex_v in changes:
+            pairs.append((vertex_u.vertex_number, vertex_v.vertex_number))
+            if not graph.is_directed():
+                pairs.append((vertex_v.vertex_number, vertex_u.vertex_number))
+        lightest = []
+        for vertex_u, vertex_v in pairs:
+            best = None
+            ptr = adjacency_list[vertex_u].head
+            while ptr is not None:
+                edge = ptr.data
+                if edge.tail_vertex.vertex_number == vertex_v and \
+                        (best is None or edge.get_weight() < best.get_weight()):
+                    best = edge
+                ptr = ptr.next
+            lightest.append(best)
+
+        # Step 1: Reset the subtrees below invalid tree edges.
+        roots = []
+        for (vertex_u, vertex_v), best in zip(pairs, lightest):
+            entry = table[vertex_v]
+            if entry.predecessor is None or \
+                    entry.predecessor.vertex_number != vertex_u:
+                continue
+            if best is None or best.get_weight() > entry.edge.get_weight():
+                roots.append(vertex_v)
+            else:
+                entry.edge = best
+        affected = [False] * number_of_vertices
+        affected_vertices = []
+        if roots:
+            children = [[] for _ in xrange(number_of_vertices)]
+            for i in xrange(number_of_vertices):
+                if table[i].predecessor is not None:
+                    children[table[i].predecessor.vertex_number].append(i)
+            stack = roots
+            while stack:
+                vertex = stack.pop()
+                if not affected[vertex]:
+                    affected[vertex] = True
+                    affected_vertices.append(vertex)
+                    stack.extend(children[vertex])
+            for vertex in affected_vertices:
+                table[vertex] = Entry()
+
+        # Step 2: Seed the min-heap.
+        queue = MinHeap()
+        if affected_vertices:
+            reverse = CompactGraph(graph, True)
+            offsets = reverse.get_offsets()
+            targets = reverse.get_targets()
+            edges = reverse.get_edges()
+            for vertex in affected_vertices:
+                entry = table[vertex]
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    other = targets[i]
+                    if affected[other] or not table[other].discovered:
+                        continue
+                    path_distance = table[other].distance + \
+                        edges[i].get_weight()
+                    if path_distance < entry.distance:
+                        entry.distance = path_distance
+                        entry.predecessor = vertices[other]
+                        entry.edge = edges[i]
+                if entry.predecessor is not None:
+                    queue.insert(Association(entry.distance, vertex))
+        for (vertex_u, vertex_v), best in zip(pairs, lightest):
+            if best is None or affected[vertex_u] or \
+                    not table[vertex_u].discovered:
+                continue
+            path_distance = table[vertex_u].distance + best.get_weight()
+            entry = table[vertex_v]
+            if path_distance < entry.distance:
+                entry.distance = path_distance
+                entry.predecessor = vertices[vertex_u]
+                entry.edge = best
+                queue.insert(Association(path_distance, vertex_v))
+
+        # Step 3: Propagate the lowered distances.
+        while not queue.is_empty():
+            association = queue.heap_extract_min()
+            vertex = association.get_value()
+            entry = table[vertex]
+            if association.get_key() > entry.distance:
+                continue
+            entry.discovered = True
+            ptr = adjacency_list[vertex].head
+            while ptr is not None:
+                edge = ptr.data
+                other = table[edge.tail_vertex.vertex_number]
+                path_distance = entry.distance + edge.get_weight()
+                if path_distance < other.distance:
+                    other.distance = path_distance
+                    other.predecessor = vertices[vertex]
+                    other.edge = edge
+                    queue.insert(Association(path_distance,
+                                             edge.tail_vertex.vertex_number))
+                ptr = ptr.next
+        return table
+
     @staticmethod
     def bellman_ford_algorithm(graph, source):
         """
@@ -324,3 +1168,2277 @@ class GraphAlgorithms(object):
                 has_cycle = True
 
         return has_cycle, distances
+
+    @staticmethod
+    def multi_source_breadth_first_search(graph, sources, batch_size=64):
+        """
+        Implements a multi-source breadth-first search (MS-BFS), which
+        computes the number of edges on a shortest path from each of the
+        specified source vertices to all vertices in the graph.
+
+        Instead of running one breadth-first search per source vertex,
+        the sources are processed in batches of at most batch_size
+        sources, which are traversed simultaneously. Each vertex holds
+        two bitsets, stored as integers, where bit k corresponds to the
+        k'th source vertex in the batch. The first bitset records which
+        of the sources that have already seen the vertex, and the
+        second bitset records for which of the sources the vertex is in
+        the current frontier. When the frontier of a vertex is expanded,
+        its bitset is or'ed into the bitset of each successor, so every
+        edge is examined once per level for the whole batch rather than
+        once per source.
+
+        The result is returned as a list holding one distance list per
+        source vertex, in the order the sources were specified. The
+        distance list is indexed by vertex number, and unreachable
+        vertices have the distance -1.
+
+        Time complexity: O(k/b * (n + m) * l), where k is the number of
+        sources, b is the batch size, n is the number of vertices, m is
+        the number of edges, and l is the number of levels in the search.
+
+        @param graph: The graph in which the search is performed.
+        @type: L{Graph}
+        @param sources: The vertices from where the search begins.
+        @type: C{list}
+        @param batch_size: The maximum number of sources traversed simultaneously.
+        @type: C{int}
+        @return: The hop distances from each source vertex to all vertices.
+        @rtype: C{list}
+        """
+        if batch_size < 1:
+            raise ValueError
+        compact_graph = CompactGraph(graph)
+        result = []
+        for first in xrange(0, len(sources), batch_size):
+            batch = sources[first:first + batch_size]
+            result.extend(GraphAlgorithms.multi_source_breadth_first_batch(
+                compact_graph, [source.vertex_number for source in batch]))
+        return result
+
+    @staticmethod
+    def multi_source_breadth_first_batch(compact_graph, sources):
+        """
+        Performs a single batch of the multi-source breadth-first search
+        described in L{multi_source_breadth_first_search} on the specified
+        compact graph. All the specified sources are traversed at once,
+        using bit k of the per-vertex bitsets for the k'th source.
+
+        @param compact_graph: The compact view of the graph being searched.
+        @type: L{CompactGraph}
+        @param sources: The indices of the vertices from where the search begins.
+        @type: C{list}
+        @return: The hop distances from each source vertex to all vertices.
+        @rtype: C{list}
+        """
+        number_of_vertices = compact_graph.get_number_of_vertices()
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        distances = [[-1] * number_of_vertices for _ in sources]
+        seen = [0] * number_of_vertices
+        visit = [0] * number_of_vertices
+        frontier = []
+        for k, source in enumerate(sources):
+            bit = 1 << k
+            if not visit[source]:
+                frontier.append(source)
+            seen[source] |= bit
+            visit[source] |= bit
+            distances[k][source] = 0
+
+        level = 0
+        while frontier:
+            level += 1
+            visit_next = {}
+            for vertex in frontier:
+                bits = visit[vertex]
+                visit[vertex] = 0
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    successor = targets[i]
+                    visit_next[successor] = visit_next.get(successor, 0) | bits
+            frontier = []
+            for vertex, bits in visit_next.iteritems():
+                bits &= ~seen[vertex]
+                if bits:
+                    seen[vertex] |= bits
+                    visit[vertex] = bits
+                    frontier.append(vertex)
+                    # Record the distance for each source which reached
+                    # the vertex for the first time at this level.
+                    while bits:
+                        lowest = bits & -bits
+                        distances[lowest.bit_length() - 1][vertex] = level
+                        bits ^= lowest
+        return distances
+
+    @staticmethod
+    def distance_sums(graph, batch_size=64):
+        """
+        Computes, for every vertex v in the specified graph, the number
+        of other vertices u from which v is reachable, the sum of the
+        distances d(u, v) -and the sum of their reciprocals, where the
+        distance is the number of edges on a shortest path. The sums
+        are accumulated from one batch of the multi-source breadth-first
+        search in L{multi_source_breadth_first_search} at a time, so
+        only the distances of a single batch are held in memory.
+
+        Time complexity: O(n/b * (n + m) * l), where b is the batch
+        size, n is the number of vertices, m is the number of edges, and
+        l is the number of levels in the search.
+
+        @param graph: The graph in which the distances are summed.
+        @type: L{Graph}
+        @param batch_size: The maximum number of sources traversed simultaneously.
+        @type: C{int}
+        @return: The reached counts, distance sums -and reciprocal sums.
+        @rtype: C{tuple}
+        """
+        if batch_size < 1:
+            raise ValueError
+        number_of_vertices = graph.get_number_of_vertices()
+        compact_graph = CompactGraph(graph)
+        reached = [0] * number_of_vertices
+        total = [0] * number_of_vertices
+        reciprocal = [0.0] * number_of_vertices
+        for first in xrange(0, number_of_vertices, batch_size):
+            sources = range(first, min(first + batch_size, number_of_vertices))
+            for distances in GraphAlgorithms.multi_source_breadth_first_batch(
+                    compact_graph, sources):
+                for vertex, distance in enumerate(distances):
+                    if distance > 0:
+                        reached[vertex] += 1
+                        total[vertex] += distance
+                        reciprocal[vertex] += 1.0 / distance
+        return reached, total, reciprocal
+
+    @staticmethod
+    def closeness_centrality(graph, batch_size=64):
+        """
+        Computes the closeness centrality of every vertex v in the
+        specified graph, which is the reciprocal of the average distance
+        d(u, v) to v from the r other vertices u which can reach v. In a
+        graph which is not (strongly) connected, it is scaled by the
+        fraction r / (n - 1) of the other vertices which can reach v, as
+        suggested by Wasserman -and Faust, so vertices reachable from few
+        vertices do not get a high centrality. A vertex not reachable
+        from any other vertex has centrality 0.
+
+        The distances are hop distances found by a batched multi-source
+        breadth-first search, see L{distance_sums}, so edge weights are
+        not taken into account.
+
+        Time complexity: O(n/b * (n + m) * l), where b is the batch
+        size, n is the number of vertices, m is the number of edges, and
+        l is the number of levels in the search.
+
+        @param graph: The graph in which the centrality is computed.
+        @type: L{Graph}
+        @param batch_size: The maximum number of sources traversed simultaneously.
+        @type: C{int}
+        @return: The closeness centrality of each vertex indexed by vertex number.
+        @rtype: C{list}
+        """
+        number_of_vertices = graph.get_number_of_vertices()
+        reached, total, _ = GraphAlgorithms.distance_sums(graph, batch_size)
+        centrality = [0.0] * number_of_vertices
+        for vertex in xrange(number_of_vertices):
+            if total[vertex] > 0:
+                centrality[vertex] = float(reached[vertex]) / total[vertex] \
+                    * reached[vertex] / (number_of_vertices - 1)
+        return centrality
+
+    @staticmethod
+    def harmonic_centrality(graph, normalized=False, batch_size=64):
+        """
+        Computes the harmonic centrality of every vertex v in the
+        specified graph, which is the sum of the reciprocal distances
+        1 / d(u, v) from all other vertices u, where unreachable
+        vertices contribute 0. If the result is normalized, it is
+        divided by n - 1, the largest possible value.
+
+        The distances are hop distances found by a batched multi-source
+        breadth-first search, see L{distance_sums}, so edge weights are
+        not taken into account.
+
+        Time complexity: O(n/b * (n + m) * l), where b is the batch
+        size, n is the number of vertices, m is the number of edges, and
+        l is the number of levels in the search.
+
+        @param graph: The graph in which the centrality is computed.
+        @type: L{Graph}
+        @param normalized: Flag indicating if the result is normalized.
+        @type: C{bool}
+        @param batch_size: The maximum number of sources traversed simultaneously.
+        @type: C{int}
+        @return: The harmonic centrality of each vertex indexed by vertex number.
+        @rtype: C{list}
+        """
+        number_of_vertices = graph.get_number_of_vertices()
+        _, _, reciprocal = GraphAlgorithms.distance_sums(graph, batch_size)
+        if normalized and number_of_vertices > 1:
+            return [value / (number_of_vertices - 1) for value in reciprocal]
+        return reciprocal
+
+    @staticmethod
+    def estimate_centrality(graph, samples, harmonic=False, delta=0.05,
+                            seed=None, batch_size=64):
+        """
+        Estimates the closeness -or harmonic centrality of every vertex
+        in the specified graph from the distances to it from a number
+        of sampled vertices, as suggested by Eppstein -and Wang. The
+        samples are drawn uniformly with replacement, so the sum over
+        all n vertices u of a quantity f(u, v) is estimated by n times
+        its average over the samples, and the distances from the
+        distinct samples are found by a batched multi-source
+        breadth-first search.
+
+        Besides the estimates, a list of intervals is returned, which
+        by Hoeffding's inequality -and the union bound all contain the
+        exact centrality with probability at least 1 - delta. For the
+        harmonic centrality f(u, v) = 1 / d(u, v) lies in [0, 1], so the
+        error of the sum is at most n * sqrt(ln(2n / delta) / (2k)),
+        where k is the number of samples. For the closeness centrality,
+        which is estimated as (n - 1) divided by the estimated sum of
+        the distances d(u, v), the distances lie in [0, D], where D is
+        bounded by the largest distance from -and to the first sample.
+        The closeness estimate requires the graph to be (strongly)
+        connected.
+
+        Time complexity: O(k/b * (n + m) * l), where k is the number of
+        samples, b is the batch size, n is the number of vertices, m is
+        the number of edges, and l is the number of levels in the search.
+
+        @param graph: The graph in which the centrality is estimated.
+        @type: L{Graph}
+        @param samples: The number of sampled vertices.
+        @type: C{int}
+        @param harmonic: Flag indicating if the harmonic centrality is estimated.
+        @type: C{bool}
+        @param delta: The probability that an interval misses the exact value.
+        @type: C{float}
+        @param seed: The seed of the random sampling.
+        @type: C{int}
+        @param batch_size: The maximum number of sources traversed simultaneously.
+        @type: C{int}
+        @return: The estimates -and intervals, indexed by vertex number.
+        @rtype: C{tuple}
+        @raises: Exception if the number of samples, delta -or the batch
+        size is not positive, or if the closeness is estimated in a graph
+        which is not (strongly) connected.
+        @type: C{ValueError}
+        """
+        if samples < 1 or delta <= 0.0 or batch_size < 1:
+            raise ValueError
+        number_of_vertices = graph.get_number_of_vertices()
+        if number_of_vertices == 0:
+            return [], []
+        rand = Random(seed)
+        drawn = [rand.randrange(number_of_vertices) for _ in xrange(samples)]
+        multiplicity = {}
+        for vertex in drawn:
+            multiplicity[vertex] = multiplicity.get(vertex, 0) + 1
+        sources = sorted(multiplicity)
+
+        compact_graph = CompactGraph(graph)
+        totals = [0.0] * number_of_vertices
+        for first in xrange(0, len(sources), batch_size):
+            batch = sources[first:first + batch_size]
+            for source, distances in zip(
+                    batch, GraphAlgorithms.multi_source_breadth_first_batch(
+                        compact_graph, batch)):
+                count = multiplicity[source]
+                for vertex, distance in enumerate(distances):
+                    if harmonic:
+                        if distance > 0:
+                            totals[vertex] += float(count) / distance
+                    elif distance < 0:
+                        raise ValueError
+                    else:
+                        totals[vertex] += count * distance
+                if source == sources[0]:
+                    first_distances = distances
+
+        scale = float(number_of_vertices) / samples
+        error = number_of_vertices * \
+            sqrt(log(2.0 * number_of_vertices / delta) / (2.0 * samples))
+        estimates = []
+        intervals = []
+        if harmonic:
+            upper = number_of_vertices - 1
+            for total in totals:
+                estimate = min(upper, total * scale)
+                estimates.append(estimate)
+                intervals.append((max(0.0, estimate - error),
+                                  min(upper, estimate + error)))
+            return estimates, intervals
+
+        if number_of_vertices == 1:
+            return [0.0], [(0.0, 0.0)]
+        reverse_distances = CompactGraph(graph, True).breadth_first_distances(
+            sources[0])
+        if min(reverse_distances) < 0:
+            raise ValueError
+        diameter = max(first_distances) + max(reverse_distances)
+        lowest = number_of_vertices - 1
+        highest = (number_of_vertices - 1) * diameter
+        for total in totals:
+            farness = min(highest, max(lowest, total * scale))
+            estimates.append(lowest / farness)
+            low = max(lowest, farness - diameter * error)
+            high = min(highest, farness + diameter * error)
+            intervals.append((lowest / high, lowest / low))
+        return estimates, intervals
+
+    @staticmethod
+    def connected_components(graph):
+        """
+        Finds the connected components of the specified undirected
+        graph. The vertices are scanned in order of their vertex
+        number, and each vertex not yet labeled starts a breadth-first
+        search labeling every vertex reachable from it with the next
+        component number. For a directed graph the direction of the
+        edges is ignored, which gives the weakly connected components.
+
+        The result is returned in a tuple, where the first element is
+        a list holding the component number of each vertex indexed by
+        vertex number, and the second element is a list holding the
+        number of vertices in each component. The components are
+        numbered 0, 1, ..., k - 1 in the order of their first vertex.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph from where the components are computed.
+        @type: L{UnDirectedGraph}
+        @return: The component label of each vertex and the size of each component.
+        @rtype: C{tuple}
+        """
+        views = [CompactGraph(graph)]
+        if graph.is_directed():
+            views.append(CompactGraph(graph, True))
+        number_of_vertices = graph.get_number_of_vertices()
+        labels = [-1] * number_of_vertices
+        sizes = []
+        for root in xrange(number_of_vertices):
+            if labels[root] >= 0:
+                continue
+            label = len(sizes)
+            labels[root] = label
+            frontier = [root]
+            size = 0
+            while frontier:
+                size += len(frontier)
+                next_frontier = []
+                for vertex in frontier:
+                    for view in views:
+                        offsets = view.get_offsets()
+                        targets = view.get_targets()
+                        for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                            successor = targets[i]
+                            if labels[successor] < 0:
+                                labels[successor] = label
+                                next_frontier.append(successor)
+                frontier = next_frontier
+            sizes.append(size)
+        return labels, sizes
+
+    @staticmethod
+    def strongly_connected_components(graph):
+        """
+        Implements Tarjan's algorithm for finding the strongly connected
+        components of the specified directed graph. A depth-first search
+        numbers the vertices in the order they are discovered, and keeps
+        the discovered vertices not yet assigned to a component on a
+        stack. The low value of a vertex is the smallest number of a
+        vertex on the stack reachable from its subtree. A vertex whose
+        low value equals its own number is the root of a component,
+        which consists of the vertices above it on the stack. The
+        depth-first search uses an explicit stack of call frames.
+
+        The result is returned in the same format as the result of
+        L{connected_components}. The components are numbered in the
+        order they are completed, which is a reverse topological order
+        of the condensation of the graph: every edge between two
+        components leads to a component with a lower number.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph from where the components are computed.
+        @type: L{DirectedGraph}
+        @return: The component label of each vertex and the size of each component.
+        @rtype: C{tuple}
+        """
+        compact_graph = CompactGraph(graph)
+        return GraphAlgorithms.strongly_connected_components_from_arrays(
+            compact_graph.get_offsets(), compact_graph.get_targets())
+
+    @staticmethod
+    def strongly_connected_components_from_arrays(offsets, targets):
+        """
+        Finds the strongly connected components of the directed graph
+        given by the specified offsets -and targets arrays, in the
+        format of a L{CompactGraph}, by the algorithm described in
+        L{strongly_connected_components}.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of arcs.
+
+        @param offsets: The offsets of the arcs emanating each vertex.
+        @type: C{list}
+        @param targets: The vertex each arc leads to.
+        @type: C{list}
+        @return: The component label of each vertex and the size of each component.
+        @rtype: C{tuple}
+        """
+        number_of_vertices = len(offsets) - 1
+        index = [-1] * number_of_vertices
+        low = [0] * number_of_vertices
+        on_stack = [False] * number_of_vertices
+        stack = []
+        labels = [-1] * number_of_vertices
+        sizes = []
+        counter = 0
+        for root in xrange(number_of_vertices):
+            if index[root] >= 0:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            frames = [[root, offsets[root]]]
+            while frames:
+                frame = frames[-1]
+                vertex = frame[0]
+                if frame[1] < offsets[vertex + 1]:
+                    successor = targets[frame[1]]
+                    frame[1] += 1
+                    if index[successor] < 0:
+                        index[successor] = low[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = True
+                        frames.append([successor, offsets[successor]])
+                    elif on_stack[successor] and index[successor] < low[vertex]:
+                        low[vertex] = index[successor]
+                    continue
+                frames.pop()
+                if frames and low[vertex] < low[frames[-1][0]]:
+                    low[frames[-1][0]] = low[vertex]
+                if low[vertex] == index[vertex]:
+                    label = len(sizes)
+                    size = 0
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        labels[member] = label
+                        size += 1
+                        if member == vertex:
+                            break
+                    sizes.append(size)
+        return labels, sizes
+
+    @staticmethod
+    def connected_components_from_edges(edges, number_of_vertices=0):
+        """
+        Finds the connected components of the undirected graph given
+        by the specified stream of edges, without building the graph.
+        Each edge is a pair (u, v) of vertex numbers, and the edges are
+        consumed one at a time by merging the sets of u and v in an
+        array based union-find partition. The edges can therefore be
+        produced lazily, e.g. by a generator parsing an edge list file
+        line by line. The partition grows to hold the largest vertex
+        number seen, or number_of_vertices if that is larger.
+
+        The result has the same format as for L{connected_components}.
+
+        Time complexity: O(m * alpha(n)), where m is the number of
+        edges, n is the number of vertices, and alpha is the inverse
+        Ackermann function.
+
+        @param edges: Iterable of (u, v) pairs of vertex numbers.
+        @type: C{object}
+        @param number_of_vertices: The minimum number of vertices in the graph.
+        @type: C{int}
+        @return: The component label of each vertex and the size of each component.
+        @rtype: C{tuple}
+        """
+        partition = ArrayPartition(number_of_vertices)
+        size = number_of_vertices
+        for vertex_u, vertex_v in edges:
+            if vertex_u >= size or vertex_v >= size:
+                size = max(vertex_u, vertex_v) + 1
+                partition.set_size(size)
+            partition.union(vertex_u, vertex_v)
+        return partition.get_labels()
+
+    @staticmethod
+    def edmonds_karp(graph, source, sink):
+        """
+        Implements the Edmonds-Karp algorithm for finding a maximum
+        flow from the specified source vertex to the specified sink
+        vertex in the flow network given by the graph, where the weight
+        of each edge is its capacity. The flow is augmented along
+        shortest paths in the residual graph.
+
+        The result holds the value of the maximum flow, the flow on
+        each edge, and the minimum cut separating the source from the
+        sink.
+
+        Time complexity: O(n * m^2), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph from where the maximum flow is computed.
+        @type: L{DirectedWeightedGraph}
+        @param source: The source vertex of the flow.
+        @type: L{UnWeightedGraphVertex}
+        @param sink: The sink vertex of the flow.
+        @type: L{UnWeightedGraphVertex}
+        @return: The maximum flow, edge flows and minimum cut.
+        @rtype: L{MaxFlowResult}
+        """
+        network = FlowNetwork(graph)
+        network.edmonds_karp(source.vertex_number, sink.vertex_number)
+        return network.get_result(source.vertex_number)
+
+    @staticmethod
+    def dinic(graph, source, sink):
+        """
+        Implements Dinic's algorithm for finding a maximum flow from
+        the specified source vertex to the specified sink vertex in
+        the flow network given by the graph, where the weight of each
+        edge is its capacity. In each phase, a blocking flow is found
+        in the level graph of the residual graph.
+
+        The result has the same format as for L{edmonds_karp}.
+
+        Time complexity: O(n^2 * m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph from where the maximum flow is computed.
+        @type: L{DirectedWeightedGraph}
+        @param source: The source vertex of the flow.
+        @type: L{UnWeightedGraphVertex}
+        @param sink: The sink vertex of the flow.
+        @type: L{UnWeightedGraphVertex}
+        @return: The maximum flow, edge flows and minimum cut.
+        @rtype: L{MaxFlowResult}
+        """
+        network = FlowNetwork(graph)
+        network.dinic(source.vertex_number, sink.vertex_number)
+        return network.get_result(source.vertex_number)
+
+    @staticmethod
+    def push_relabel(graph, source, sink):
+        """
+        Implements the highest-label push-relabel algorithm, with the
+        gap -and global relabeling heuristics, for finding a maximum
+        flow from the specified source vertex to the specified sink
+        vertex in the flow network given by the graph, where the weight
+        of each edge is its capacity.
+
+        The result has the same format as for L{edmonds_karp}.
+
+        Time complexity: O(n^2 * sqrt(m)), where n is the number of
+        vertices and m is the number of edges.
+
+        @param graph: The graph from where the maximum flow is computed.
+        @type: L{DirectedWeightedGraph}
+        @param source: The source vertex of the flow.
+        @type: L{UnWeightedGraphVertex}
+        @param sink: The sink vertex of the flow.
+        @type: L{UnWeightedGraphVertex}
+        @return: The maximum flow, edge flows and minimum cut.
+        @rtype: L{MaxFlowResult}
+        """
+        network = FlowNetwork(graph)
+        network.push_relabel(source.vertex_number, sink.vertex_number)
+        return network.get_result(source.vertex_number)
+
+    @staticmethod
+    def min_cost_flow(graph, source, sink, capacity=None, cost=None,
+                      flow_limit=None, scaling=False):
+        """
+        Finds a minimum cost flow from the specified source vertex to
+        the specified sink vertex, where each edge has a capacity and
+        a cost per unit of flow. The flow has maximum value, or the
+        value given by the flow limit if that is smaller. If no
+        capacity or cost function is specified, the weight of an edge
+        is used.
+
+        By default, successive shortest paths are used, where the
+        initial vertex potentials are found by the Bellman-Ford
+        algorithm and every augmenting path by Dijkstra's algorithm
+        on the reduced costs. For large integer capacities, capacity
+        scaling bounds the number of augmentations by O(m log(U)),
+        where U is the largest capacity.
+
+        @param graph: The graph from where the flow is computed.
+        @type: L{DirectedWeightedGraph}
+        @param source: The source vertex of the flow.
+        @type: L{UnWeightedGraphVertex}
+        @param sink: The sink vertex of the flow.
+        @type: L{UnWeightedGraphVertex}
+        @param capacity: Function returning the capacity of an edge.
+        @type: C{function}
+        @param cost: Function returning the cost per unit of flow on an edge.
+        @type: C{function}
+        @param flow_limit: The largest value of the flow.
+        @type: C{int}
+        @param scaling: Flag indicating if capacity scaling is used.
+        @type: C{bool}
+        @raises: ValueError if a negative cycle is reachable from the source without scaling.
+        @type: C{ValueError}
+        @return: The flow, edge flows and cost.
+        @rtype: L{MinCostFlowResult}
+        """
+        network = MinCostFlowNetwork(graph, capacity, cost)
+        if scaling:
+            network.capacity_scaling(source.vertex_number,
+                                     sink.vertex_number, flow_limit)
+        else:
+            network.successive_shortest_paths(source.vertex_number,
+                                              sink.vertex_number, flow_limit)
+        return network.get_result(source.vertex_number)
+
+    @staticmethod
+    def bipartite_coloring(graph):
+        """
+        Finds a 2-coloring of the specified undirected graph, that is,
+        an assignment of the colors 0 and 1 to the vertices such that
+        no edge connects two vertices of the same color. The graph has
+        such a coloring if and only if it is bipartite. Each component
+        is colored by a breadth-first search, giving its first vertex
+        the color 0.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph to be colored.
+        @type: L{UnDirectedGraph}
+        @return: The color of each vertex indexed by vertex number, or None if the graph is not bipartite.
+        @rtype: C{list}
+        """
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        number_of_vertices = compact_graph.get_number_of_vertices()
+        color = [-1] * number_of_vertices
+        for root in xrange(number_of_vertices):
+            if color[root] >= 0:
+                continue
+            color[root] = 0
+            frontier = [root]
+            while frontier:
+                next_frontier = []
+                for vertex in frontier:
+                    other = 1 - color[vertex]
+                    for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                        successor = targets[i]
+                        if color[successor] < 0:
+                            color[successor] = other
+                            next_frontier.append(successor)
+                        elif color[successor] != other:
+                            return None
+                frontier = next_frontier
+        return color
+
+    @staticmethod
+    def hopcroft_karp(graph, left_vertices=None):
+        """
+        Implements the Hopcroft-Karp algorithm for finding a maximum
+        matching in the specified bipartite undirected graph, where
+        left_vertices is one side of the bipartition. If no left
+        vertices are specified, the bipartition is found by
+        L{bipartite_coloring}, taking the vertices with color 0 as the
+        left side.
+
+        The matching is kept in an array holding the mate of each
+        vertex. After a greedy initial matching, the algorithm works
+        in phases. Each phase performs a breadth-first search from all
+        free left vertices, layering the left vertices by the length
+        of the shortest alternating path reaching them, and then a
+        depth-first search from each free left vertex, which augments
+        the matching along a maximal set of vertex disjoint shortest
+        augmenting paths. A vertex from which the depth-first search
+        fails is removed from the layering for the rest of the phase,
+        and the depth-first search keeps an explicit stack. There are
+        at most O(sqrt(n)) phases.
+
+        The result is returned as a list indexed by vertex number,
+        holding the vertex matched to each vertex, or None for
+        unmatched vertices.
+
+        Time complexity: O(m * sqrt(n)), where n is the number of
+        vertices and m is the number of edges.
+
+        @param graph: The bipartite graph where the matching is found.
+        @type: L{UnDirectedGraph}
+        @param left_vertices: The vertices on the left side of the bipartition.
+        @type: C{list}
+        @raises: ValueError if the graph is not bipartite with the given left side.
+        @type: C{ValueError}
+        @return: The mate of each vertex indexed by vertex number.
+        @rtype: C{list}
+        """
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        number_of_vertices = compact_graph.get_number_of_vertices()
+        if left_vertices is None:
+            color = GraphAlgorithms.bipartite_coloring(graph)
+            if color is None:
+                raise ValueError
+            left = [i for i in xrange(number_of_vertices) if color[i] == 0]
+        else:
+            color = [1] * number_of_vertices
+            left = [vertex.vertex_number for vertex in left_vertices]
+            for vertex in left:
+                color[vertex] = 0
+            for vertex in xrange(number_of_vertices):
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    if color[targets[i]] == color[vertex]:
+                        raise ValueError
+
+        mate = [-1] * number_of_vertices
+        for vertex in left:
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                if mate[targets[i]] < 0:
+                    mate[targets[i]] = vertex
+                    mate[vertex] = targets[i]
+                    break
+
+        infinity = number_of_vertices + 1
+        dist = [infinity] * number_of_vertices
+        while True:
+            # Breadth-first search layering the left vertices.
+            frontier = []
+            for vertex in left:
+                if mate[vertex] < 0:
+                    dist[vertex] = 0
+                    frontier.append(vertex)
+                else:
+                    dist[vertex] = infinity
+            free_distance = infinity
+            while frontier and free_distance == infinity:
+                next_frontier = []
+                for vertex in frontier:
+                    for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                        other = mate[targets[i]]
+                        if other < 0:
+                            free_distance = dist[vertex] + 1
+                        elif dist[other] == infinity:
+                            dist[other] = dist[vertex] + 1
+                            next_frontier.append(other)
+                frontier = next_frontier
+            if free_distance == infinity:
+                break
+
+            # Depth-first search for vertex disjoint augmenting paths.
+            current = offsets[:-1]
+            for root in left:
+                if mate[root] >= 0:
+                    continue
+                stack_left = [root]
+                stack_right = []
+                while stack_left:
+                    vertex = stack_left[-1]
+                    end = offsets[vertex + 1]
+                    i = current[vertex]
+                    advanced = False
+                    while i < end:
+                        right = targets[i]
+                        i += 1
+                        other = mate[right]
+                        if other < 0:
+                            if dist[vertex] + 1 == free_distance:
+                                current[vertex] = i
+                                stack_right.append(right)
+                                # Augment along the alternating path.
+                                for j in xrange(len(stack_left)):
+                                    mate[stack_left[j]] = stack_right[j]
+                                    mate[stack_right[j]] = stack_left[j]
+                                for vertex in stack_left:
+                                    dist[vertex] = infinity
+                                stack_left = []
+                                advanced = True
+                                break
+                        elif dist[other] == dist[vertex] + 1:
+                            current[vertex] = i
+                            stack_left.append(other)
+                            stack_right.append(right)
+                            advanced = True
+                            break
+                    if not advanced:
+                        current[vertex] = end
+                        dist[vertex] = infinity
+                        stack_left.pop()
+                        if stack_right:
+                            stack_right.pop()
+
+        vertices = graph.vertices
+        return [vertices[mate[i]] if mate[i] >= 0 else None
+                for i in xrange(number_of_vertices)]
+
+    @staticmethod
+    def pagerank(graph, damping=0.85, tol=1.0e-8, max_iterations=1000,
+                 start=None):
+        """
+        Computes the PageRank of the vertices in the specified graph,
+        where a random surfer follows an emanating edge of the current
+        vertex with probability damping, and jumps to a vertex chosen
+        uniformly at random otherwise. A vertex without emanating edges
+        (a dangling vertex) is left by a random jump.
+
+        The computation is done by power iteration, see
+        L{personalized_pagerank}.
+
+        Time complexity: O(i * (n + m)), where i is the number of
+        iterations, n is the number of vertices and m is the number of
+        edges.
+
+        @param graph: The graph in which the PageRank is computed.
+        @type: L{Graph}
+        @param damping: The probability of following an edge.
+        @type: C{float}
+        @param tol: The tolerance of the change between two iterations.
+        @type: C{float}
+        @param max_iterations: The maximum number of iterations.
+        @type: C{int}
+        @param start: The ranks from where the iteration begins.
+        @type: C{list}
+        @return: The rank of each vertex, indexed by vertex number.
+        @rtype: C{list}
+        @raises: Exception if the damping factor is outside [0, 1].
+        @type: C{ValueError}
+        """
+        return GraphAlgorithms.personalized_pagerank(
+            graph, None, damping, tol, max_iterations, start)
+
+    @staticmethod
+    def personalized_pagerank(graph, seeds, damping=0.85, tol=1.0e-8,
+                              max_iterations=1000, start=None):
+        """
+        Computes the personalized PageRank of the vertices in the
+        specified graph, where the random jumps of the surfer lead to
+        the seed vertices only. The seeds are given either as a list of
+        vertices, which are chosen uniformly, or as a dictionary mapping
+        vertices to non-negative weights, which are normalized to a
+        probability distribution. If no seeds are given, the jumps lead
+        to every vertex uniformly, which gives the ordinary PageRank.
+
+        The transition matrix is column-stochastic, where the column of
+        a vertex u holds 1 / d(u) in the row of each successor of u,
+        and d(u) is the out-degree of u. It is built once as a
+        compressed view of the incoming arcs of each vertex, so an
+        iteration computes the rank of a vertex as the sum of the
+        contributions of its predecessors. The rank held by dangling
+        vertices is spread according to the seed distribution, so the
+        ranks always sum to one. The iteration stops when the sum of
+        the absolute changes of the ranks is below the tolerance, or
+        when the maximum number of iterations is reached.
+
+        The iteration begins from the seed distribution, unless a start
+        vector is given, such as the ranks from a previous run on the
+        same -or a slightly changed graph, which then usually converges
+        in fewer iterations.
+
+        Time complexity: O(i * (n + m)), where i is the number of
+        iterations, n is the number of vertices and m is the number of
+        edges.
+
+        @param graph: The graph in which the PageRank is computed.
+        @type: L{Graph}
+        @param seeds: The vertices where the random jumps lead.
+        @type: C{list} or C{dict}
+        @param damping: The probability of following an edge.
+        @type: C{float}
+        @param tol: The tolerance of the change between two iterations.
+        @type: C{float}
+        @param max_iterations: The maximum number of iterations.
+        @type: C{int}
+        @param start: The ranks from where the iteration begins.
+        @type: C{list}
+        @return: The rank of each vertex, indexed by vertex number.
+        @rtype: C{list}
+        @raises: Exception if the damping factor is outside [0, 1], or
+        if the seed -or start weights are negative or sum to zero.
+        @type: C{ValueError}
+        """
+        if damping < 0.0 or damping > 1.0:
+            raise ValueError
+        number_of_vertices = graph.get_number_of_vertices()
+        if number_of_vertices == 0:
+            return []
+
+        if seeds is None:
+            teleport = [1.0 / number_of_vertices] * number_of_vertices
+        else:
+            teleport = [0.0] * number_of_vertices
+            if isinstance(seeds, dict):
+                for vertex, weight in seeds.iteritems():
+                    if weight < 0:
+                        raise ValueError
+                    teleport[vertex.vertex_number] += weight
+            else:
+                for vertex in seeds:
+                    teleport[vertex.vertex_number] += 1.0
+            total = float(sum(teleport))
+            if total <= 0.0:
+                raise ValueError
+            teleport = [weight / total for weight in teleport]
+
+        if start is None:
+            rank = list(teleport)
+        else:
+            if len(start) != number_of_vertices or min(start) < 0:
+                raise ValueError
+            total = float(sum(start))
+            if total <= 0.0:
+                raise ValueError
+            rank = [weight / total for weight in start]
+
+        # The incoming arcs of each vertex -and the scale of the
+        # contribution of each vertex to its successors.
+        compact_graph = CompactGraph(graph, True)
+        offsets = compact_graph.get_offsets()
+        predecessors = compact_graph.get_targets()
+        out_degree = [0] * number_of_vertices
+        for vertex in predecessors:
+            out_degree[vertex] += 1
+        scale = [damping / degree if degree > 0 else 0.0
+                 for degree in out_degree]
+        dangling = [vertex for vertex in xrange(number_of_vertices)
+                    if out_degree[vertex] == 0]
+
+        for _ in xrange(max_iterations):
+            contribution = [rank[vertex] * scale[vertex]
+                            for vertex in xrange(number_of_vertices)]
+            dangling_rank = sum(rank[vertex] for vertex in dangling)
+            jump = damping * dangling_rank + 1.0 - damping
+            previous = rank
+            rank = [jump * teleport[vertex] +
+                    sum(contribution[predecessors[i]]
+                        for i in xrange(offsets[vertex], offsets[vertex + 1]))
+                    for vertex in xrange(number_of_vertices)]
+            change = sum(abs(rank[vertex] - previous[vertex])
+                         for vertex in xrange(number_of_vertices))
+            if change < tol:
+                break
+        return rank
+
+    @staticmethod
+    def betweenness_centrality(graph, samples=None, normalized=False,
+                               seed=None, pool=None, processes=None,
+                               batch_size=16):
+        """
+        Implements Brandes' algorithm for the betweenness centrality of
+        the vertices in the specified graph, which is the sum over all
+        pairs of other vertices of the fraction of shortest paths
+        between the pair passing through the vertex. The edge weights
+        are used as lengths in a weighted graph, while every edge has
+        length one in an unweighted graph.
+
+        For each source vertex, the distances are found by a
+        breadth-first search, or by Dijkstra's algorithm in a weighted
+        graph, and the number of shortest paths sigma to every vertex
+        is counted in a topological order of the arcs on shortest
+        paths, which also orders vertices at equal distance joined by
+        edges of weight zero. The dependency delta of the source on
+        each vertex is then accumulated in the reverse order. The
+        tables are plain lists indexed by vertex number, see
+        L{betweenness_dependencies}. Parallel edges give separate
+        shortest paths, so in a cycle of four vertices where one edge
+        is doubled, the end points of that edge have the centrality
+        2/3 -and the other two vertices 1/3.
+
+        If edges of weight zero on shortest paths form a cycle, such
+        as an undirected edge of weight zero, which is stored in both
+        directions, the vertices on the cycles are grouped in
+        components, where a path is only counted while it moves away
+        from the vertex where it entered the component, see
+        L{component_dependencies}. This gives the number of simple
+        shortest paths whenever no cycle of weight zero passes through
+        three or more vertices, for instance when the edges of weight
+        zero in an undirected graph form a forest.
+
+        If a number of samples is specified, only that many source
+        vertices are chosen at random, and the sums are scaled by the
+        number of vertices divided by the number of samples, which
+        gives an unbiased estimate of the exact centrality.
+
+        If a pool -or a number of processes is specified, the source
+        vertices are split into batches of at most batch_size sources,
+        which are handled by the workers of the pool, and the
+        dependencies are summed in the calling process. If only the
+        number of processes is specified, a process pool is created
+        for the call, which receives the compact graph arrays once per
+        worker through L{share_betweenness_arrays}, so the tasks only
+        hold the source vertices. A specified pool receives the arrays
+        with the function, which is free for a thread pool, but sends
+        them once per chunk of tasks to a process pool.
+
+        In an undirected graph each pair is counted once, and if the
+        result is normalized, it is divided by the number of pairs of
+        other vertices, (n - 1)(n - 2) for directed -and (n - 1)(n - 2)
+        / 2 for undirected graphs.
+
+        Time complexity: O(k * (n + m)) for unweighted and O(k * (n + m)
+        * log(n)) for weighted graphs, where k is the number of source
+        vertices, n is the number of vertices and m is the number of
+        edges. A component of vertices joined by edges of weight zero
+        adds the number of its entry vertices times its number of edges
+        per source.
+
+        @param graph: The graph in which the centrality is computed.
+        @type: L{Graph}
+        @param samples: The number of sampled source vertices.
+        @type: C{int}
+        @param normalized: Flag indicating if the result is normalized.
+        @type: C{bool}
+        @param seed: The seed of the random sampling.
+        @type: C{int}
+        @param pool: The pool used to compute the dependencies.
+        @type: L{multiprocessing.pool.Pool}
+        @param processes: The number of workers in a created pool.
+        @type: C{int}
+        @param batch_size: The maximum number of sources in a batch.
+        @type: C{int}
+        @return: The centrality of each vertex, indexed by vertex number.
+        @rtype: C{list}
+        @raises: Exception if the number of samples -or the batch size
+        is not positive, or if an edge has a negative weight.
+        @type: C{ValueError}
+        """
+        if batch_size < 1:
+            raise ValueError
+        number_of_vertices = graph.get_number_of_vertices()
+        sources = range(number_of_vertices)
+        scale = 1.0
+        if samples is not None:
+            if samples < 1:
+                raise ValueError
+            if samples < number_of_vertices:
+                sources = Random(seed).sample(sources, samples)
+                scale = float(number_of_vertices) / samples
+        if normalized:
+            if number_of_vertices > 2:
+                scale /= (number_of_vertices - 1) * (number_of_vertices - 2)
+        elif not graph.is_directed():
+            scale /= 2.0
+
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        weights = None
+        if graph.is_weighted():
+            weights = compact_graph.get_weights()
+            if weights and min(weights) < 0:
+                raise ValueError
+        arrays = (offsets, targets, weights)
+        batches = [sources[i:i + batch_size]
+                   for i in xrange(0, len(sources), batch_size)]
+
+        if pool is not None:
+            partials = pool.map(partial(betweenness_dependencies,
+                                        arrays=arrays), batches)
+        elif processes is not None:
+            workers = Pool(processes, initializer=share_betweenness_arrays,
+                           initargs=(arrays,))
+            try:
+                partials = workers.map(betweenness_dependencies, batches)
+            finally:
+                workers.close()
+                workers.join()
+        else:
+            partials = [betweenness_dependencies(batch, arrays)
+                        for batch in batches]
+
+        centrality = [0.0] * number_of_vertices
+        for dependencies in partials:
+            for vertex in xrange(number_of_vertices):
+                centrality[vertex] += dependencies[vertex]
+        return [value * scale for value in centrality]
+
+    @staticmethod
+    def distinct_neighbors(graph):
+        """
+        Returns the distinct neighbors of every vertex in the specified
+        graph, leaving out the vertex itself, so parallel edges -and
+        self-loops are ignored. A marker array records the last vertex
+        which has seen each neighbor.
+
+        Time complexity: O(n + m), where n is the number of vertices and
+        m is the number of edges.
+
+        @param graph: The graph of which the neighbors are found.
+        @type: L{Graph}
+        @return: The list of neighbors of each vertex indexed by vertex number.
+        @rtype: C{list}
+        """
+        number_of_vertices = graph.get_number_of_vertices()
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        marker = [-1] * number_of_vertices
+        neighbors = []
+        for vertex in xrange(number_of_vertices):
+            marker[vertex] = vertex
+            distinct = []
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                other = targets[i]
+                if marker[other] != vertex:
+                    marker[other] = vertex
+                    distinct.append(other)
+            neighbors.append(distinct)
+        return neighbors
+
+    @staticmethod
+    def triangles(graph, neighbors=None):
+        """
+        Counts the triangles in the specified undirected graph, that is,
+        the sets of three vertices which are pairwise adjacent, and the
+        number of triangles each vertex belongs to.
+
+        Parallel edges -and self-loops are ignored, by using the lists
+        of distinct neighbors found by L{distinct_neighbors}, unless
+        they are specified. Every edge is oriented from the endpoint
+        with the lower degree to the endpoint with the higher degree,
+        with ties broken by vertex number, which makes the graph
+        acyclic and leaves every vertex with at most O(sqrt(m))
+        emanating arcs. The targets of
+        the arcs emanating from each vertex are stored in a sorted list
+        of positions in this order. A triangle u, v, w with u before v
+        before w is then found exactly once, by merging the sorted lists
+        of u -and v for each arc (u, v).
+
+        Time complexity: O(m^1.5), where m is the number of edges.
+
+        @param graph: The graph in which the triangles are counted.
+        @type: L{UnDirectedGraph}
+        @param neighbors: The distinct neighbors of each vertex indexed by vertex number.
+        @type: C{list}
+        @return: The number of triangles -and the number of triangles
+        each vertex belongs to, indexed by vertex number.
+        @rtype: C{tuple}
+        @raises: Exception if the graph is directed.
+        @type: C{ValueError}
+        """
+        if graph.is_directed():
+            raise ValueError
+        number_of_vertices = graph.get_number_of_vertices()
+        if neighbors is None:
+            neighbors = GraphAlgorithms.distinct_neighbors(graph)
+        degree = [len(neighbors[vertex])
+                  for vertex in xrange(number_of_vertices)]
+        order = sorted(xrange(number_of_vertices),
+                       key=lambda vertex: (degree[vertex], vertex))
+        position = [0] * number_of_vertices
+        for index, vertex in enumerate(order):
+            position[vertex] = index
+        forward = [sorted(position[other] for other in neighbors[vertex]
+                          if position[other] > position[vertex])
+                   for vertex in order]
+
+        total = 0
+        counts = [0] * number_of_vertices
+        for index_u in xrange(number_of_vertices):
+            neighbors_u = forward[index_u]
+            for index_v in neighbors_u:
+                neighbors_v = forward[index_v]
+                i = 0
+                j = 0
+                while i < len(neighbors_u) and j < len(neighbors_v):
+                    if neighbors_u[i] < neighbors_v[j]:
+                        i += 1
+                    elif neighbors_u[i] > neighbors_v[j]:
+                        j += 1
+                    else:
+                        total += 1
+                        counts[order[index_u]] += 1
+                        counts[order[index_v]] += 1
+                        counts[order[neighbors_u[i]]] += 1
+                        i += 1
+                        j += 1
+        return total, counts
+
+    @staticmethod
+    def local_clustering(graph):
+        """
+        Computes the local clustering coefficient of every vertex in the
+        specified undirected graph, which is the fraction of the pairs
+        of neighbors of the vertex that are adjacent, that is, the
+        number of triangles of the vertex divided by d(d - 1) / 2, where
+        d is its number of distinct neighbors other than itself. A
+        vertex with fewer than two neighbors has the coefficient 0. The
+        distinct neighbors are found once by L{distinct_neighbors}, and
+        used both for the degrees -and by L{triangles}.
+
+        Time complexity: O(m^1.5), where m is the number of edges.
+
+        @param graph: The graph in which the coefficients are computed.
+        @type: L{UnDirectedGraph}
+        @return: The clustering coefficient of each vertex indexed by vertex number.
+        @rtype: C{list}
+        @raises: Exception if the graph is directed.
+        @type: C{ValueError}
+        """
+        if graph.is_directed():
+            raise ValueError
+        neighbors = GraphAlgorithms.distinct_neighbors(graph)
+        _, counts = GraphAlgorithms.triangles(graph, neighbors)
+        coefficients = []
+        for vertex, count in enumerate(counts):
+            degree = len(neighbors[vertex])
+            if degree < 2:
+                coefficients.append(0.0)
+            else:
+                coefficients.append(2.0 * count / (degree * (degree - 1)))
+        return coefficients
+
+    @staticmethod
+    def transitivity(graph):
+        """
+        Computes the global transitivity of the specified undirected
+        graph, which is three times the number of triangles divided by
+        the number of connected triples, that is, paths of two edges
+        through distinct vertices, where parallel edges -and self-loops
+        are ignored. A graph without connected triples has
+        transitivity 0.
+
+        Time complexity: O(m^1.5), where m is the number of edges.
+
+        @param graph: The graph in which the transitivity is computed.
+        @type: L{UnDirectedGraph}
+        @return: The transitivity of the graph.
+        @rtype: C{float}
+        @raises: Exception if the graph is directed.
+        @type: C{ValueError}
+        """
+        if graph.is_directed():
+            raise ValueError
+        neighbors = GraphAlgorithms.distinct_neighbors(graph)
+        total, _ = GraphAlgorithms.triangles(graph, neighbors)
+        triples = 0
+        for distinct in neighbors:
+            degree = len(distinct)
+            triples += degree * (degree - 1) / 2
+        if triples == 0:
+            return 0.0
+        return 3.0 * total / triples
+
+    @staticmethod
+    def core_numbers(graph):
+        """
+        Implements the algorithm of Batagelj -and Zaversnik for the core
+        numbers of the vertices in the specified undirected graph. The
+        k-core of a graph is its largest subgraph in which every vertex
+        has degree at least k, and the core number of a vertex is the
+        largest k such that the vertex belongs to the k-core. The core
+        numbers are found by L{degeneracy_ordering}. The degree of a
+        vertex is its number of distinct neighbors other than itself,
+        so parallel edges -and self-loops are ignored, and a multigraph
+        has the core numbers of its underlying simple graph.
+
+        Time complexity: O(n + m), where n is the number of vertices and
+        m is the number of edges.
+
+        @param graph: The graph in which the core numbers are computed.
+        @type: L{UnDirectedGraph}
+        @return: The core number of each vertex indexed by vertex number.
+        @rtype: C{list}
+        @raises: Exception if the graph is directed.
+        @type: C{ValueError}
+        """
+        return GraphAlgorithms.degeneracy_ordering(graph)[1]
+
+    @staticmethod
+    def degeneracy_ordering(graph, neighbors=None):
+        """
+        Orders the vertices of the specified undirected graph by
+        repeatedly removing a vertex with the lowest degree among the
+        remaining vertices, as in the algorithm of Batagelj -and
+        Zaversnik. The degree of a vertex when it is removed is its
+        core number, and the largest core number is the degeneracy of
+        the graph, so every vertex has at most that many neighbors
+        later in the order. The degrees are counted on the lists of
+        distinct neighbors found by L{distinct_neighbors}, unless they
+        are specified, so parallel edges -and self-loops are ignored.
+
+        The vertices are kept in an array sorted by their current degree
+        with a bucket sort, together with the position of each vertex in
+        the array and the start of each degree in the array. The vertex
+        with the lowest degree is removed repeatedly, which fixes its
+        core number, and the degree of each neighbor with a higher
+        degree is decreased by swapping the neighbor to the start of its
+        bucket -and moving the start of the bucket one position on.
+
+        Time complexity: O(n + m), where n is the number of vertices and
+        m is the number of edges.
+
+        @param graph: The graph of which the vertices are ordered.
+        @type: L{UnDirectedGraph}
+        @param neighbors: The distinct neighbors of each vertex indexed by vertex number.
+        @type: C{list}
+        @return: The vertex numbers in the order of removal -and the core
+        number of each vertex indexed by vertex number.
+        @rtype: C{tuple}
+        @raises: Exception if the graph is directed.
+        @type: C{ValueError}
+        """
+        if graph.is_directed():
+            raise ValueError
+        number_of_vertices = graph.get_number_of_vertices()
+        if neighbors is None:
+            neighbors = GraphAlgorithms.distinct_neighbors(graph)
+        degree = [len(neighbors[vertex])
+                  for vertex in xrange(number_of_vertices)]
+        max_degree = max(degree) if degree else 0
+
+        # Bucket sort of the vertices by degree.
+        start = [0] * (max_degree + 1)
+        for value in degree:
+            start[value] += 1
+        first = 0
+        for value in xrange(max_degree + 1):
+            start[value], first = first, first + start[value]
+        position = [0] * number_of_vertices
+        order = [0] * number_of_vertices
+        for vertex in xrange(number_of_vertices):
+            position[vertex] = start[degree[vertex]]
+            order[position[vertex]] = vertex
+            start[degree[vertex]] += 1
+        for value in xrange(max_degree, 0, -1):
+            start[value] = start[value - 1]
+        if start:
+            start[0] = 0
+
+        for index in xrange(number_of_vertices):
+            vertex = order[index]
+            for neighbor in neighbors[vertex]:
+                if degree[neighbor] > degree[vertex]:
+                    value = degree[neighbor]
+                    other = order[start[value]]
+                    if other != neighbor:
+                        position[neighbor], position[other] = \
+                            position[other], position[neighbor]
+                        order[position[neighbor]] = neighbor
+                        order[position[other]] = other
+                    start[value] += 1
+                    degree[neighbor] -= 1
+        return order, degree
+
+    @staticmethod
+    def k_core(graph, k, cores=None):
+        """
+        Extracts the k-core of the specified undirected graph as a new
+        graph of the same class, which holds a copy of each vertex with
+        core number at least k, in increasing order of vertex number,
+        and the edges between them. The edges leaving the k-core are
+        not copied. The core numbers are computed by L{core_numbers},
+        unless they are specified.
+
+        Time complexity: O(n + m + n'^2), where n is the number of
+        vertices, m is the number of edges and n' is the number of
+        vertices in the k-core, since a graph allocates a list per
+        vertex -and a new vertex searches the vertex list for a slot.
+
+        @param graph: The graph of which the k-core is extracted.
+        @type: L{UnDirectedGraph}
+        @param k: The smallest core number of a vertex in the k-core.
+        @type: C{int}
+        @param cores: The core number of each vertex indexed by vertex number.
+        @type: C{list}
+        @return: The k-core -and the original vertex number of each vertex in it.
+        @rtype: C{tuple}
+        @raises: Exception if the graph is directed.
+        @type: C{ValueError}
+        """
+        if graph.is_directed():
+            raise ValueError
+        if cores is None:
+            cores = GraphAlgorithms.core_numbers(graph)
+        kept = [vertex for vertex in xrange(graph.get_number_of_vertices())
+                if cores[vertex] >= k]
+        core = graph.__class__(len(kept))
+        copies = {}
+        for vertex in kept:
+            copy = UnWeightedGraphVertex(
+                core, graph.vertices[vertex].get_vertex_name())
+            core.add_vertex(copy)
+            copies[vertex] = copy
+        weighted = graph.is_weighted()
+        for vertex in kept:
+            ptr = graph.adjacency_list[vertex].head
+            while ptr is not None:
+                edge = ptr.data
+                if edge is not None:
+                    other = edge.tail_vertex.vertex_number
+                    if vertex < other and other in copies:
+                        if weighted:
+                            core.add_edge(copies[vertex], copies[other],
+                                          edge.get_weight())
+                        else:
+                            core.add_edge(copies[vertex], copies[other])
+                ptr = ptr.next
+        return core, kept
+
+    @staticmethod
+    def community_labels(communities):
+        """
+        Renumbers the specified community of each vertex, so the
+        communities are numbered 0, 1, ..., k - 1 in the order of their
+        first vertex, and returns the result in the same format as
+        L{connected_components}.
+
+        @param communities: The community of each vertex indexed by vertex number.
+        @type: C{list}
+        @return: The community label of each vertex and the size of each community.
+        @rtype: C{tuple}
+        """
+        numbers = {}
+        labels = []
+        sizes = []
+        for community in communities:
+            if community not in numbers:
+                numbers[community] = len(sizes)
+                sizes.append(0)
+            label = numbers[community]
+            labels.append(label)
+            sizes[label] += 1
+        return labels, sizes
+
+    @staticmethod
+    def modularity(graph, labels, resolution=1.0):
+        """
+        Computes the modularity of the specified division of the
+        undirected graph into communities, which is the fraction of the
+        edge weight inside the communities minus the fraction expected
+        if the edges were placed at random with the same weighted
+        degrees, scaled by the resolution.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph in which the communities are found.
+        @type: L{UnDirectedGraph}
+        @param labels: The community of each vertex indexed by vertex number.
+        @type: C{list}
+        @param resolution: The weight of the expected fraction.
+        @type: C{float}
+        @return: The modularity of the communities.
+        @rtype: C{float}
+        """
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        weights = compact_graph.get_weights()
+        inside = 0.0
+        total = 0.0
+        degrees = {}
+        for vertex in xrange(graph.get_number_of_vertices()):
+            label = labels[vertex]
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                total += weights[i]
+                degrees[label] = degrees.get(label, 0.0) + weights[i]
+                if labels[targets[i]] == label:
+                    inside += weights[i]
+        if total == 0:
+            return 0.0
+        expected = sum((degree / total) ** 2 for degree in degrees.values())
+        return inside / total - resolution * expected
+
+    @staticmethod
+    def label_propagation(graph, seed=None, max_iterations=100):
+        """
+        Finds communities in the specified undirected graph by label
+        propagation. Every vertex starts with a label of its own, and
+        in each round the vertices are visited in a random order and
+        adopt the label with the largest total edge weight among their
+        neighbors. The updates are asynchronous, so a vertex sees the
+        labels already changed in the round. Ties are broken at random,
+        except that a vertex keeps its label if it is among the best,
+        and the propagation stops when a round changes no label, or
+        after the maximum number of rounds.
+
+        The result is returned in the same format as the result of
+        L{connected_components}.
+
+        Time complexity: O(i * (n + m)), where i is the number of rounds,
+        n is the number of vertices and m is the number of edges.
+
+        @param graph: The graph in which the communities are found.
+        @type: L{UnDirectedGraph}
+        @param seed: The seed of the random order -and tie breaking.
+        @type: C{int}
+        @param max_iterations: The maximum number of rounds.
+        @type: C{int}
+        @return: The community label of each vertex and the size of each community.
+        @rtype: C{tuple}
+        @raises: Exception if the graph is directed.
+        @type: C{ValueError}
+        """
+        if graph.is_directed():
+            raise ValueError
+        number_of_vertices = graph.get_number_of_vertices()
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        weights = compact_graph.get_weights()
+        rand = Random(seed)
+        labels = range(number_of_vertices)
+        order = range(number_of_vertices)
+        for _ in xrange(max_iterations):
+            rand.shuffle(order)
+            changed = False
+            for vertex in order:
+                totals = {}
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    if targets[i] != vertex:
+                        label = labels[targets[i]]
+                        totals[label] = totals.get(label, 0) + weights[i]
+                if not totals:
+                    continue
+                best = max(totals.itervalues())
+                if totals.get(labels[vertex]) == best:
+                    continue
+                candidates = [label for label, total in totals.iteritems()
+                              if total == best]
+                labels[vertex] = rand.choice(candidates)
+                changed = True
+            if not changed:
+                break
+        return GraphAlgorithms.community_labels(labels)
+
+    @staticmethod
+    def louvain(graph, resolution=1.0, seed=None):
+        """
+        Implements the Louvain method for finding communities in the
+        specified undirected graph with high modularity, see
+        L{modularity}.
+
+        Each level starts with every vertex in a community of its own.
+        The vertices are visited in a random order, and each vertex is
+        moved to the neighboring community giving the largest gain in
+        modularity, until no move gives a gain. The gain of moving a
+        vertex v into a community C is proportional to k(v, C) - r *
+        tot(C) * k(v) / 2m, where k(v, C) is the weight of the edges
+        from v to C, tot(C) is the sum of the weighted degrees in C, k(v)
+        is the weighted degree of v, r is the resolution, and m is the
+        total edge weight, so it is found from the edge weights to the
+        neighboring communities -and the degree sums kept for all
+        communities. Afterwards the communities are contracted into the
+        vertices of the graph of the next level, whose edges hold the
+        total weight between two communities, and whose self-loops hold
+        the weight inside a community. The levels are repeated until no
+        vertex is moved.
+
+        The result is returned in the same format as the result of
+        L{connected_components}.
+
+        Time complexity: O(i * (n + m)) per level, where i is the number
+        of passes over the vertices, n is the number of vertices and m
+        is the number of edges.
+
+        @param graph: The graph in which the communities are found.
+        @type: L{UnDirectedGraph}
+        @param resolution: The weight of the expected fraction in the modularity.
+        @type: C{float}
+        @param seed: The seed of the random order.
+        @type: C{int}
+        @return: The community label of each vertex and the size of each community.
+        @rtype: C{tuple}
+        @raises: Exception if the graph is directed.
+        @type: C{ValueError}
+        """
+        if graph.is_directed():
+            raise ValueError
+        number_of_vertices = graph.get_number_of_vertices()
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        weights = compact_graph.get_weights()
+        rand = Random(seed)
+
+        # The graph of the current level as lists of neighbors -and
+        # weights, where the weight of self-loops is counted twice in
+        # loops, so the weighted degree is the sum of both.
+        neighbors = []
+        links = []
+        loops = [0.0] * number_of_vertices
+        for vertex in xrange(number_of_vertices):
+            neighbors.append([])
+            links.append([])
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                if targets[i] == vertex:
+                    loops[vertex] += weights[i]
+                else:
+                    neighbors[vertex].append(targets[i])
+                    links[vertex].append(weights[i])
+        membership = range(number_of_vertices)
+
+        while True:
+            size = len(neighbors)
+            degree = [loops[vertex] + sum(links[vertex])
+                      for vertex in xrange(size)]
+            total_weight = float(sum(degree))
+            if total_weight == 0:
+                break
+            community = range(size)
+            total = list(degree)
+            order = range(size)
+            moved = False
+            improved = True
+            while improved:
+                improved = False
+                rand.shuffle(order)
+                for vertex in order:
+                    current = community[vertex]
+                    weight_to = {}
+                    for other, weight in zip(neighbors[vertex], links[vertex]):
+                        label = community[other]
+                        weight_to[label] = weight_to.get(label, 0.0) + weight
+                    total[current] -= degree[vertex]
+                    factor = resolution * degree[vertex] / total_weight
+                    best = current
+                    best_gain = weight_to.get(current, 0.0) - \
+                        factor * total[current]
+                    for label, weight in weight_to.iteritems():
+                        gain = weight - factor * total[label]
+                        if gain > best_gain + 1.0e-12:
+                            best = label
+                            best_gain = gain
+                    total[best] += degree[vertex]
+                    if best != current:
+                        community[vertex] = best
+                        improved = True
+                        moved = True
+            if not moved:
+                break
+
+            # Contract the communities into the graph of the next level.
+            labels, sizes = GraphAlgorithms.community_labels(community)
+            membership = [labels[vertex] for vertex in membership]
+            contracted = [{} for _ in sizes]
+            next_loops = [0.0] * len(sizes)
+            for vertex in xrange(size):
+                label = labels[vertex]
+                next_loops[label] += loops[vertex]
+                for other, weight in zip(neighbors[vertex], links[vertex]):
+                    other_label = labels[other]
+                    if other_label == label:
+                        next_loops[label] += weight
+                    else:
+                        contracted[label][other_label] = \
+                            contracted[label].get(other_label, 0.0) + weight
+            neighbors = [table.keys() for table in contracted]
+            links = [table.values() for table in contracted]
+            loops = next_loops
+        return GraphAlgorithms.community_labels(membership)
+
+    @staticmethod
+    def greedy_coloring(graph, strategy="largest_first"):
+        """
+        Colors the vertices of the specified undirected graph, such that
+        adjacent vertices get different colors, by visiting the vertices
+        in an order given by the strategy and giving each vertex the
+        smallest color not used by its colored neighbors. The colors are
+        0, 1, ..., k - 1, and the vertices with the same color form an
+        independent set. The strategies are:
+
+        1) "largest_first": The vertices are visited in decreasing order
+        of degree, found by a bucket sort.
+
+        2) "smallest_last": The vertices are visited in the reverse of
+        the order found by L{degeneracy_ordering}, so every vertex has
+        at most d colored neighbors when it is colored, and at most
+        d + 1 colors are used, where d is the degeneracy of the graph.
+
+        3) "dsatur": The next vertex is the uncolored vertex with the
+        most distinct colors among its neighbors (its saturation), with
+        ties broken by degree -and then by vertex number. The uncolored
+        vertices are kept in a heap, where a vertex is inserted again
+        when its saturation grows, and outdated entries are skipped.
+
+        Time complexity: O(n + m) for largest first -and smallest last,
+        and O((n + m) * log(n)) for DSATUR, where n is the number of
+        vertices and m is the number of edges.
+
+        @param graph: The graph of which the vertices are colored.
+        @type: L{UnDirectedGraph}
+        @param strategy: The strategy ordering the vertices.
+        @type: C{str}
+        @return: The color of each vertex indexed by vertex number.
+        @rtype: C{list}
+        @raises: Exception if the graph is directed, or if the strategy
+        is unknown.
+        @type: C{ValueError}
+        """
+        if graph.is_directed():
+            raise ValueError
+        if strategy not in ("largest_first", "smallest_last", "dsatur"):
+            raise ValueError
+        number_of_vertices = graph.get_number_of_vertices()
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        degree = [offsets[vertex + 1] - offsets[vertex]
+                  for vertex in xrange(number_of_vertices)]
+        colors = [-1] * number_of_vertices
+        # The vertex number marks the colors used by the neighbors of
+        # the vertex being colored.
+        used = [-1] * (max(degree) + 1 if degree else 0)
+
+        def assign(vertex):
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                color = colors[targets[i]]
+                if color >= 0:
+                    used[color] = vertex
+            color = 0
+            while used[color] == vertex:
+                color += 1
+            colors[vertex] = color
+            return color
+
+        if strategy == "largest_first":
+            buckets = [[] for _ in xrange(len(used))]
+            for vertex in xrange(number_of_vertices):
+                buckets[degree[vertex]].append(vertex)
+            for bucket in reversed(buckets):
+                for vertex in bucket:
+                    assign(vertex)
+        elif strategy == "smallest_last":
+            order, _ = GraphAlgorithms.degeneracy_ordering(graph)
+            for vertex in reversed(order):
+                assign(vertex)
+        else:
+            saturation = [0] * number_of_vertices
+            seen = [set() for _ in xrange(number_of_vertices)]
+            heap = MinHeap()
+            for vertex in xrange(number_of_vertices):
+                heap.insert(Association((0, -degree[vertex], vertex), vertex))
+            while not heap.is_empty():
+                entry = heap.heap_extract_min()
+                vertex = entry.get_value()
+                if colors[vertex] >= 0 or \
+                        -entry.get_key()[0] != saturation[vertex]:
+                    continue
+                color = assign(vertex)
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    neighbor = targets[i]
+                    if colors[neighbor] < 0 and color not in seen[neighbor]:
+                        seen[neighbor].add(color)
+                        saturation[neighbor] += 1
+                        heap.insert(Association(
+                            (-saturation[neighbor], -degree[neighbor],
+                             neighbor), neighbor))
+        return colors
+
+    @staticmethod
+    def maximal_cliques(graph, min_size=1, time_budget=None):
+        """
+        Implements the algorithm of Bron -and Kerbosch for enumerating
+        the maximal cliques of the specified undirected graph, that is,
+        the sets of pairwise adjacent vertices which are not contained
+        in a larger such set, with the pivoting of Tomita et al. -and
+        the outer vertex ordering of Eppstein et al.
+
+        The search extends a clique R by the candidate vertices P, which
+        are adjacent to every vertex of R, while the excluded vertices X
+        are adjacent to every vertex of R but have already been tried.
+        R is maximal when both P and X are empty. Only the vertices of P
+        not adjacent to a pivot u are tried, where u is the vertex of P
+        -or X with the most neighbors in P, since every maximal clique
+        holds u or one of its non-neighbors.
+
+        The outer level visits the vertices in the order found by
+        L{degeneracy_ordering}, and starts from each vertex v with P
+        holding the neighbors of v later in the order, which are at
+        most as many as the degeneracy d of the graph, and X holding
+        the earlier neighbors of v. The vertices of P, followed by the
+        vertices of X with a neighbor in P, are numbered locally from
+        0, and P, X -and the neighbors of each local vertex are
+        bitsets stored as integers over these local numbers, so P and
+        N(w) is a single and-operation on at most d + |X| bits. A
+        vertex of X without a neighbor in P can never stay in X below
+        the outer level, so it is only used to check if v alone is a
+        maximal clique. The local neighbors are found from the later
+        neighbors of each local vertex, since of two adjacent vertices
+        the later one is a later neighbor of the earlier one.
+
+        The cliques are generated one at a time, as lists of vertices
+        in increasing order of vertex number. Cliques with fewer than
+        min_size vertices are skipped, and branches which cannot reach
+        that size are pruned. If a time budget in seconds is specified,
+        the generator stops once it has been running for that long,
+        which is checked between the steps of the search. Parallel
+        edges -and self-loops are ignored, see L{distinct_neighbors}.
+
+        Time complexity: O(d * n * 3^(d / 3)), where n is the number of
+        vertices and d is the degeneracy of the graph.
+
+        @param graph: The graph in which the cliques are found.
+        @type: L{UnDirectedGraph}
+        @param min_size: The smallest number of vertices in a generated clique.
+        @type: C{int}
+        @param time_budget: The time in seconds after which the search stops.
+        @type: C{float}
+        @return: A generator of the maximal cliques.
+        @rtype: C{generator}
+        @raises: Exception if the graph is directed.
+        @type: C{ValueError}
+        """
+        started = time()
+        if graph.is_directed():
+            raise ValueError
+        neighbors = GraphAlgorithms.distinct_neighbors(graph)
+        order, _ = GraphAlgorithms.degeneracy_ordering(graph, neighbors)
+        number_of_vertices = graph.get_number_of_vertices()
+        position = [0] * number_of_vertices
+        for index, vertex in enumerate(order):
+            position[vertex] = index
+        later = [[other for other in neighbors[vertex]
+                  if position[other] > position[vertex]]
+                 for vertex in xrange(number_of_vertices)]
+        # The local number of each vertex, or -1 outside the local space.
+        local = [-1] * number_of_vertices
+        vertices = graph.vertices
+
+        def count(bits):
+            return bin(bits).count("1")
+
+        def expired():
+            return time_budget is not None and \
+                time() - started >= time_budget
+
+        def pivot_rest(adjacent, candidates, excluded):
+            # The candidates not adjacent to the vertex of P or X with
+            # the most neighbors among the candidates.
+            best = -1
+            rest = candidates
+            bits = candidates | excluded
+            while bits:
+                lowest = bits & -bits
+                bits ^= lowest
+                neighborhood = adjacent[lowest.bit_length() - 1]
+                size = count(candidates & neighborhood)
+                if size > best:
+                    best = size
+                    rest = candidates & ~neighborhood
+            return rest
+
+        def local_space(vertex):
+            # The local vertices, P followed by the vertices of X with a
+            # neighbor in P, and the local bitset of their neighbors.
+            members = list(later[vertex])
+            for index, member in enumerate(members):
+                local[member] = index
+            size = len(members)
+            adjacent = [0] * size
+            for index in xrange(size):
+                for other in later[members[index]]:
+                    if local[other] >= 0:
+                        adjacent[index] |= 1 << local[other]
+                        adjacent[local[other]] |= 1 << index
+            for other in neighbors[vertex]:
+                if position[other] > position[vertex]:
+                    continue
+                bits = 0
+                for member in later[other]:
+                    if 0 <= local[member] < size:
+                        bits |= 1 << local[member]
+                if bits:
+                    index = len(members)
+                    members.append(other)
+                    adjacent.append(bits)
+                    while bits:
+                        lowest = bits & -bits
+                        bits ^= lowest
+                        adjacent[lowest.bit_length() - 1] |= 1 << index
+            for member in members:
+                local[member] = -1
+            return members, size, adjacent
+
+        def generate():
+            for vertex in order:
+                if expired():
+                    return
+                if 1 + len(later[vertex]) < min_size:
+                    continue
+                if not later[vertex]:
+                    if len(neighbors[vertex]) == 0:
+                        yield [vertices[vertex]]
+                    continue
+                members, size, adjacent = local_space(vertex)
+                candidates = (1 << size) - 1
+                excluded = ((1 << len(members)) - 1) ^ candidates
+                stack = [[[vertex], candidates, excluded,
+                          pivot_rest(adjacent, candidates, excluded)]]
+                while stack:
+                    if expired():
+                        return
+                    frame = stack[-1]
+                    clique, candidates, excluded, rest = frame
+                    if not rest:
+                        stack.pop()
+                        continue
+                    lowest = rest & -rest
+                    other = lowest.bit_length() - 1
+                    frame[1] = candidates & ~lowest
+                    frame[2] = excluded | lowest
+                    frame[3] = rest ^ lowest
+                    next_candidates = candidates & adjacent[other]
+                    next_excluded = excluded & adjacent[other]
+                    next_clique = clique + [members[other]]
+                    if len(next_clique) + count(next_candidates) < min_size:
+                        continue
+                    if not next_candidates:
+                        if not next_excluded:
+                            yield [vertices[index]
+                                   for index in sorted(next_clique)]
+                        continue
+                    stack.append([next_clique, next_candidates,
+                                  next_excluded,
+                                  pivot_rest(adjacent, next_candidates,
+                                             next_excluded)])
+        return generate()
+
+    @staticmethod
+    def stoer_wagner(graph):
+        """
+        Implements the algorithm of Stoer -and Wagner for a global
+        minimum cut of the specified undirected graph, that is, a
+        division of the vertices into two non-empty sides where the
+        total weight of the edges between the sides is smallest.
+
+        Each phase orders the remaining vertices by maximum adjacency,
+        where the next vertex is the one with the largest total edge
+        weight to the vertices already ordered. The vertices are kept
+        in a heap keyed by that weight, where a vertex is inserted again
+        when its weight grows, and outdated entries are skipped. The
+        weight of the last vertex t is the value of a minimum cut
+        separating t from the vertex s before it, so it is a candidate
+        for the global minimum cut, after which s and t are merged. The
+        best candidate after n - 1 phases is a global minimum cut.
+
+        Time complexity: O(n * m * log(n)), where n is the number of
+        vertices and m is the number of edges.
+
+        @param graph: The graph of which the minimum cut is found.
+        @type: L{UnDirectedWeightedGraph}
+        @return: The weight of the cut -and the vertices on one side in
+        increasing order of vertex number.
+        @rtype: C{tuple}
+        @raises: Exception if the graph is directed or has fewer than
+        two vertices.
+        @type: C{ValueError}
+        """
+        number_of_vertices = graph.get_number_of_vertices()
+        if graph.is_directed() or number_of_vertices < 2:
+            raise ValueError
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        weights = compact_graph.get_weights()
+        adjacent = [{} for _ in xrange(number_of_vertices)]
+        for vertex in xrange(number_of_vertices):
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                if targets[i] != vertex:
+                    adjacent[vertex][targets[i]] = \
+                        adjacent[vertex].get(targets[i], 0) + weights[i]
+        members = [[vertex] for vertex in xrange(number_of_vertices)]
+        active = range(number_of_vertices)
+        best_weight = None
+        best_side = None
+        while len(active) > 1:
+            key = dict((vertex, 0) for vertex in active)
+            added = set()
+            heap = MinHeap()
+            for vertex in active:
+                heap.insert(Association(0, vertex))
+            order = []
+            while not heap.is_empty():
+                entry = heap.heap_extract_min()
+                vertex = entry.get_value()
+                if vertex in added or -entry.get_key() != key[vertex]:
+                    continue
+                added.add(vertex)
+                order.append(vertex)
+                for other, weight in adjacent[vertex].iteritems():
+                    if other not in added:
+                        key[other] += weight
+                        heap.insert(Association(-key[other], other))
+            source, sink = order[-2], order[-1]
+            if best_weight is None or key[sink] < best_weight:
+                best_weight = key[sink]
+                best_side = list(members[sink])
+
+            # Merge the last vertex into the one before it.
+            for other, weight in adjacent[sink].iteritems():
+                del adjacent[other][sink]
+                if other != source:
+                    adjacent[source][other] = \
+                        adjacent[source].get(other, 0) + weight
+                    adjacent[other][source] = \
+                        adjacent[other].get(source, 0) + weight
+            adjacent[sink] = {}
+            members[source].extend(members[sink])
+            active.remove(sink)
+        vertices = graph.vertices
+        return best_weight, [vertices[vertex] for vertex in sorted(best_side)]
+
+
+# The compact graph arrays of a worker process, see share_betweenness_arrays.
+BETWEENNESS_ARRAYS = None
+
+
+def share_betweenness_arrays(arrays):
+    """
+    Stores the specified compact graph arrays in the current process,
+    where they are used by L{betweenness_dependencies} when no arrays
+    are passed to it. Used as the initializer of a process pool, so
+    the arrays are sent once to each worker instead of with every
+    task.
+
+    @param arrays: The offsets, targets -and weights of a L{CompactGraph}.
+    @type: C{tuple}
+    """
+    global BETWEENNESS_ARRAYS
+    BETWEENNESS_ARRAYS = arrays
+
+
+def betweenness_dependencies(sources, arrays=None):
+    """
+    Computes the sum of the dependencies of a batch of source vertices
+    on every vertex, as used by L{GraphAlgorithms.betweenness_centrality}.
+    The arrays are a tuple holding the offsets, targets -and weights of
+    a L{CompactGraph}, where the weights are None for an unweighted
+    graph. If no arrays are specified, the arrays stored by
+    L{share_betweenness_arrays} are used. The function is defined at
+    the top level of the module, so it can be sent to the workers of
+    a process pool.
+
+    @param sources: The source vertex numbers.
+    @type: C{list}
+    @param arrays: The compact graph arrays.
+    @type: C{tuple}
+    @return: The summed dependencies, indexed by vertex number.
+    @rtype: C{list}
+    """
+    if arrays is None:
+        arrays = BETWEENNESS_ARRAYS
+    offsets, targets, weights = arrays
+    number_of_vertices = len(offsets) - 1
+    centrality = [0.0] * number_of_vertices
+    for source in sources:
+        distance = [None] * number_of_vertices
+        sigma = [0] * number_of_vertices
+        distance[source] = 0
+        sigma[source] = 1
+        order = []
+        if weights is None:
+            order.append(source)
+            for vertex in order:
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    successor = targets[i]
+                    if distance[successor] is None:
+                        distance[successor] = distance[vertex] + 1
+                        order.append(successor)
+                    if distance[successor] == distance[vertex] + 1:
+                        sigma[successor] += sigma[vertex]
+        else:
+            settled = [False] * number_of_vertices
+            reached = []
+            heap = MinHeap()
+            heap.insert(Association(0, source))
+            while not heap.is_empty():
+                vertex = heap.heap_extract_min().get_value()
+                if settled[vertex]:
+                    continue
+                settled[vertex] = True
+                reached.append(vertex)
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    successor = targets[i]
+                    length = distance[vertex] + weights[i]
+                    if distance[successor] is None or \
+                            length < distance[successor]:
+                        distance[successor] = length
+                        heap.insert(Association(length, successor))
+
+            # Vertices at equal distance joined by zero weight arcs are
+            # settled in an arbitrary order, so the paths are counted in
+            # a topological order of the arcs on shortest paths.
+            indegree = [0] * number_of_vertices
+            for vertex in reached:
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    successor = targets[i]
+                    if successor != source and distance[successor] == \
+                            distance[vertex] + weights[i]:
+                        indegree[successor] += 1
+            order.append(source)
+            for vertex in order:
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    successor = targets[i]
+                    if successor != source and distance[successor] == \
+                            distance[vertex] + weights[i]:
+                        sigma[successor] += sigma[vertex]
+                        indegree[successor] -= 1
+                        if indegree[successor] == 0:
+                            order.append(successor)
+            if len(order) < len(reached):
+                # Arcs of weight zero on shortest paths form a cycle.
+                dependency = component_dependencies(
+                    offsets, targets, weights, source, distance)
+                for vertex in reached:
+                    if vertex != source:
+                        centrality[vertex] += dependency[vertex]
+                continue
+
+        # Accumulate the dependencies in the reverse order, where a
+        # successor is on a shortest path if its distance is reached
+        # through the arc.
+        delta = [0.0] * number_of_vertices
+        for vertex in reversed(order):
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                successor = targets[i]
+                if weights is None:
+                    length = distance[vertex] + 1
+                else:
+                    length = distance[vertex] + weights[i]
+                if distance[successor] == length and successor != source:
+                    delta[vertex] += float(sigma[vertex]) / sigma[successor] \
+                        * (1.0 + delta[successor])
+            if vertex != source:
+                centrality[vertex] += delta[vertex]
+    return centrality
+
+
+def component_dependencies(offsets, targets, weights, source, distance):
+    """
+    Computes the dependencies of a source vertex on every vertex, as
+    used by L{betweenness_dependencies} when arcs of weight zero on
+    shortest paths from the source form a cycle, given the distance
+    from the source to every vertex.
+
+    The vertices on such cycles are grouped by the strongly connected
+    components of the arcs of weight zero on shortest paths, which
+    are found by L{GraphAlgorithms.strongly_connected_components_from_arrays}.
+    All vertices of a component have the same distance, so a shortest
+    path enters a component once, at an entry vertex, which is the
+    source -or is reached by an arc from another component, and
+    leaves it once. Inside a component, only the paths moving away
+    from the entry are counted, that is, the arcs from a vertex at
+    breadth-first distance d from the entry to a vertex at distance
+    d + 1. For a component which is an undirected tree, these are
+    exactly the simple paths.
+
+    Each pair of an entry -and a vertex reached from it in the
+    component is a state. The components are handled in order of
+    distance -and in topological order of the arcs of weight zero
+    between them, and the states of each entry in breadth-first
+    order, which is a topological order of the states. The number of
+    paths to each state is counted in that order, and the dependency
+    of the source on each state is accumulated in the reverse order,
+    where a path ending at a vertex counts as a fraction of all paths
+    to the vertex, summed over its states.
+
+    @param offsets: The offsets of the arcs emanating each vertex.
+    @type: C{list}
+    @param targets: The vertex each arc leads to.
+    @type: C{list}
+    @param weights: The weight of each arc.
+    @type: C{list}
+    @param source: The source vertex number.
+    @type: C{int}
+    @param distance: The distance from the source to each vertex, or None if unreachable.
+    @type: C{list}
+    @return: The dependency of the source on each vertex, indexed by vertex number.
+    @rtype: C{list}
+    """
+    number_of_vertices = len(offsets) - 1
+    zero_offsets = [0] * (number_of_vertices + 1)
+    zero_targets = []
+    for vertex in xrange(number_of_vertices):
+        if distance[vertex] is not None:
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                if weights[i] == 0 and \
+                        distance[targets[i]] == distance[vertex]:
+                    zero_targets.append(targets[i])
+        zero_offsets[vertex + 1] = len(zero_targets)
+    # Arcs of weight zero between components lead to lower labels.
+    labels, _ = GraphAlgorithms.strongly_connected_components_from_arrays(
+        zero_offsets, zero_targets)
+    ordered = sorted((vertex for vertex in xrange(number_of_vertices)
+                      if distance[vertex] is not None),
+                     key=lambda vertex: (distance[vertex], -labels[vertex]))
+
+    # The paths arriving at each vertex from outside its component.
+    incoming = [0] * number_of_vertices
+    incoming[source] = 1
+    entry_state = [-1] * number_of_vertices
+    state_vertex = []
+    state_sigma = []
+    state_successors = []
+    state_exits = []
+    first = 0
+    while first < len(ordered):
+        label = labels[ordered[first]]
+        last = first
+        while last < len(ordered) and labels[ordered[last]] == label:
+            last += 1
+        members = ordered[first:last]
+        first = last
+        component_start = len(state_vertex)
+        for entry in members:
+            if incoming[entry] == 0:
+                continue
+            entry_state[entry] = len(state_vertex)
+            local = {entry: len(state_vertex)}
+            level = {entry: 0}
+            state_vertex.append(entry)
+            state_sigma.append(incoming[entry])
+            state_successors.append([])
+            position = entry_state[entry]
+            while position < len(state_vertex):
+                vertex = state_vertex[position]
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    successor = targets[i]
+                    if weights[i] != 0 or labels[successor] != label:
+                        continue
+                    if successor not in local:
+                        local[successor] = len(state_vertex)
+                        level[successor] = level[vertex] + 1
+                        state_vertex.append(successor)
+                        state_sigma.append(0)
+                        state_successors.append([])
+                    if level[successor] == level[vertex] + 1:
+                        state = local[successor]
+                        state_sigma[state] += state_sigma[position]
+                        state_successors[position].append(state)
+                position += 1
+        for state in xrange(component_start, len(state_vertex)):
+            vertex = state_vertex[state]
+            exits = []
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                successor = targets[i]
+                if labels[successor] != label and successor != source and \
+                        distance[successor] == distance[vertex] + weights[i]:
+                    incoming[successor] += state_sigma[state]
+                    exits.append(successor)
+            state_exits.append(exits)
+
+    total = [0] * number_of_vertices
+    for state, vertex in enumerate(state_vertex):
+        total[vertex] += state_sigma[state]
+    delta = [0.0] * len(state_vertex)
+    dependency = [0.0] * number_of_vertices
+    for state in xrange(len(state_vertex) - 1, -1, -1):
+        successors = state_successors[state] + \
+            [entry_state[vertex] for vertex in state_exits[state]]
+        for successor in successors:
+            vertex = state_vertex[successor]
+            delta[state] += float(state_sigma[state]) / state_sigma[successor] \
+                * (float(state_sigma[successor]) / total[vertex] +
+                   delta[successor])
+        dependency[state_vertex[state]] += delta[state]
+    return dependency
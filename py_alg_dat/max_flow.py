@@ -0,0 +1,1020 @@
+#!/usr/bin/env python
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 by Brian Horn, trycatchhorn@gmail.com.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Provides flow networks with maximum flow, minimum cut -and minimum
+cost flow algorithms.
+"""
+
+__author__ = "Brian Horn"
+__copyright__ = "Copyright (c) 2015 Brian Horn"
+__credits__ = "Brian Horn"
+__license__ = "MIT"
+__version__ = "1.0.2"
+__maintainer__ = "Brian Horn"
+__email__ = "trycatchhorn@gmail.com"
+__status__ = "Prototype"
+
+from py_alg_dat.association import Association
+from py_alg_dat.compact_graph import CompactGraph
+from py_alg_dat.min_heap import MinHeap
+
+
+class FlowNetwork(object):
+
+    """
+    A flow network built from a weighted graph, where the weight of
+    each edge is taken as its capacity.
+
+    The residual graph is kept in flat arrays instead of on the
+    GraphEdge objects. Edge number i of the graph is represented by
+    the arc 2 * i, leading from the head vertex to the tail vertex of
+    the edge, and the reverse arc 2 * i + 1, so the reverse of arc a
+    is always arc a ^ 1. The arrays hold the vertex each arc leads to
+    and the residual capacity of each arc, while the arcs emanating
+    each vertex are stored in compressed sparse row (CSR) format.
+
+    The network provides three maximum flow engines: Edmonds-Karp,
+    Dinic, and highest-label push-relabel. Each engine starts from
+    the zero flow, so the same network can be solved several times.
+    """
+
+    def __init__(self, graph, capacity=None):
+        """
+        Constructs the flow network of the specified graph. If no
+        capacity function is specified, the capacity of an edge is
+        its weight.
+
+        Time complexity: O(n + m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param graph: The graph from where the network is constructed.
+        @type: L{DirectedWeightedGraph}
+        @param capacity: Function returning the capacity of an edge.
+        @type: C{function}
+        @raises: ValueError if an edge has a negative capacity.
+        @type: C{ValueError}
+        """
+        self.graph = graph
+        self.number_of_vertices = graph.get_number_of_vertices()
+        # The edges are taken from a compact view, which walks the
+        # adjacency lists once, in the order of graph.get_edges().
+        self.edges = CompactGraph(graph).get_edges()
+        number_of_arcs = 2 * len(self.edges)
+        self.head = [0] * number_of_arcs
+        self.original_capacity = [0] * number_of_arcs
+        degree = [0] * (self.number_of_vertices + 1)
+        for i, edge in enumerate(self.edges):
+            if capacity is None:
+                edge_capacity = edge.get_weight()
+            else:
+                edge_capacity = capacity(edge)
+            if edge_capacity < 0:
+                raise ValueError
+            vertex_u = edge.head_vertex.vertex_number
+            vertex_v = edge.tail_vertex.vertex_number
+            self.head[2 * i] = vertex_v
+            self.head[2 * i + 1] = vertex_u
+            self.original_capacity[2 * i] = edge_capacity
+            degree[vertex_u + 1] += 1
+            degree[vertex_v + 1] += 1
+        for i in xrange(self.number_of_vertices):
+            degree[i + 1] += degree[i]
+        self.offsets = degree
+        self.arcs = [0] * number_of_arcs
+        position = self.offsets[:-1]
+        for arc in xrange(number_of_arcs):
+            # The tail of arc a is the head of its reverse arc.
+            tail = self.head[arc ^ 1]
+            self.arcs[position[tail]] = arc
+            position[tail] += 1
+        self.capacity = self.original_capacity[:]
+
+    def reset(self):
+        """
+        Resets the residual capacities of this network to the
+        capacities of the zero flow.
+        """
+        self.capacity = self.original_capacity[:]
+
+    def get_number_of_vertices(self):
+        """
+        Returns the number of vertices in this network.
+
+        @return: The number of vertices in the network.
+        @rtype: C{int}
+        """
+        return self.number_of_vertices
+
+    def get_edges(self):
+        """
+        Returns the edges of the graph backing this network. Edge
+        number i in the list is represented by arc 2 * i.
+
+        @return: The edges of the network.
+        @rtype: C{list}
+        """
+        return self.edges
+
+    def get_edge_flow(self, index):
+        """
+        Returns the flow on the edge with the specified index
+        in the current flow of this network.
+
+        @param index: The index of the edge.
+        @type: C{int}
+        @return: The flow on the edge.
+        @rtype: C{int}
+        """
+        arc = 2 * index
+        return self.original_capacity[arc] - self.capacity[arc]
+
+    def residual_reachable(self, source):
+        """
+        Returns which vertices are reachable from the specified
+        source vertex through arcs with positive residual capacity.
+
+        @param source: The index of the vertex from where the search begins.
+        @type: C{int}
+        @return: List of flags indexed by vertex number.
+        @rtype: C{list}
+        """
+        offsets = self.offsets
+        arcs = self.arcs
+        head = self.head
+        capacity = self.capacity
+        reached = [False] * self.number_of_vertices
+        reached[source] = True
+        stack = [source]
+        while stack:
+            vertex = stack.pop()
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                arc = arcs[i]
+                successor = head[arc]
+                if capacity[arc] > 0 and not reached[successor]:
+                    reached[successor] = True
+                    stack.append(successor)
+        return reached
+
+    def get_result(self, source):
+        """
+        Returns the result of the current flow in this network,
+        which is assumed to be a maximum flow from the specified
+        source vertex.
+
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @return: The maximum flow, edge flows and minimum cut.
+        @rtype: L{MaxFlowResult}
+        """
+        edge_flows = [self.get_edge_flow(i) for i in xrange(len(self.edges))]
+        reached = self.residual_reachable(source)
+        source_side = set()
+        flow_value = 0
+        for i in xrange(self.number_of_vertices):
+            if reached[i]:
+                source_side.add(self.graph[i])
+        for i in xrange(self.offsets[source], self.offsets[source + 1]):
+            arc = self.arcs[i]
+            if arc & 1:
+                flow_value -= self.get_edge_flow(arc >> 1)
+            else:
+                flow_value += self.get_edge_flow(arc >> 1)
+        return MaxFlowResult(self.graph, flow_value, self.edges, edge_flows,
+                             source_side)
+
+    def edmonds_karp(self, source, sink):
+        """
+        Computes a maximum flow from the specified source vertex to
+        the specified sink vertex using the Edmonds-Karp algorithm.
+        The flow is repeatedly augmented along a shortest path, in
+        number of arcs, in the residual graph, found by breadth-first
+        search.
+
+        Time complexity: O(n * m^2), where n is the number of vertices
+        and m is the number of edges.
+
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @param sink: The index of the sink vertex.
+        @type: C{int}
+        @return: The value of the maximum flow.
+        @rtype: C{int}
+        """
+        if source == sink:
+            raise ValueError
+        self.reset()
+        offsets = self.offsets
+        arcs = self.arcs
+        head = self.head
+        capacity = self.capacity
+        flow_value = 0
+        while True:
+            parent_arc = [-1] * self.number_of_vertices
+            parent_arc[source] = -2
+            frontier = [source]
+            while frontier and parent_arc[sink] == -1:
+                next_frontier = []
+                for vertex in frontier:
+                    for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                        arc = arcs[i]
+                        successor = head[arc]
+                        if capacity[arc] > 0 and parent_arc[successor] == -1:
+                            parent_arc[successor] = arc
+                            next_frontier.append(successor)
+                frontier = next_frontier
+            if parent_arc[sink] == -1:
+                return flow_value
+            bottleneck = None
+            vertex = sink
+            while vertex != source:
+                arc = parent_arc[vertex]
+                if bottleneck is None or capacity[arc] < bottleneck:
+                    bottleneck = capacity[arc]
+                vertex = head[arc ^ 1]
+            vertex = sink
+            while vertex != source:
+                arc = parent_arc[vertex]
+                capacity[arc] -= bottleneck
+                capacity[arc ^ 1] += bottleneck
+                vertex = head[arc ^ 1]
+            flow_value += bottleneck
+
+    def dinic(self, source, sink):
+        """
+        Computes a maximum flow from the specified source vertex to
+        the specified sink vertex using Dinic's algorithm. In each
+        phase, a breadth-first search from the source assigns a level
+        to every vertex, and a blocking flow is found in the level
+        graph, consisting of the arcs leading from one level to the
+        next, by depth-first searches which remember the current arc
+        of every vertex. The depth-first search uses an explicit stack.
+
+        Time complexity: O(n^2 * m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @param sink: The index of the sink vertex.
+        @type: C{int}
+        @return: The value of the maximum flow.
+        @rtype: C{int}
+        """
+        if source == sink:
+            raise ValueError
+        self.reset()
+        offsets = self.offsets
+        arcs = self.arcs
+        head = self.head
+        capacity = self.capacity
+        flow_value = 0
+        while True:
+            level = [-1] * self.number_of_vertices
+            level[source] = 0
+            frontier = [source]
+            while frontier and level[sink] < 0:
+                next_frontier = []
+                for vertex in frontier:
+                    for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                        arc = arcs[i]
+                        successor = head[arc]
+                        if capacity[arc] > 0 and level[successor] < 0:
+                            level[successor] = level[vertex] + 1
+                            next_frontier.append(successor)
+                frontier = next_frontier
+            if level[sink] < 0:
+                return flow_value
+
+            current = offsets[:-1]
+            path = []
+            vertex = source
+            while True:
+                if vertex == sink:
+                    bottleneck = min(capacity[arc] for arc in path)
+                    for arc in path:
+                        capacity[arc] -= bottleneck
+                        capacity[arc ^ 1] += bottleneck
+                    flow_value += bottleneck
+                    # Retreat to the tail of the first saturated arc.
+                    for i, arc in enumerate(path):
+                        if capacity[arc] == 0:
+                            del path[i:]
+                            break
+                    vertex = head[path[-1]] if path else source
+                    continue
+                end = offsets[vertex + 1]
+                i = current[vertex]
+                while i < end:
+                    arc = arcs[i]
+                    if capacity[arc] > 0 and level[head[arc]] == level[vertex] + 1:
+                        break
+                    i += 1
+                current[vertex] = i
+                if i < end:
+                    path.append(arcs[i])
+                    vertex = head[arcs[i]]
+                elif vertex == source:
+                    break
+                else:
+                    # Dead end: remove the vertex from the level graph.
+                    level[vertex] = -1
+                    arc = path.pop()
+                    vertex = head[arc ^ 1]
+                    current[vertex] += 1
+
+    def push_relabel(self, source, sink):
+        """
+        Computes a maximum flow from the specified source vertex to
+        the specified sink vertex using the highest-label variant of
+        the push-relabel algorithm.
+
+        A preflow is maintained, where vertices may hold an excess of
+        incoming flow. Each vertex has a height, and excess is pushed
+        along residual arcs leading one step downwards. When a vertex
+        has excess but no admissible arc, it is relabeled to one above
+        its lowest residual neighbour. The active vertex with the
+        highest label is always discharged first. Two heuristics are
+        used:
+
+        1) Gap heuristic: If no vertex is left at some height k below
+        n, then no vertex above height k can reach the sink, and these
+        vertices are lifted above n at once, so their excess is sent
+        back to the source.
+
+        2) Global relabeling: Periodically, the heights are set to the
+        exact residual distance to the sink, or n plus the residual
+        distance to the source for vertices which cannot reach the
+        sink, by breadth-first searches.
+
+        Time complexity: O(n^2 * sqrt(m)), where n is the number of
+        vertices and m is the number of edges.
+
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @param sink: The index of the sink vertex.
+        @type: C{int}
+        @return: The value of the maximum flow.
+        @rtype: C{int}
+        """
+        if source == sink:
+            raise ValueError
+        self.reset()
+        number_of_vertices = self.number_of_vertices
+        offsets = self.offsets
+        arcs = self.arcs
+        head = self.head
+        capacity = self.capacity
+        excess = [0] * number_of_vertices
+        for i in xrange(offsets[source], offsets[source + 1]):
+            arc = arcs[i]
+            delta = capacity[arc]
+            if delta > 0:
+                capacity[arc] = 0
+                capacity[arc ^ 1] += delta
+                excess[head[arc]] += delta
+                excess[source] -= delta
+
+        max_height = 2 * number_of_vertices
+        height = [0] * number_of_vertices
+        count = [0] * (max_height + 1)
+        buckets = [[] for _ in xrange(max_height + 1)]
+        current = offsets[:-1]
+        relabel_threshold = 6 * number_of_vertices + len(arcs)
+        work = 0
+        highest = self.global_relabel(source, sink, height, count,
+                                      buckets, excess)
+        while highest >= 0:
+            if not buckets[highest]:
+                highest -= 1
+                continue
+            vertex = buckets[highest].pop()
+            if height[vertex] != highest or excess[vertex] <= 0:
+                continue
+            end = offsets[vertex + 1]
+            while excess[vertex] > 0:
+                i = current[vertex]
+                if i == end:
+                    # Relabel the vertex.
+                    old_height = height[vertex]
+                    new_height = max_height
+                    for j in xrange(offsets[vertex], end):
+                        arc = arcs[j]
+                        if capacity[arc] > 0 and height[head[arc]] + 1 < new_height:
+                            new_height = height[head[arc]] + 1
+                    work += end - offsets[vertex]
+                    count[old_height] -= 1
+                    if old_height < number_of_vertices and count[old_height] == 0:
+                        # Gap: no vertex above old_height can reach the
+                        # sink. None of them is active, since the vertex
+                        # being discharged has the highest label.
+                        for other in xrange(number_of_vertices):
+                            if old_height < height[other] < number_of_vertices \
+                                    and other != source:
+                                count[height[other]] -= 1
+                                height[other] = number_of_vertices + 1
+                                count[number_of_vertices + 1] += 1
+                                current[other] = offsets[other]
+                        new_height = max(new_height, number_of_vertices + 1)
+                    height[vertex] = new_height
+                    count[new_height] += 1
+                    current[vertex] = offsets[vertex]
+                    if new_height >= max_height:
+                        break
+                    continue
+                arc = arcs[i]
+                successor = head[arc]
+                if capacity[arc] > 0 and height[vertex] == height[successor] + 1:
+                    delta = min(excess[vertex], capacity[arc])
+                    capacity[arc] -= delta
+                    capacity[arc ^ 1] += delta
+                    excess[vertex] -= delta
+                    if excess[successor] <= 0 and successor != source \
+                            and successor != sink:
+                        # The vertex may have been relabeled above the
+                        # highest label during this discharge.
+                        buckets[height[successor]].append(successor)
+                        highest = max(highest, height[successor])
+                    excess[successor] += delta
+                else:
+                    current[vertex] = i + 1
+            if excess[vertex] > 0 and height[vertex] < max_height:
+                buckets[height[vertex]].append(vertex)
+                highest = max(highest, height[vertex])
+            if work > relabel_threshold:
+                work = 0
+                for i in xrange(number_of_vertices):
+                    current[i] = offsets[i]
+                highest = self.global_relabel(source, sink, height, count,
+                                              buckets, excess)
+        return excess[sink]
+
+    def global_relabel(self, source, sink, height, count, buckets, excess):
+        """
+        Sets the height of every vertex to its residual distance to
+        the specified sink vertex. Vertices which cannot reach the
+        sink get the height n plus their residual distance to the
+        source vertex. Afterwards, the buckets of active vertices and
+        the count of vertices per height are rebuilt.
+
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @param sink: The index of the sink vertex.
+        @type: C{int}
+        @param height: The height of each vertex.
+        @type: C{list}
+        @param count: The number of vertices at each height.
+        @type: C{list}
+        @param buckets: The active vertices at each height.
+        @type: C{list}
+        @param excess: The excess of each vertex.
+        @type: C{list}
+        @return: The highest height of an active vertex, or -1 if there is none.
+        @rtype: C{int}
+        """
+        number_of_vertices = self.number_of_vertices
+        offsets = self.offsets
+        arcs = self.arcs
+        head = self.head
+        capacity = self.capacity
+        max_height = 2 * number_of_vertices
+        for i in xrange(number_of_vertices):
+            height[i] = max_height
+        for root, base in ((sink, 0), (source, number_of_vertices)):
+            height[root] = base
+            frontier = [root]
+            while frontier:
+                next_frontier = []
+                for vertex in frontier:
+                    for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                        arc = arcs[i]
+                        other = head[arc]
+                        # The reverse arc leads from other to vertex.
+                        if capacity[arc ^ 1] > 0 and height[other] == max_height:
+                            height[other] = height[vertex] + 1
+                            next_frontier.append(other)
+                frontier = next_frontier
+        for i in xrange(len(count)):
+            count[i] = 0
+            buckets[i] = []
+        highest = -1
+        for vertex in xrange(number_of_vertices):
+            count[height[vertex]] += 1
+            if excess[vertex] > 0 and vertex != source and vertex != sink \
+                    and height[vertex] < max_height:
+                buckets[height[vertex]].append(vertex)
+                highest = max(highest, height[vertex])
+        return highest
+
+
+class MinCostFlowNetwork(FlowNetwork):
+
+    """
+    A flow network where each edge, besides its capacity, has a cost
+    per unit of flow sent along it. The reverse arc of an arc has the
+    negated cost.
+
+    A minimum cost flow is found by successive shortest paths. Each
+    vertex has a potential, and the reduced cost of an arc (u, v) is
+    its cost plus the potential of u minus the potential of v. As
+    long as the reduced cost of every residual arc is nonnegative,
+    shortest paths can be found by Dijkstra's algorithm, and adding
+    the distances found to the potentials keeps the reduced costs
+    nonnegative after augmenting along a shortest path.
+    """
+
+    def __init__(self, graph, capacity=None, cost=None):
+        """
+        Constructs the minimum cost flow network of the specified
+        graph. If no capacity function is specified, the capacity of
+        an edge is its weight, and likewise for the cost function.
+
+        @param graph: The graph from where the network is constructed.
+        @type: L{DirectedWeightedGraph}
+        @param capacity: Function returning the capacity of an edge.
+        @type: C{function}
+        @param cost: Function returning the cost per unit of flow on an edge.
+        @type: C{function}
+        @raises: ValueError if an edge has a negative capacity.
+        @type: C{ValueError}
+        """
+        FlowNetwork.__init__(self, graph, capacity)
+        self.cost = [0] * len(self.head)
+        for i, edge in enumerate(self.edges):
+            if cost is None:
+                edge_cost = edge.get_weight()
+            else:
+                edge_cost = cost(edge)
+            self.cost[2 * i] = edge_cost
+            self.cost[2 * i + 1] = -edge_cost
+        self.potential = [0] * self.number_of_vertices
+
+    def get_cost(self):
+        """
+        Returns the total cost of the current flow in this network.
+
+        @return: The cost of the flow.
+        @rtype: C{int}
+        """
+        total = 0
+        for i in xrange(len(self.edges)):
+            total += self.cost[2 * i] * self.get_edge_flow(i)
+        return total
+
+    def get_result(self, source):
+        """
+        Returns the result of the current flow in this network.
+
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @return: The flow, edge flows, cut and cost.
+        @rtype: L{MinCostFlowResult}
+        """
+        result = FlowNetwork.get_result(self, source)
+        return MinCostFlowResult(self.graph, result.get_flow_value(),
+                                 result.get_edges(), result.get_edge_flows(),
+                                 result.get_source_side(), self.get_cost())
+
+    def bellman_ford_potentials(self, source):
+        """
+        Sets the potential of every vertex reachable from the
+        specified source vertex in the residual graph to its distance
+        from the source, computed by the Bellman-Ford algorithm, as
+        arc costs may be negative. Other vertices get the potential 0.
+
+        Time complexity: O(n * m), where n is the number of vertices
+        and m is the number of edges.
+
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @raises: ValueError if a negative cycle is reachable from the source.
+        @type: C{ValueError}
+        """
+        offsets = self.offsets
+        arcs = self.arcs
+        head = self.head
+        capacity = self.capacity
+        cost = self.cost
+        distance = [None] * self.number_of_vertices
+        distance[source] = 0
+        for _ in xrange(self.number_of_vertices):
+            changed = False
+            for vertex in xrange(self.number_of_vertices):
+                if distance[vertex] is None:
+                    continue
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    arc = arcs[i]
+                    if capacity[arc] > 0:
+                        successor = head[arc]
+                        path_distance = distance[vertex] + cost[arc]
+                        if distance[successor] is None or \
+                                path_distance < distance[successor]:
+                            distance[successor] = path_distance
+                            changed = True
+            if not changed:
+                break
+        else:
+            raise ValueError
+        self.potential = [0 if x is None else x for x in distance]
+
+    def shortest_residual_paths(self, roots, is_target, threshold):
+        """
+        Runs Dijkstra's algorithm on the reduced costs from the
+        specified root vertices, using only residual arcs with a
+        capacity above the threshold, until a target vertex is
+        reached. The distances found are then added to the potentials,
+        where vertices not closer than the target get the distance of
+        the target.
+
+        Time complexity: O(m log(n)), where n is the number of vertices
+        and m is the number of edges.
+
+        @param roots: The indices of the vertices from where the search begins.
+        @type: C{list}
+        @param is_target: Flags indexed by vertex number marking the target vertices.
+        @type: C{list}
+        @param threshold: The residual capacity an arc must exceed.
+        @type: C{int}
+        @return: The arc leading to each vertex on its shortest path, and the target reached, or -1.
+        @rtype: C{tuple}
+        """
+        offsets = self.offsets
+        arcs = self.arcs
+        head = self.head
+        capacity = self.capacity
+        cost = self.cost
+        potential = self.potential
+        distance = [None] * self.number_of_vertices
+        parent_arc = [-1] * self.number_of_vertices
+        settled = [False] * self.number_of_vertices
+        queue = MinHeap()
+        for root in roots:
+            distance[root] = 0
+            queue.insert(Association(0, root))
+        target = -1
+        while not queue.is_empty():
+            vertex = queue.heap_extract_min().get_value()
+            if settled[vertex]:
+                continue
+            settled[vertex] = True
+            if is_target[vertex]:
+                target = vertex
+                break
+            base = distance[vertex] + potential[vertex]
+            for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                arc = arcs[i]
+                if capacity[arc] > threshold:
+                    successor = head[arc]
+                    path_distance = base + cost[arc] - potential[successor]
+                    if distance[successor] is None or \
+                            path_distance < distance[successor]:
+                        distance[successor] = path_distance
+                        parent_arc[successor] = arc
+                        queue.insert(Association(path_distance, successor))
+        if target >= 0:
+            limit = distance[target]
+            for vertex in xrange(self.number_of_vertices):
+                if distance[vertex] is not None and distance[vertex] < limit:
+                    potential[vertex] += distance[vertex]
+                else:
+                    potential[vertex] += limit
+        return parent_arc, target
+
+    def successive_shortest_paths(self, source, sink, flow_limit=None):
+        """
+        Computes a minimum cost flow from the specified source vertex
+        to the specified sink vertex, of maximum value or of the value
+        given by the flow limit if that is smaller. The initial
+        potentials are found by the Bellman-Ford algorithm, after
+        which the flow is repeatedly augmented along a cheapest path
+        in the residual graph, found by Dijkstra's algorithm on the
+        reduced costs.
+
+        Time complexity: O(n * m + F * m log(n)), where n is the number
+        of vertices, m is the number of edges and F is the value of
+        the flow.
+
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @param sink: The index of the sink vertex.
+        @type: C{int}
+        @param flow_limit: The largest value of the flow.
+        @type: C{int}
+        @raises: ValueError if a negative cycle is reachable from the source.
+        @type: C{ValueError}
+        @return: The value of the flow.
+        @rtype: C{int}
+        """
+        if source == sink:
+            raise ValueError
+        self.reset()
+        self.bellman_ford_potentials(source)
+        head = self.head
+        capacity = self.capacity
+        is_target = [False] * self.number_of_vertices
+        is_target[sink] = True
+        flow_value = 0
+        while flow_limit is None or flow_value < flow_limit:
+            parent_arc, target = self.shortest_residual_paths(
+                [source], is_target, 0)
+            if target < 0:
+                break
+            if flow_limit is None:
+                bottleneck = None
+            else:
+                bottleneck = flow_limit - flow_value
+            vertex = sink
+            while vertex != source:
+                arc = parent_arc[vertex]
+                if bottleneck is None or capacity[arc] < bottleneck:
+                    bottleneck = capacity[arc]
+                vertex = head[arc ^ 1]
+            vertex = sink
+            while vertex != source:
+                arc = parent_arc[vertex]
+                capacity[arc] -= bottleneck
+                capacity[arc ^ 1] += bottleneck
+                vertex = head[arc ^ 1]
+            flow_value += bottleneck
+        return flow_value
+
+    def capacity_scaling(self, source, sink, flow_limit=None):
+        """
+        Computes a minimum cost flow from the specified source vertex
+        to the specified sink vertex, of maximum value or of the value
+        given by the flow limit if that is smaller, using capacity
+        scaling. The capacities must be integers.
+
+        The value of the flow is first found by Dinic's algorithm and
+        placed as excess at the source and deficit at the sink. The
+        algorithm then works in phases with a scaling factor delta
+        being halved from the largest power of two not above the
+        largest capacity down to 1. At the start of a phase, every
+        residual arc with capacity at least delta and a negative
+        reduced cost is saturated. Then, delta units of flow are
+        repeatedly sent along a cheapest path, using only arcs with
+        residual capacity at least delta, from a vertex with excess
+        at least delta to a vertex with deficit at least delta.
+
+        As arcs with a negative reduced cost are saturated, the costs
+        may contain negative cycles, which is not the case for
+        successive shortest paths.
+
+        Time complexity: O(m log(U) * m log(n)), where n is the number
+        of vertices, m is the number of edges and U is the largest
+        capacity.
+
+        @param source: The index of the source vertex.
+        @type: C{int}
+        @param sink: The index of the sink vertex.
+        @type: C{int}
+        @param flow_limit: The largest value of the flow.
+        @type: C{int}
+        @return: The value of the flow.
+        @rtype: C{int}
+        """
+        flow_value = self.dinic(source, sink)
+        if flow_limit is not None and flow_limit < flow_value:
+            flow_value = flow_limit
+        self.reset()
+        number_of_vertices = self.number_of_vertices
+        head = self.head
+        capacity = self.capacity
+        cost = self.cost
+        self.potential = [0] * number_of_vertices
+        potential = self.potential
+        excess = [0] * number_of_vertices
+        excess[source] = flow_value
+        excess[sink] = -flow_value
+        delta = 1
+        while 2 * delta <= max(self.original_capacity + [flow_value]):
+            delta *= 2
+        while delta >= 1:
+            for arc in xrange(len(head)):
+                if capacity[arc] >= delta:
+                    vertex_u = head[arc ^ 1]
+                    vertex_v = head[arc]
+                    if cost[arc] + potential[vertex_u] - potential[vertex_v] < 0:
+                        amount = capacity[arc]
+                        capacity[arc] = 0
+                        capacity[arc ^ 1] += amount
+                        excess[vertex_u] -= amount
+                        excess[vertex_v] += amount
+            while True:
+                roots = [i for i in xrange(number_of_vertices)
+                         if excess[i] >= delta]
+                is_target = [x <= -delta for x in excess]
+                if not roots or True not in is_target:
+                    break
+                parent_arc, target = self.shortest_residual_paths(
+                    roots, is_target, delta - 1)
+                if target < 0:
+                    break
+                vertex = target
+                while parent_arc[vertex] >= 0:
+                    arc = parent_arc[vertex]
+                    capacity[arc] -= delta
+                    capacity[arc ^ 1] += delta
+                    vertex = head[arc ^ 1]
+                excess[vertex] -= delta
+                excess[target] += delta
+            delta //= 2
+        return flow_value
+
+
+class MaxFlowResult(object):
+
+    """
+    Data structure holding the result of computing a maximum flow
+    in a flow network: the value of the flow, the flow on each edge,
+    and the minimum cut separating the source from the sink.
+
+    The flows are held in a list indexed by the position of the edge
+    in the list of edges of the network, since parallel edges with the
+    same endpoints and capacity compare equal.
+    """
+
+    def __init__(self, graph, flow_value, edges, edge_flows, source_side):
+        """
+        Constructs an object used to hold the result of computing
+        a maximum flow.
+
+        @param graph: The graph where the maximum flow is computed.
+        @type: L{Graph}
+        @param flow_value: The value of the maximum flow.
+        @type: C{int}
+        @param edges: The edges of the flow network.
+        @type: C{list}
+        @param edge_flows: The flow on each edge indexed as the edges.
+        @type: C{list}
+        @param source_side: The vertices on the source side of the minimum cut.
+        @type: C{set}
+        """
+        self.graph = graph
+        self.flow_value = flow_value
+        self.edges = edges
+        self.edge_flows = edge_flows
+        self.source_side = source_side
+
+    def __str__(self):
+        """
+        Returns a string representation of this maximum flow result.
+
+        @return: String representation of the maximum flow result.
+        @rtype: C{str}
+        """
+        class_name_str = str(self.__class__.__name__) + ": ("
+        attributes_str = "Flow: " + str(self.flow_value) + \
+            ", Source side: " + str(list(self.source_side)) + ")"
+        return class_name_str + attributes_str
+
+    def get_flow_value(self):
+        """
+        Returns the value of the maximum flow.
+
+        @return: The value of the maximum flow.
+        @rtype: C{int}
+        """
+        return self.flow_value
+
+    def get_edges(self):
+        """
+        Returns the edges of the flow network, in the order of the
+        list holding the flow on each edge.
+
+        @return: The edges of the network.
+        @rtype: C{list}
+        """
+        return self.edges
+
+    def get_edge_flows(self):
+        """
+        Returns the list holding the flow on each edge, indexed as
+        the list of edges.
+
+        @return: The flow on each edge.
+        @rtype: C{list}
+        """
+        return self.edge_flows
+
+    def get_edge_flow(self, index):
+        """
+        Returns the flow on the edge with the specified index in the
+        list of edges.
+
+        @param index: The index of the edge.
+        @type: C{int}
+        @return: The flow on the edge.
+        @rtype: C{int}
+        """
+        return self.edge_flows[index]
+
+    def get_source_side(self):
+        """
+        Returns the vertices on the source side of the minimum cut,
+        being the vertices reachable from the source in the residual
+        graph of the maximum flow.
+
+        @return: The source side of the minimum cut.
+        @rtype: C{set}
+        """
+        return self.source_side
+
+    def get_sink_side(self):
+        """
+        Returns the vertices on the sink side of the minimum cut.
+
+        @return: The sink side of the minimum cut.
+        @rtype: C{set}
+        """
+        return set(self.graph.get_vertices()) - self.source_side
+
+    def get_cut_edges(self):
+        """
+        Returns the edges leading from the source side to the sink
+        side of the minimum cut. The sum of their capacities equals
+        the value of the maximum flow.
+
+        @return: The edges crossing the minimum cut.
+        @rtype: C{list}
+        """
+        result = []
+        for edge in self.edges:
+            if edge.get_head_vertex() in self.source_side and \
+                    edge.get_tail_vertex() not in self.source_side:
+                result.append(edge)
+        return result
+
+
+class MinCostFlowResult(MaxFlowResult):
+
+    """
+    Data structure holding the result of computing a minimum cost
+    flow, being a maximum flow result extended with the total cost
+    of the flow.
+    """
+
+    def __init__(self, graph, flow_value, edges, edge_flows, source_side,
+                 cost):
+        """
+        Constructs an object used to hold the result of computing
+        a minimum cost flow.
+
+        @param graph: The graph where the flow is computed.
+        @type: L{Graph}
+        @param flow_value: The value of the flow.
+        @type: C{int}
+        @param edges: The edges of the flow network.
+        @type: C{list}
+        @param edge_flows: The flow on each edge indexed as the edges.
+        @type: C{list}
+        @param source_side: The vertices reachable from the source in the residual graph.
+        @type: C{set}
+        @param cost: The total cost of the flow.
+        @type: C{int}
+        """
+        MaxFlowResult.__init__(self, graph, flow_value, edges, edge_flows,
+                               source_side)
+        self.cost = cost
+
+    def __str__(self):
+        """
+        Returns a string representation of this minimum cost flow
+        result.
+
+        @return: String representation of the minimum cost flow result.
+        @rtype: C{str}
+        """
+        class_name_str = str(self.__class__.__name__) + ": ("
+        attributes_str = "Flow: " + str(self.flow_value) + \
+            ", Cost: " + str(self.cost) + ")"
+        return class_name_str + attributes_str
+
+    def get_cost(self):
+        """
+        Returns the total cost of the flow.
+
+        @return: The cost of the flow.
+        @rtype: C{int}
+        """
+        return self.cost
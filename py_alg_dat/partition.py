@@ -23,7 +23,7 @@
 # THE SOFTWARE.
 
 """
-Data structure implementing a partition as a disjoint set
+Data structures implementing a partition as a disjoint set
 using Union-Find with rank and path compression.
 """
 
@@ -374,3 +374,180 @@ class PartitionElement(object):
         @rtype: C{int}
         """
         return hash((self.parent, self.rank))
+
+
+class ArrayPartition(object):
+
+    """
+    The interface for a partition of the integers 0, 1, ..., n - 1
+    implemented as a disjoint set data structure backed by two
+    arrays holding the parent and the rank of each element.
+
+    Unlike L{Partition}, no object is created per element, which
+    makes the partition suitable for a large number of elements,
+    e.g. one element per vertex in a graph.
+    """
+
+    def __init__(self, size=0):
+        """
+        Constructs a partition holding a singleton set for each
+        of the integers 0, 1, ..., size - 1.
+
+        @param size: The number of elements in the partition.
+        @type: C{int}
+        """
+        self.parent = list(xrange(size))
+        self.rank = [0] * size
+        self.number_of_sets = size
+
+    def __len__(self):
+        """
+        Returns the number of elements in this partition.
+
+        @return: The number of elements in the partition.
+        @rtype: C{int}
+        """
+        return len(self.parent)
+
+    def __eq__(self, other):
+        """
+        Compares two array partitions for equality. The comparison
+        is done by comparing the sets of the two partitions.
+
+        @param other: The other partition.
+        @type other: L{ArrayPartition}
+        @return: True if the partitions are equal, false otherwise.
+        @rtype: C{bool}
+        """
+        if isinstance(other, ArrayPartition):
+            return self.get_labels() == other.get_labels()
+        return NotImplemented
+
+    def __ne__(self, other):
+        """
+        Compares two array partitions for inequality. The comparison
+        is done by comparing the sets of the two partitions.
+
+        @param other: The other partition.
+        @type other: L{ArrayPartition}
+        @return: True if the partitions are not equal, false otherwise.
+        @rtype: C{bool}
+        """
+        return not self == other
+
+    def make_set(self):
+        """
+        Appends a new element to this partition as a singleton set.
+
+        @return: The new element.
+        @rtype: C{int}
+        """
+        elem = len(self.parent)
+        self.parent.append(elem)
+        self.rank.append(0)
+        self.number_of_sets += 1
+        return elem
+
+    def set_size(self, size):
+        """
+        Extends this partition with singleton sets until it holds
+        the specified number of elements. Nothing is done if the
+        partition already holds at least that many elements.
+
+        @param size: The number of elements in the partition.
+        @type: C{int}
+        """
+        current = len(self.parent)
+        if size > current:
+            self.parent.extend(xrange(current, size))
+            self.rank.extend([0] * (size - current))
+            self.number_of_sets += size - current
+
+    def find(self, elem):
+        """
+        Returns the representative of the set containing the
+        specified element. The search is carried out iteratively
+        and compresses the path by path halving.
+
+        @param elem: The element to search for in the partition.
+        @type elem: C{int}
+        @return: The representative of the set containing the element.
+        @rtype: C{int}
+        @raises: IndexError if the element is not in the partition.
+        @type: C{IndexError}
+        """
+        parent = self.parent
+        while parent[elem] != elem:
+            parent[elem] = parent[parent[elem]]
+            elem = parent[elem]
+        return elem
+
+    def same_set(self, elem1, elem2):
+        """
+        Returns if the two specified elements are in the same set.
+
+        @param elem1: The first element in the partition.
+        @type elem1: C{int}
+        @param elem2: The second element in the partition.
+        @type elem2: C{int}
+        @return: True if the elements are in the same set, false otherwise.
+        @rtype: C{bool}
+        """
+        return self.find(elem1) == self.find(elem2)
+
+    def union(self, elem1, elem2):
+        """
+        Merges the sets containing the two specified elements
+        using union by rank. If the two elements already are in
+        the same set nothing is done.
+
+        @param elem1: The first element in the partition.
+        @type elem1: C{int}
+        @param elem2: The second element in the partition.
+        @type elem2: C{int}
+        @return: True if two sets were merged, false otherwise.
+        @rtype: C{bool}
+        """
+        root1 = self.find(elem1)
+        root2 = self.find(elem2)
+        if root1 == root2:
+            return False
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+        self.number_of_sets -= 1
+        return True
+
+    def get_number_of_sets(self):
+        """
+        Returns the number of disjoint sets in this partition.
+
+        @return: The number of sets in the partition.
+        @rtype: C{int}
+        """
+        return self.number_of_sets
+
+    def get_labels(self):
+        """
+        Returns a labeling of the elements in this partition, where
+        the sets are numbered 0, 1, ..., k - 1 in the order of their
+        smallest element, together with the size of each set.
+
+        @return: Tuple holding the label of each element and the size of each set.
+        @rtype: C{tuple}
+        """
+        labels = [0] * len(self.parent)
+        sizes = []
+        root_label = {}
+        for elem in xrange(len(self.parent)):
+            root = self.find(elem)
+            label = root_label.get(root)
+            if label is None:
+                label = len(sizes)
+                root_label[root] = label
+                sizes.append(0)
+            labels[elem] = label
+            sizes[label] += 1
+        return labels, sizes
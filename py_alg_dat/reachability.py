@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 by Brian Horn, trycatchhorn@gmail.com.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Provides an index answering reachability queries in a directed graph.
+"""
+
+__author__ = "Brian Horn"
+__copyright__ = "Copyright (c) 2015 Brian Horn"
+__credits__ = "Brian Horn"
+__license__ = "MIT"
+__version__ = "1.0.2"
+__maintainer__ = "Brian Horn"
+__email__ = "trycatchhorn@gmail.com"
+__status__ = "Prototype"
+
+from py_alg_dat.compact_graph import CompactGraph
+from py_alg_dat.graph_algorithms import GraphAlgorithms
+
+
+class ReachabilityIndex(object):
+
+    """
+    An index answering if one vertex can reach another vertex in a
+    directed graph.
+
+    The strongly connected components of the graph are found by
+    Tarjan's algorithm and contracted, which gives the condensation
+    of the graph, a directed acyclic graph where the components are
+    numbered in reverse topological order. A vertex u reaches a vertex
+    v if and only if the component of u reaches the component of v in
+    the condensation.
+
+    Two kinds of index are built over the condensation:
+
+    1) Transitive closure: The set of components reachable from each
+    component is stored as a bitset in a Python integer, where bit d
+    is set if component d is reachable. As every edge leads to a
+    component with a lower number, the bitsets are computed in one
+    pass in increasing order of component number, as the union of the
+    bitsets of the successors. A query then tests a single bit. The
+    index takes O(k^2) bits, where k is the number of components.
+
+    2) Interval labels: For graphs too large for the closure, each
+    component gets one interval label per depth-first traversal of
+    the condensation, made of its post-order rank and the smallest
+    rank below it. If u reaches v, the interval of v is contained in
+    the interval of u in every labeling, so a query is usually
+    answered negatively in constant time. Likewise, v is reachable if
+    it lies in the subtree of u in the depth-first forest of the first
+    traversal. Other queries are answered by a depth-first search in
+    the condensation, which only enters components whose intervals
+    contain the interval of v. The index takes O(k) space.
+    """
+
+    def __init__(self, graph, closure=None, max_closure_size=16384,
+                 number_of_labelings=2):
+        """
+        Constructs the reachability index of the specified directed
+        graph. If it is not specified whether to build the transitive
+        closure, it is built when the number of strongly connected
+        components is at most the maximum closure size, and interval
+        labels are built otherwise.
+
+        Time complexity: O(n + m + k * m' / w) for the closure, and
+        O(n + m) for the interval labels, where n is the number of
+        vertices, m is the number of edges, k and m' are the number of
+        vertices and edges in the condensation, and w is the word size.
+
+        @param graph: The graph of which the index is constructed.
+        @type: L{DirectedGraph}
+        @param closure: Flag indicating if the transitive closure is built.
+        @type: C{bool}
+        @param max_closure_size: The largest number of components for which the closure is built.
+        @type: C{int}
+        @param number_of_labelings: The number of interval labelings.
+        @type: C{int}
+        """
+        self.graph = graph
+        self.labels, self.sizes = \
+            GraphAlgorithms.strongly_connected_components(graph)
+        number_of_components = len(self.sizes)
+        compact_graph = CompactGraph(graph)
+        offsets = compact_graph.get_offsets()
+        targets = compact_graph.get_targets()
+        members = [[] for _ in xrange(number_of_components)]
+        for vertex, label in enumerate(self.labels):
+            members[label].append(vertex)
+        marker = [-1] * number_of_components
+        self.successors = [[] for _ in xrange(number_of_components)]
+        for component in xrange(number_of_components):
+            for vertex in members[component]:
+                for i in xrange(offsets[vertex], offsets[vertex + 1]):
+                    other = self.labels[targets[i]]
+                    if other != component and marker[other] != component:
+                        marker[other] = component
+                        self.successors[component].append(other)
+
+        if closure is None:
+            closure = number_of_components <= max_closure_size
+        self.closure = None
+        self.intervals = None
+        self.tree_intervals = None
+        if closure:
+            self.build_closure()
+        else:
+            self.build_intervals(number_of_labelings)
+
+    def build_closure(self):
+        """
+        Builds the transitive closure of the condensation as one
+        bitset per component.
+        """
+        self.closure = []
+        for component, successors in enumerate(self.successors):
+            bits = 1 << component
+            for other in successors:
+                bits |= self.closure[other]
+            self.closure.append(bits)
+
+    def build_intervals(self, number_of_labelings):
+        """
+        Builds the interval labels of the condensation by the
+        specified number of depth-first traversals. The traversals
+        start from the components in increasing and decreasing order,
+        and visit the successors in the same and reverse order, to
+        make the labelings differ.
+
+        @param number_of_labelings: The number of interval labelings.
+        @type: C{int}
+        """
+        number_of_components = len(self.successors)
+        self.intervals = []
+        for labeling in xrange(max(1, number_of_labelings)):
+            low = [0] * number_of_components
+            rank = [-1] * number_of_components
+            discovery = [0] * number_of_components
+            if labeling % 2 == 0:
+                roots = xrange(number_of_components)
+            else:
+                roots = xrange(number_of_components - 1, -1, -1)
+            counter = 0
+            visits = 0
+            for root in roots:
+                if rank[root] >= 0 or discovery[root] > 0:
+                    continue
+                visits += 1
+                discovery[root] = visits
+                frames = [[root, 0]]
+                while frames:
+                    frame = frames[-1]
+                    component = frame[0]
+                    successors = self.successors[component]
+                    if frame[1] < len(successors):
+                        if labeling % 2 == 0:
+                            other = successors[frame[1]]
+                        else:
+                            other = successors[-1 - frame[1]]
+                        frame[1] += 1
+                        if discovery[other] == 0:
+                            visits += 1
+                            discovery[other] = visits
+                            frames.append([other, 0])
+                        continue
+                    frames.pop()
+                    rank[component] = counter
+                    lowest = counter
+                    for other in successors:
+                        if low[other] < lowest:
+                            lowest = low[other]
+                    low[component] = lowest
+                    counter += 1
+            self.intervals.append((low, rank))
+            if labeling == 0:
+                # Subtree of the depth-first forest: discovered after
+                # and finished before the component.
+                self.tree_intervals = (discovery, rank)
+
+    def get_number_of_components(self):
+        """
+        Returns the number of strongly connected components of the
+        graph.
+
+        @return: The number of components.
+        @rtype: C{int}
+        """
+        return len(self.sizes)
+
+    def get_component(self, vertex):
+        """
+        Returns the number of the strongly connected component holding
+        the specified vertex.
+
+        @param vertex: The vertex which component is found.
+        @type: L{UnWeightedGraphVertex}
+        @return: The number of the component.
+        @rtype: C{int}
+        """
+        return self.labels[vertex.vertex_number]
+
+    def has_closure(self):
+        """
+        Returns if this index holds the transitive closure, or interval
+        labels otherwise.
+
+        @return: True if the transitive closure is built, false otherwise.
+        @rtype: C{bool}
+        """
+        return self.closure is not None
+
+    def contains(self, component, other):
+        """
+        Returns if the intervals of the specified component contain
+        the intervals of the other component in every labeling.
+
+        @param component: The number of the first component.
+        @type: C{int}
+        @param other: The number of the second component.
+        @type: C{int}
+        @return: True if every interval is contained, false otherwise.
+        @rtype: C{bool}
+        """
+        for low, rank in self.intervals:
+            if low[other] < low[component] or rank[other] > rank[component]:
+                return False
+        return True
+
+    def reaches(self, vertex_u, vertex_v):
+        """
+        Returns if there is a path from vertex_u to vertex_v in the
+        graph. Every vertex reaches itself.
+
+        Time complexity: O(1) with the transitive closure, where the
+        bit test is counted as constant. With interval labels, O(1)
+        for most queries and O(k + m') in the worst case, where k and
+        m' are the number of vertices and edges in the condensation.
+
+        @param vertex_u: The vertex where the path begins.
+        @type: L{UnWeightedGraphVertex}
+        @param vertex_v: The vertex where the path ends.
+        @type: L{UnWeightedGraphVertex}
+        @return: True if vertex_v is reachable from vertex_u, false otherwise.
+        @rtype: C{bool}
+        """
+        source = self.labels[vertex_u.vertex_number]
+        target = self.labels[vertex_v.vertex_number]
+        if self.closure is not None:
+            return (self.closure[source] >> target) & 1 == 1
+        if source == target:
+            return True
+        if not self.contains(source, target):
+            return False
+        discovery, rank = self.tree_intervals
+        if discovery[source] <= discovery[target] and \
+                rank[target] <= rank[source]:
+            return True
+        visited = set([source])
+        stack = [source]
+        while stack:
+            component = stack.pop()
+            for other in self.successors[component]:
+                if other == target:
+                    return True
+                if other not in visited and self.contains(other, target):
+                    visited.add(other)
+                    stack.append(other)
+        return False
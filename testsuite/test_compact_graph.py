@@ -0,0 +1,134 @@
+#!/usr/bin/env py.test
+
+"""
+Test CompactGraph class.
+"""
+
+import unittest
+
+from py_alg_dat import compact_graph
+from py_alg_dat import graph
+from py_alg_dat import graph_vertex
+
+
+class TestCompactGraph(unittest.TestCase):
+
+    """
+    Test CompactGraph class.
+    """
+
+    def setUp(self):
+        self.graph1 = graph.DirectedWeightedGraph(4)
+        self.v0_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "A")
+        self.v1_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "B")
+        self.v2_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "C")
+        self.v3_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "D")
+        self.graph1.add_vertex(self.v0_g1)
+        self.graph1.add_vertex(self.v1_g1)
+        self.graph1.add_vertex(self.v2_g1)
+        self.graph1.add_vertex(self.v3_g1)
+        self.graph1.add_edge(self.v0_g1, self.v1_g1, 4)
+        self.graph1.add_edge(self.v0_g1, self.v2_g1, 2)
+        self.graph1.add_edge(self.v2_g1, self.v1_g1, 1)
+        self.graph1.add_edge(self.v1_g1, self.v3_g1, 5)
+
+        self.graph2 = graph.UnDirectedUnWeightedGraph(3)
+        self.v0_g2 = graph_vertex.UnWeightedGraphVertex(self.graph2, "A")
+        self.v1_g2 = graph_vertex.UnWeightedGraphVertex(self.graph2, "B")
+        self.v2_g2 = graph_vertex.UnWeightedGraphVertex(self.graph2, "C")
+        self.graph2.add_vertex(self.v0_g2)
+        self.graph2.add_vertex(self.v1_g2)
+        self.graph2.add_vertex(self.v2_g2)
+        self.graph2.add_edge(self.v0_g2, self.v1_g2)
+        self.graph2.add_edge(self.v1_g2, self.v2_g2)
+
+    def test_compact_graph_number_of_vertices(self):
+        """
+        Test number of vertices.
+        """
+        res = compact_graph.CompactGraph(self.graph1)
+        self.assertEqual(4, res.get_number_of_vertices())
+        self.assertEqual(4, len(res))
+
+    def test_compact_graph_number_of_arcs_directed(self):
+        """
+        Test number of arcs - directed graph.
+        """
+        res = compact_graph.CompactGraph(self.graph1)
+        self.assertEqual(4, res.get_number_of_arcs())
+
+    def test_compact_graph_number_of_arcs_undirected(self):
+        """
+        Test number of arcs - undirected graph.
+        """
+        res = compact_graph.CompactGraph(self.graph2)
+        self.assertEqual(4, res.get_number_of_arcs())
+
+    def test_compact_graph_successors(self):
+        """
+        Test successors.
+        """
+        res = compact_graph.CompactGraph(self.graph1)
+        self.assertEqual([1, 2], res.get_successors(0))
+        self.assertEqual([3], res.get_successors(1))
+        self.assertEqual([1], res.get_successors(2))
+        self.assertEqual([], res.get_successors(3))
+
+    def test_compact_graph_weights(self):
+        """
+        Test weights.
+        """
+        res = compact_graph.CompactGraph(self.graph1)
+        self.assertEqual([0, 2, 3, 4, 4], res.get_offsets())
+        self.assertEqual([4, 2, 5, 1], res.get_weights())
+
+    def test_compact_graph_unweighted(self):
+        """
+        Test that arcs of an unweighted graph have weight one.
+        """
+        res = compact_graph.CompactGraph(self.graph2)
+        self.assertEqual([1, 1, 1, 1], res.get_weights())
+
+    def test_compact_graph_edges(self):
+        """
+        Test that each arc refers to the edge of the graph.
+        """
+        res = compact_graph.CompactGraph(self.graph1)
+        ref = self.graph1.get_edge(self.v2_g1, self.v1_g1)
+        self.assertEqual(ref, res.get_edges()[3])
+
+    def test_compact_graph_transpose(self):
+        """
+        Test transposed view.
+        """
+        res = compact_graph.CompactGraph(self.graph1, True)
+        self.assertEqual([], res.get_successors(0))
+        self.assertEqual([0, 2], res.get_successors(1))
+        self.assertEqual([0], res.get_successors(2))
+        self.assertEqual([1], res.get_successors(3))
+        self.assertEqual(2, res.get_out_degree(1))
+
+    def test_compact_graph_breadth_first_distances(self):
+        """
+        Test breadth-first distances.
+        """
+        res = compact_graph.CompactGraph(self.graph1)
+        self.assertEqual([0, 1, 1, 2], res.breadth_first_distances(0))
+        self.assertEqual([-1, 0, -1, 1], res.breadth_first_distances(1))
+
+    def test_compact_graph_topological_order(self):
+        """
+        Test topological order, where a graph with a cycle has none.
+        """
+        res = compact_graph.CompactGraph(self.graph1)
+        self.assertEqual([0, 2, 1, 3], res.topological_order())
+        self.graph1.add_edge(self.v3_g1, self.v2_g1, 1)
+        res = compact_graph.CompactGraph(self.graph1)
+        self.assertEqual(None, res.topological_order())
+
+    def test_compact_graph_getitem(self):
+        """
+        Test operator "getitem".
+        """
+        res = compact_graph.CompactGraph(self.graph2)
+        self.assertEqual(self.v1_g2, res[1])
@@ -536,3 +536,18 @@ class TestDFSEdgeClassification(unittest.TestCase):
         """
         res = self.classification_directed_cyclic.has_cross_edges()
         self.assertTrue(res)
+
+    def test_dfs_edge_classification_iterative_undirected(self):
+        """
+        Test that the iterative undirected classification gives the
+        same result as the recursive undirected classification.
+        """
+        res = dfs_edge_classification.DFSEdgeClassification(
+            self.g_undirected_cyclic).dfs_iterative_undirected()
+        ref = self.classification_undirected_cyclic
+        self.assertEqual(ref.get_parent(), res.get_parent())
+        self.assertEqual(ref.get_discovery_time(), res.get_discovery_time())
+        self.assertEqual(ref.get_finishing_time(), res.get_finishing_time())
+        self.assertEqual(ref.get_order(), res.get_order())
+        self.assertEqual(ref.get_edges(), res.get_edges())
+        self.assertEqual(set(), res.get_articulation_points())
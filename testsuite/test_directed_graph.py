@@ -604,6 +604,23 @@ class TestDirectedGraph(unittest.TestCase):
         visited = visitor.get_visited()
         self.assertEqual(reference, visited)
 
+    def test_directed_graph_levels(self):
+        """
+        Test method "levels".
+        """
+        reference = [[self.v0_g2],
+                     [self.v1_g1_g2, self.v2_g1_g2],
+                     [self.v3_g1_g2, self.v4_g1_g2, self.v5_g1_g2],
+                     [self.v6_g2, self.v7_g2],
+                     [self.v8_g2]]
+        self.assertEqual(reference, list(self.graph2.levels()))
+
+    def test_directed_graph_levels_cyclic(self):
+        """
+        Test method "levels" - graph with a cycle.
+        """
+        self.assertRaises(ValueError, list, self.graph1.levels())
+
     def test_directed_graph_is_strongly_connected(self):
         """
         Test method "is_strongly_connected".
@@ -618,6 +635,66 @@ class TestDirectedGraph(unittest.TestCase):
         # since no vertex can be reached from vertex 'a'
         self.assertFalse(self.graph2.is_strongly_connected())
 
+    def test_directed_graph_is_strongly_connected_not_reverse(self):
+        """
+        Test method "is_strongly_connected" - inverted, where every
+        vertex is reachable from the first vertex, but the first
+        vertex is not reachable from every vertex.
+        """
+        a_graph = graph.DirectedGraph(3)
+        v_1 = graph_vertex.UnWeightedGraphVertex(a_graph, 'A')
+        v_2 = graph_vertex.UnWeightedGraphVertex(a_graph, 'B')
+        v_3 = graph_vertex.UnWeightedGraphVertex(a_graph, 'C')
+        a_graph.add_vertex(v_1)
+        a_graph.add_vertex(v_2)
+        a_graph.add_vertex(v_3)
+        a_graph.add_edge(v_1, v_2)
+        a_graph.add_edge(v_2, v_3)
+        a_graph.add_edge(v_3, v_2)
+        self.assertFalse(a_graph.is_strongly_connected())
+
+    def test_directed_graph_bfs(self):
+        """
+        Test method "bfs".
+        """
+        ref = [(self.v1_g1, 0, None),
+               (self.v2_g1, 1, self.v1_g1),
+               (self.v4_g1, 1, self.v1_g1),
+               (self.v3_g1, 2, self.v2_g1),
+               (self.v5_g1, 2, self.v4_g1)]
+        res = list(self.graph1.bfs(0))
+        self.assertEqual(ref, res)
+
+    def test_directed_graph_bfs_same_order_as_breadth_first_traversal(self):
+        """
+        Test that method "bfs" visits the vertices in the same
+        order as method "breadth_first_traversal".
+        """
+        visitor = vertex_visitor.VertexVisitor()
+        self.graph2.breadth_first_traversal(visitor, 0)
+        res = [vertex for vertex, _, _ in self.graph2.bfs(0)]
+        self.assertEqual(visitor.get_visited(), res)
+
+    def test_directed_graph_dfs(self):
+        """
+        Test method "dfs".
+        """
+        ref = [(self.v1_g1, 0, None),
+               (self.v2_g1, 1, self.v1_g1),
+               (self.v3_g1, 2, self.v2_g1),
+               (self.v5_g1, 3, self.v3_g1),
+               (self.v4_g1, 2, self.v2_g1)]
+        res = list(self.graph1.dfs(0))
+        self.assertEqual(ref, res)
+
+    def test_directed_graph_dfs_stop_early(self):
+        """
+        Test that method "dfs" can be stopped early.
+        """
+        generator = self.graph1.dfs(0)
+        self.assertEqual((self.v1_g1, 0, None), next(generator))
+        self.assertEqual((self.v2_g1, 1, self.v1_g1), next(generator))
+
     def test_directed_graph_is_cyclic(self):
         """
         Test method "is_cyclic".
@@ -0,0 +1,135 @@
+#!/usr/bin/env py.test
+
+"""
+Test of the dynamic minimum spanning tree.
+"""
+
+import random
+import unittest
+
+from py_alg_dat import dynamic_minimum_spanning_tree
+from py_alg_dat import graph
+from py_alg_dat import graph_algorithms
+from py_alg_dat import graph_vertex
+from py_alg_dat import partition
+
+
+class TestDynamicMinimumSpanningTree(unittest.TestCase):
+
+    """
+    Test of the dynamic minimum spanning tree.
+    """
+
+    def setUp(self):
+        # Graph from http://en.wikipedia.org/wiki/Prim%27s_algorithm
+        self.graph1 = graph.UnDirectedWeightedGraph(7)
+        self.vertices = [graph_vertex.UnWeightedGraphVertex(self.graph1, name)
+                         for name in ["A", "B", "C", "D", "E", "F", "G"]]
+        for vertex in self.vertices:
+            self.graph1.add_vertex(vertex)
+        a, b, c, d, e, f, g = self.vertices
+        self.graph1.add_edge(a, b, 7)
+        self.graph1.add_edge(a, d, 5)
+        self.graph1.add_edge(b, c, 8)
+        self.graph1.add_edge(b, d, 9)
+        self.graph1.add_edge(b, e, 7)
+        self.graph1.add_edge(c, e, 5)
+        self.graph1.add_edge(d, e, 15)
+        self.graph1.add_edge(d, f, 6)
+        self.graph1.add_edge(e, f, 8)
+        self.graph1.add_edge(e, g, 9)
+        self.graph1.add_edge(f, g, 11)
+        self.dynamic_mst = \
+            dynamic_minimum_spanning_tree.DynamicMinimumSpanningTree(
+                self.graph1)
+
+    def reference_weight(self, dynamic_mst):
+        """
+        Returns the weight of a minimum spanning forest of the current
+        edge weights, found by Kruskals algorithm.
+        """
+        forest = partition.ArrayPartition(dynamic_mst.number_of_vertices)
+        total = 0
+        for key in sorted(dynamic_mst.weights,
+                          key=dynamic_mst.weights.__getitem__):
+            if forest.union(key[0], key[1]):
+                total += dynamic_mst.weights[key]
+        return total
+
+    def test_dynamic_minimum_spanning_tree_initial(self):
+        """
+        Test that the initial tree is the minimum spanning tree.
+        """
+        mst_ref = graph_algorithms.GraphAlgorithms.kruskals_algorithm(
+            self.graph1)
+        mst_res = self.dynamic_mst.get_minimum_spanning_tree()
+        self.assertEqual(39, self.dynamic_mst.get_total_weight())
+        self.assertEqual(mst_ref.get_total_weight(),
+                         mst_res.get_total_weight())
+        self.assertEqual(6, len(self.dynamic_mst))
+
+    def test_dynamic_minimum_spanning_tree_insert(self):
+        """
+        Test of inserting an edge replacing the heaviest tree edge on
+        the path between its end points.
+        """
+        a, _, _, _, _, _, g = self.vertices
+        self.dynamic_mst.insert_edge(a, g, 1)
+        self.assertTrue(self.dynamic_mst.is_tree_edge(a, g))
+        self.assertEqual(31, self.dynamic_mst.get_total_weight())
+        self.assertRaises(KeyError, self.dynamic_mst.insert_edge, a, g, 2)
+
+    def test_dynamic_minimum_spanning_tree_decrease(self):
+        """
+        Test of decreasing the weight of a non-tree edge.
+        """
+        _, _, _, d, e, _, _ = self.vertices
+        self.assertFalse(self.dynamic_mst.is_tree_edge(d, e))
+        self.dynamic_mst.update_edge(d, e, 1)
+        self.assertTrue(self.dynamic_mst.is_tree_edge(d, e))
+        self.assertEqual(33, self.dynamic_mst.get_total_weight())
+
+    def test_dynamic_minimum_spanning_tree_increase(self):
+        """
+        Test of increasing the weight of a tree edge, where it is
+        replaced by the lightest reconnecting edge.
+        """
+        a, _, _, d, _, _, _ = self.vertices
+        self.dynamic_mst.update_edge(a, d, 20)
+        self.assertFalse(self.dynamic_mst.is_tree_edge(a, d))
+        self.assertEqual(20, self.dynamic_mst.get_weight(a, d))
+        self.assertEqual(42, self.dynamic_mst.get_total_weight())
+
+    def test_dynamic_minimum_spanning_tree_remove(self):
+        """
+        Test of removing a tree edge, and an edge whose removal
+        disconnects the graph.
+        """
+        _, _, _, _, e, f, g = self.vertices
+        self.dynamic_mst.remove_edge(e, g)
+        self.assertTrue(self.dynamic_mst.is_tree_edge(f, g))
+        self.assertEqual(41, self.dynamic_mst.get_total_weight())
+        self.dynamic_mst.remove_edge(f, g)
+        self.assertEqual(30, self.dynamic_mst.get_total_weight())
+        self.assertEqual(5, len(self.dynamic_mst))
+        self.assertRaises(KeyError, self.dynamic_mst.remove_edge, f, g)
+
+    def test_dynamic_minimum_spanning_tree_random_updates(self):
+        """
+        Test that the tree stays minimal under random insertions,
+        removals and weight changes.
+        """
+        rand = random.Random(36)
+        for _ in xrange(500):
+            vertex_u, vertex_v = rand.sample(self.vertices, 2)
+            action = rand.random()
+            if action < 0.2:
+                try:
+                    self.dynamic_mst.remove_edge(vertex_u, vertex_v)
+                except KeyError:
+                    pass
+            else:
+                self.dynamic_mst.update_edge(vertex_u, vertex_v,
+                                             rand.randint(0, 20))
+            self.assertEqual(self.reference_weight(self.dynamic_mst),
+                             self.dynamic_mst.get_total_weight())
@@ -0,0 +1,130 @@
+#!/usr/bin/env py.test
+
+"""
+Test of the Gomory-Hu tree.
+"""
+
+import random
+import unittest
+
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+
+from py_alg_dat import gomory_hu_tree
+from py_alg_dat import graph
+from py_alg_dat import graph_algorithms
+from py_alg_dat import max_flow
+from testsuite import test_graph_algorithms
+
+
+class TestGomoryHuTree(unittest.TestCase):
+
+    """
+    Test of the Gomory-Hu tree.
+    """
+
+    def setUp(self):
+        # A graph with six vertices, where vertices 0 and 2 are joined
+        # by a heavy edge, and so are vertices 3 and 5.
+        self.graph1, self.vertices = test_graph_algorithms.create_graph(
+            graph.UnDirectedWeightedGraph, 6,
+            [(0, 1, 1), (0, 2, 7), (1, 2, 1), (1, 3, 3), (1, 4, 2), (2, 4, 4),
+             (3, 4, 1), (3, 5, 6), (4, 5, 2)])
+
+    def check_tree(self, test_graph, vertices, tree):
+        """
+        Checks the minimum cut of every pair of vertices against a
+        maximum flow, and checks that the cut side found in the tree
+        has the same weight.
+        """
+        for vertex_u in vertices:
+            for vertex_v in vertices:
+                if vertex_u == vertex_v:
+                    continue
+                ref = graph_algorithms.GraphAlgorithms.dinic(
+                    test_graph, vertex_u, vertex_v).get_flow_value()
+                self.assertEqual(ref, tree.minimum_cut_value(vertex_u,
+                                                             vertex_v))
+                side = tree.minimum_cut(vertex_u, vertex_v)
+                self.assertTrue(vertex_u in side)
+                self.assertFalse(vertex_v in side)
+                weight = sum(edge.get_weight()
+                             for edge in test_graph.get_edges()
+                             if edge.get_head_vertex() in side and
+                             edge.get_tail_vertex() not in side)
+                self.assertEqual(ref, weight)
+
+    def test_gomory_hu_tree(self):
+        """
+        Test of minimum cut queries in a Gomory-Hu tree.
+        """
+        tree = gomory_hu_tree.GomoryHuTree(self.graph1)
+        self.assertEqual(5, len(tree.get_edges()))
+        self.assertEqual(None, tree.get_parent(self.vertices[0]))
+        self.assertEqual(None, tree.get_weight(self.vertices[0]))
+        self.assertEqual(8, tree.minimum_cut_value(self.vertices[0],
+                                                   self.vertices[2]))
+        self.assertEqual(6, tree.minimum_cut_value(self.vertices[0],
+                                                   self.vertices[5]))
+        self.check_tree(self.graph1, self.vertices, tree)
+        self.assertRaises(ValueError, tree.minimum_cut_value,
+                          self.vertices[1], self.vertices[1])
+
+    def test_gomory_hu_tree_pool(self):
+        """
+        Test that a Gomory-Hu tree computed by a specified thread -or
+        process pool, -and by a created process -or thread pool gives
+        the same minimum cuts.
+        """
+        for pool in [ThreadPool(3), Pool(2)]:
+            try:
+                tree = gomory_hu_tree.GomoryHuTree(self.graph1, pool,
+                                                   batch_size=3)
+            finally:
+                pool.close()
+                pool.join()
+            self.check_tree(self.graph1, self.vertices, tree)
+        tree = gomory_hu_tree.GomoryHuTree(self.graph1, processes=2,
+                                           batch_size=4)
+        self.check_tree(self.graph1, self.vertices, tree)
+        tree = gomory_hu_tree.GomoryHuTree(self.graph1, processes=2,
+                                           threads=True, batch_size=4)
+        self.check_tree(self.graph1, self.vertices, tree)
+
+    def test_gomory_hu_tree_minimum_cuts(self):
+        """
+        Test that the minimum cuts use the network stored by
+        share_network, unless a network is specified.
+        """
+        network = max_flow.FlowNetwork(self.graph1)
+        pairs = [(1, 0), (5, 0)]
+        gomory_hu_tree.share_network(network)
+        try:
+            shared = gomory_hu_tree.minimum_cuts(pairs)
+        finally:
+            gomory_hu_tree.share_network(None)
+        self.assertEqual(gomory_hu_tree.minimum_cuts(pairs, network), shared)
+
+    def test_gomory_hu_tree_random_graphs(self):
+        """
+        Test of Gomory-Hu trees of random graphs, which may be
+        disconnected.
+        """
+        random.seed(50)
+        for _ in xrange(10):
+            test_graph, vertices = test_graph_algorithms.create_random_graph(
+                graph.UnDirectedWeightedGraph, random.randint(2, 8),
+                random.random(),
+                lambda vertex_u, vertex_v: random.randint(1, 9))
+            tree = gomory_hu_tree.GomoryHuTree(test_graph)
+            self.check_tree(test_graph, vertices, tree)
+            tree = gomory_hu_tree.GomoryHuTree(test_graph, processes=2,
+                                               batch_size=3)
+            self.check_tree(test_graph, vertices, tree)
+
+    def test_gomory_hu_tree_directed(self):
+        """
+        Test that a Gomory-Hu tree cannot be built from a directed graph.
+        """
+        test_graph = graph.DirectedWeightedGraph(2)
+        self.assertRaises(ValueError, gomory_hu_tree.GomoryHuTree, test_graph)
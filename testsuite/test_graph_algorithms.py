@@ -4,9 +4,14 @@
 Test of various graph algorithms.
 """
 
+import random
 import unittest
 
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+
 from py_alg_dat import array_list
+from py_alg_dat import compact_graph
 from py_alg_dat import entry
 from py_alg_dat import graph
 from py_alg_dat import graph_algorithms
@@ -14,6 +19,56 @@ from py_alg_dat import graph_edge
 from py_alg_dat import graph_path
 from py_alg_dat import graph_vertex
 from py_alg_dat import minimum_spanning_tree
+from py_alg_dat import partition
+
+
+def vertex_label(number):
+    """
+    Returns a label for the vertex with the specified number. Used as
+    the function applied in a process pool, which must be defined at
+    the top level.
+    """
+    return "v" + str(number)
+
+
+def create_graph(graph_class, number_of_vertices, edges=()):
+    """
+    Creates a graph of the specified class with the specified number of
+    vertices, labeled by their vertex numbers, -and the specified edges,
+    given as pairs of vertex numbers, optionally followed by a weight.
+    Returns the graph and its vertices.
+    """
+    test_graph = graph_class(number_of_vertices)
+    vertices = [graph_vertex.UnWeightedGraphVertex(test_graph, str(i))
+                for i in xrange(number_of_vertices)]
+    for vertex in vertices:
+        test_graph.add_vertex(vertex)
+    for edge in edges:
+        test_graph.add_edge(vertices[edge[0]], vertices[edge[1]], *edge[2:])
+    return test_graph, vertices
+
+
+def create_random_graph(graph_class, number_of_vertices, probability,
+                        weight=None):
+    """
+    Creates a random graph of the specified class, where each pair of
+    distinct vertices, ordered if the graph is directed, is joined by an
+    edge with the specified probability. If a weight function is
+    specified, it is called with the vertex numbers of the endpoints to
+    find the weight of each edge. Returns the graph and its vertices.
+    """
+    test_graph, vertices = create_graph(graph_class, number_of_vertices)
+    for vertex_u in xrange(number_of_vertices):
+        first = 0 if test_graph.is_directed() else vertex_u + 1
+        for vertex_v in xrange(first, number_of_vertices):
+            if vertex_u == vertex_v or random.random() >= probability:
+                continue
+            if weight is None:
+                test_graph.add_edge(vertices[vertex_u], vertices[vertex_v])
+            else:
+                test_graph.add_edge(vertices[vertex_u], vertices[vertex_v],
+                                    weight(vertex_u, vertex_v))
+    return test_graph, vertices
 
 
 class TestGraphAlgorithms(unittest.TestCase):
@@ -276,6 +331,64 @@ class TestGraphAlgorithms(unittest.TestCase):
             self.graph1, self.v7_g1)
         self.assertEqual(mst_ref, mst_res)
 
+    def test_graph_algorithms_adjacency_matrix(self):
+        """
+        Test of the adjacency matrix of a graph.
+        """
+        matrix = graph_algorithms.GraphAlgorithms.adjacency_matrix(
+            self.graph1)
+        self.assertEqual(7, len(matrix))
+        self.assertEqual([None, 7, None, 5, None, None, None], matrix[0])
+        for i in xrange(7):
+            for j in xrange(7):
+                self.assertEqual(matrix[i][j], matrix[j][i])
+        self.assertEqual(matrix, graph_algorithms.GraphAlgorithms.
+                         adjacency_matrix(self.graph1,
+                                          compact_graph.CompactGraph(
+                                              self.graph1)))
+        self.graph1.add_edge(self.v1_g1, self.v2_g1, 3)
+        matrix = graph_algorithms.GraphAlgorithms.adjacency_matrix(
+            self.graph1)
+        self.assertEqual(3, matrix[0][1])
+        self.assertEqual(3, matrix[1][0])
+
+    def test_graph_algorithms_prim_dense(self):
+        """
+        Test that the dense implementation of Prims algorithm, and the
+        automatic choice of implementation, find the same minimum
+        spanning tree as Prims algorithm.
+        """
+        mst_ref = graph_algorithms.GraphAlgorithms.prims_algorithm(
+            self.graph1, self.v4_g1)
+        mst_dense = graph_algorithms.GraphAlgorithms.prims_algorithm_dense(
+            self.graph1, self.v4_g1)
+        mst_auto = graph_algorithms.GraphAlgorithms.prims_algorithm_auto(
+            self.graph1, self.v4_g1)
+        self.assertEqual(mst_ref, mst_dense)
+        self.assertEqual(mst_ref, mst_auto)
+
+    def test_graph_algorithms_prim_dense_random_graphs(self):
+        """
+        Test that the dense implementation of Prims algorithm finds a
+        spanning tree with the same weight as Kruskals algorithm on
+        random connected graphs.
+        """
+        rand = random.Random(35)
+        for _ in xrange(20):
+            size = rand.randint(1, 12)
+            test_graph, vertices = create_graph(
+                graph.UnDirectedWeightedGraph, size,
+                [(i, j, rand.randint(0, 20))
+                 for i in xrange(1, size) for j in xrange(i)
+                 if j == i - 1 or rand.random() < 0.7])
+            mst_ref = graph_algorithms.GraphAlgorithms.kruskals_algorithm(
+                test_graph)
+            mst_res = graph_algorithms.GraphAlgorithms.prims_algorithm_dense(
+                test_graph, rand.choice(vertices))
+            self.assertEqual(size - 1, len(mst_res.get_edges()))
+            self.assertEqual(mst_ref.get_total_weight(),
+                             mst_res.get_total_weight())
+
     def test_graph_algorithms_kruskal(self):
         """
         Test of Kruskals algorithm.
@@ -303,6 +416,146 @@ class TestGraphAlgorithms(unittest.TestCase):
             self.graph1)
         self.assertEqual(mst_ref, mst_res)
 
+    def edge_pairs(self, mst):
+        """
+        Returns the edges of the minimum spanning tree as a set of
+        unordered pairs of vertex numbers.
+        """
+        return set(frozenset([edge.get_head_vertex().get_vertex_number(),
+                              edge.get_tail_vertex().get_vertex_number()])
+                   for edge in mst.get_edges())
+
+    def test_graph_algorithms_boruvka(self):
+        """
+        Test of Boruvkas algorithm.
+        """
+        mst_ref = graph_algorithms.GraphAlgorithms.kruskals_algorithm(
+            self.graph1)
+        mst_res = graph_algorithms.GraphAlgorithms.boruvka(self.graph1)
+        self.assertEqual(39, mst_res.get_total_weight())
+        self.assertEqual(self.edge_pairs(mst_ref), self.edge_pairs(mst_res))
+
+    def test_graph_algorithms_boruvka_equal_weights(self):
+        """
+        Test of Boruvkas algorithm on a cycle where all edges have the
+        same weight, and on a graph with two components.
+        """
+        test_graph, _ = create_graph(
+            graph.UnDirectedWeightedGraph, 6,
+            [(i, (i + 1) % 4, 1) for i in xrange(4)] + [(4, 5, 2)])
+        mst_res = graph_algorithms.GraphAlgorithms.boruvka(test_graph)
+        self.assertEqual(4, len(mst_res.get_edges()))
+        self.assertEqual(5, mst_res.get_total_weight())
+
+    def test_graph_algorithms_boruvka_random_graphs(self):
+        """
+        Test that Boruvkas algorithm finds a spanning tree with the
+        same weight as Kruskals algorithm on random connected graphs.
+        """
+        rand = random.Random(33)
+        for _ in xrange(20):
+            size = rand.randint(1, 15)
+            test_graph, vertices = create_graph(graph.UnDirectedWeightedGraph,
+                                                size)
+            for i in xrange(1, size):
+                test_graph.add_edge(vertices[i], vertices[rand.randrange(i)],
+                                    rand.randint(0, 9))
+            for _ in xrange(rand.randint(0, 2 * size)):
+                vertex_u = rand.choice(vertices)
+                vertex_v = rand.choice(vertices)
+                if vertex_u != vertex_v:
+                    test_graph.add_edge(vertex_u, vertex_v, rand.randint(0, 9))
+            mst_ref = graph_algorithms.GraphAlgorithms.kruskals_algorithm(
+                test_graph)
+            mst_res = graph_algorithms.GraphAlgorithms.boruvka(test_graph)
+            self.assertEqual(size - 1, len(mst_res.get_edges()))
+            self.assertEqual(mst_ref.get_total_weight(),
+                             mst_res.get_total_weight())
+
+    def test_graph_algorithms_kruskal_sorted(self):
+        """
+        Test of Kruskals algorithm with sorted edges, and of the
+        filter-Kruskal algorithm.
+        """
+        mst_ref = graph_algorithms.GraphAlgorithms.kruskals_algorithm(
+            self.graph1)
+        mst_sorted = graph_algorithms.GraphAlgorithms.kruskals_algorithm_sorted(
+            self.graph1)
+        mst_filter = graph_algorithms.GraphAlgorithms.filter_kruskals_algorithm(
+            self.graph1, 2)
+        self.assertEqual(39, mst_sorted.get_total_weight())
+        self.assertEqual(self.edge_pairs(mst_ref), self.edge_pairs(mst_sorted))
+        self.assertEqual(mst_sorted, mst_filter)
+
+    def test_graph_algorithms_sort_by_weight(self):
+        """
+        Test of sorting edge indices by weight, with bucket sort for
+        integer weights and comparison sort otherwise.
+        """
+        weights = [3, 1, 2, 1, 3]
+        res = graph_algorithms.GraphAlgorithms.sort_by_weight(
+            [0, 1, 2, 3, 4], weights)
+        self.assertEqual([1, 3, 2, 0, 4], res)
+        weights = [3.5, 1, 2, 1, 100]
+        res = graph_algorithms.GraphAlgorithms.sort_by_weight(
+            [0, 1, 2, 3, 4], weights)
+        self.assertEqual([1, 3, 2, 0, 4], res)
+
+    def test_graph_algorithms_kruskal_sorted_random_graphs(self):
+        """
+        Test that sorted Kruskal and filter-Kruskal accept the same
+        edges, with the same weight as Kruskals algorithm, on random
+        connected graphs.
+        """
+        rand = random.Random(34)
+        for _ in xrange(20):
+            size = rand.randint(1, 15)
+            test_graph, vertices = create_graph(graph.UnDirectedWeightedGraph,
+                                                size)
+            for i in xrange(1, size):
+                test_graph.add_edge(vertices[i], vertices[rand.randrange(i)],
+                                    rand.choice([rand.randint(0, 5),
+                                                 rand.random()]))
+            for _ in xrange(rand.randint(0, 3 * size)):
+                vertex_u = rand.choice(vertices)
+                vertex_v = rand.choice(vertices)
+                if vertex_u != vertex_v:
+                    test_graph.add_edge(vertex_u, vertex_v, rand.randint(0, 5))
+            mst_ref = graph_algorithms.GraphAlgorithms.kruskals_algorithm(
+                test_graph)
+            mst_sorted = graph_algorithms.GraphAlgorithms.kruskals_algorithm_sorted(
+                test_graph)
+            mst_filter = graph_algorithms.GraphAlgorithms.filter_kruskals_algorithm(
+                test_graph, 4)
+            self.assertEqual(size - 1, len(mst_sorted.get_edges()))
+            self.assertAlmostEqual(mst_ref.get_total_weight(),
+                                   mst_sorted.get_total_weight())
+            self.assertEqual(mst_sorted, mst_filter)
+
+    def test_graph_algorithms_kruskal_sorted_complete_graph(self):
+        """
+        Test that sorted Kruskal and filter-Kruskal find a spanning
+        tree with the same weight as Kruskals algorithm on a complete
+        graph, where every edge is extracted from both directions.
+        """
+        rand = random.Random(134)
+        size = 40
+        test_graph, _ = create_graph(
+            graph.UnDirectedWeightedGraph, size,
+            [(i, j, rand.randint(0, 1000))
+             for i in xrange(size) for j in xrange(i + 1, size)])
+        mst_ref = graph_algorithms.GraphAlgorithms.kruskals_algorithm(
+            test_graph)
+        mst_sorted = graph_algorithms.GraphAlgorithms.kruskals_algorithm_sorted(
+            test_graph)
+        mst_filter = graph_algorithms.GraphAlgorithms.filter_kruskals_algorithm(
+            test_graph)
+        self.assertEqual(size - 1, len(mst_sorted.get_edges()))
+        self.assertEqual(mst_ref.get_total_weight(),
+                         mst_sorted.get_total_weight())
+        self.assertEqual(mst_ref.get_total_weight(),
+                         mst_filter.get_total_weight())
+
     def test_graph_algorithms_dijkstra_v0(self):
         """
         Test of Dijkstras algorithm.
@@ -730,6 +983,208 @@ class TestGraphAlgorithms(unittest.TestCase):
             self.graph2, self.v0_g2, self.v6_g2)
         self.assertEqual(ref, res)
 
+    def test_graph_algorithms_k_shortest_paths(self):
+        """
+        Test of the k shortest paths, where the first path is the
+        shortest path.
+        """
+        ref = graph_algorithms.GraphAlgorithms.shortest_path(
+            self.graph2, self.v0_g2, self.v3_g2)
+        res = graph_algorithms.GraphAlgorithms.k_shortest_paths(
+            self.graph2, self.v0_g2, self.v3_g2, 3)
+        self.assertEqual(ref, res[0])
+        lengths = [path.get_path_length() for path in res]
+        self.assertEqual(sorted(lengths), lengths)
+        for path in res:
+            self.assertEqual(self.v0_g2, path.get_vertices()[0])
+            self.assertEqual(self.v3_g2, path.get_vertices()[-1])
+            self.assertEqual(len(path.get_vertices()),
+                             len(set(path.get_vertices())))
+
+    def test_graph_algorithms_k_shortest_paths_grid(self):
+        """
+        Test of the k shortest paths in an undirected grid, where the
+        six shortest paths between opposite corners have length 4.
+        """
+        test_graph, vertices = create_graph(
+            graph.UnDirectedWeightedGraph, 9,
+            [(i, i + 1, 1) for i in xrange(9) if i % 3 < 2] +
+            [(i, i + 3, 1) for i in xrange(6)])
+        res = graph_algorithms.GraphAlgorithms.k_shortest_paths(
+            test_graph, vertices[0], vertices[8], 8)
+        self.assertEqual(8, len(res))
+        self.assertEqual([4] * 6 + [6] * 2,
+                         [path.get_path_length() for path in res])
+        self.assertEqual(8, len(set(tuple(path.get_vertices())
+                                    for path in res)))
+
+    def test_graph_algorithms_k_shortest_paths_exhausted(self):
+        """
+        Test that fewer than k paths are returned when there are no
+        more loopless paths, and none when there is no path.
+        """
+        test_graph, vertices = create_graph(
+            graph.DirectedWeightedGraph, 3, [(0, 1, 3), (0, 2, 1), (2, 1, 1)])
+        res = graph_algorithms.GraphAlgorithms.k_shortest_paths(
+            test_graph, vertices[0], vertices[1], 10)
+        self.assertEqual([2, 3], [path.get_path_length() for path in res])
+        res = graph_algorithms.GraphAlgorithms.k_shortest_paths(
+            test_graph, vertices[1], vertices[0], 10)
+        self.assertEqual([], res)
+
+    def create_dag(self):
+        """
+        Creates a directed acyclic weighted graph with six vertices,
+        where vertex 5 is not reachable from vertex 0.
+        """
+        return create_graph(graph.DirectedWeightedGraph, 6,
+                            [(0, 1, 5), (0, 2, 3), (1, 3, 6), (1, 2, 2),
+                             (2, 4, 4), (2, 3, 7), (3, 4, -1), (5, 1, 9)])
+
+    def test_graph_algorithms_dag_shortest_paths(self):
+        """
+        Test of shortest paths in a directed acyclic graph.
+        """
+        test_graph, vertices = self.create_dag()
+        res = graph_algorithms.GraphAlgorithms.dag_shortest_paths(
+            test_graph, vertices[0])
+        self.assertEqual(([0, 5, 3, 10, 7, None], [-1, 0, 0, 2, 2, -1]), res)
+
+    def test_graph_algorithms_dag_longest_path(self):
+        """
+        Test of longest paths in a directed acyclic graph, from a
+        source vertex and from any vertex.
+        """
+        test_graph, vertices = self.create_dag()
+        res = graph_algorithms.GraphAlgorithms.dag_longest_path(
+            test_graph, vertices[0])
+        self.assertEqual(([0, 5, 7, 14, 13, None], [-1, 0, 1, 2, 3, -1]), res)
+        res = graph_algorithms.GraphAlgorithms.dag_longest_path(test_graph)
+        self.assertEqual(([0, 9, 11, 18, 17, 0], [-1, 5, 1, 2, 3, -1]), res)
+
+    def test_graph_algorithms_dag_paths_cyclic(self):
+        """
+        Test that paths in a graph with a cycle raise ValueError.
+        """
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.dag_shortest_paths,
+                          self.graph2, self.v0_g2)
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.dag_longest_path,
+                          self.graph2)
+
+    def test_graph_algorithms_topological_schedule(self):
+        """
+        Test that the topological schedule applies the function to a
+        vertex only after all its predecessors.
+        """
+        test_graph, vertices = self.create_dag()
+        finished = []
+
+        def record(number):
+            """
+            Checks that the predecessors of the vertex are finished.
+            """
+            vertex = test_graph[number]
+            for edge in test_graph.get_edges():
+                if edge.get_tail_vertex() == vertex:
+                    self.assertTrue(edge.get_head_vertex() in finished)
+            finished.append(vertex)
+            return number * 10
+        res = graph_algorithms.GraphAlgorithms.topological_schedule(
+            test_graph, record, processes=3)
+        self.assertEqual([0, 10, 20, 30, 40, 50], res)
+        self.assertEqual(6, len(finished))
+
+    def test_graph_algorithms_topological_schedule_processes(self):
+        """
+        Test of the topological schedule using a process pool.
+        """
+        test_graph, _ = self.create_dag()
+        res = graph_algorithms.GraphAlgorithms.topological_schedule(
+            test_graph, vertex_label, processes=2, threads=False)
+        self.assertEqual(["v0", "v1", "v2", "v3", "v4", "v5"], res)
+
+    def test_graph_algorithms_topological_schedule_cyclic(self):
+        """
+        Test that the topological schedule raises ValueError for a
+        graph with a cycle.
+        """
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.topological_schedule,
+                          self.graph2, vertex_label)
+
+    def check_update_shortest_paths(self, test_graph, vertices, rand):
+        """
+        Applies random batches of edge changes to the graph, and checks
+        that the repaired table of shortest paths has the distances
+        found by Dijkstras algorithm, with valid predecessors.
+        """
+        source = vertices[0]
+        table = graph_algorithms.GraphAlgorithms.dijkstras_algorithm(
+            test_graph, source)
+        for _ in xrange(15):
+            changes = []
+            for _ in xrange(rand.randint(1, 4)):
+                vertex_u, vertex_v = rand.sample(vertices, 2)
+                if test_graph.is_edge(vertex_u, vertex_v):
+                    test_graph.remove_edge(vertex_u, vertex_v)
+                if rand.random() < 0.7:
+                    test_graph.add_edge(vertex_u, vertex_v,
+                                        rand.randint(0, 10))
+                changes.append((vertex_u, vertex_v))
+            table = graph_algorithms.GraphAlgorithms.update_shortest_paths(
+                test_graph, table, changes)
+            ref = graph_algorithms.GraphAlgorithms.dijkstras_algorithm(
+                test_graph, source)
+            for i in xrange(len(vertices)):
+                self.assertEqual(ref[i].discovered, table[i].discovered)
+                self.assertEqual(ref[i].distance, table[i].distance)
+                if table[i].predecessor is not None:
+                    edge = table[i].edge
+                    predecessor = table[i].predecessor.get_vertex_number()
+                    self.assertEqual(table[i].distance,
+                                     table[predecessor].distance +
+                                     edge.get_weight())
+                    self.assertTrue(edge in test_graph.get_edges())
+
+    def test_graph_algorithms_update_shortest_paths(self):
+        """
+        Test of repairing the shortest paths after increasing the
+        weight of a tree edge and inserting an edge.
+        """
+        table = graph_algorithms.GraphAlgorithms.dijkstras_algorithm(
+            self.graph2, self.v0_g2)
+        self.graph2.remove_edge(self.v0_g2, self.v1_g2)
+        self.graph2.add_edge(self.v0_g2, self.v1_g2, 20)
+        self.graph2.add_edge(self.v0_g2, self.v6_g2, 2)
+        changes = [(self.v0_g2, self.v1_g2), (self.v0_g2, self.v6_g2)]
+        res = graph_algorithms.GraphAlgorithms.update_shortest_paths(
+            self.graph2, table, changes)
+        ref = graph_algorithms.GraphAlgorithms.dijkstras_algorithm(
+            self.graph2, self.v0_g2)
+        self.assertEqual([x.distance for x in ref],
+                         [x.distance for x in res])
+        self.assertEqual(self.v0_g2, res[6].predecessor)
+
+    def test_graph_algorithms_update_shortest_paths_random_graphs(self):
+        """
+        Test of repairing the shortest paths in random directed and
+        undirected graphs.
+        """
+        rand = random.Random(37)
+        for graph_class in [graph.DirectedWeightedGraph,
+                            graph.UnDirectedWeightedGraph]:
+            for _ in xrange(5):
+                size = rand.randint(2, 10)
+                test_graph, vertices = create_graph(graph_class, size)
+                for _ in xrange(2 * size):
+                    vertex_u, vertex_v = rand.sample(vertices, 2)
+                    if not test_graph.is_edge(vertex_u, vertex_v):
+                        test_graph.add_edge(vertex_u, vertex_v,
+                                            rand.randint(0, 10))
+                self.check_update_shortest_paths(test_graph, vertices, rand)
+
     def test_graph_algorithms_bellman_ford(self):
         """
         Test of Belleman-Fords algorithm.
@@ -790,3 +1245,1117 @@ class TestGraphAlgorithms(unittest.TestCase):
         ref_directed = False
         ref_tuple = (ref_directed, ref_map)
         self.assertEqual(ref_tuple, res_tuple)
+
+    def test_graph_algorithms_multi_source_bfs_single_source(self):
+        """
+        Test of multi-source breadth-first search with one source.
+        """
+        ref = [[0, 1, 2, 3, 3, 4, 2]]
+        res = graph_algorithms.GraphAlgorithms.multi_source_breadth_first_search(
+            self.graph2, [self.v0_g2])
+        self.assertEqual(ref, res)
+
+    def test_graph_algorithms_multi_source_bfs_many_sources(self):
+        """
+        Test of multi-source breadth-first search against the
+        hop distances from each source computed one at a time.
+        """
+        sources = self.graph1.get_vertices()
+        res = graph_algorithms.GraphAlgorithms.multi_source_breadth_first_search(
+            self.graph1, sources)
+        ref = [compact_graph.CompactGraph(self.graph1).breadth_first_distances(
+            source.get_vertex_number()) for source in sources]
+        self.assertEqual(ref, res)
+
+    def test_graph_algorithms_multi_source_bfs_small_batches(self):
+        """
+        Test of multi-source breadth-first search, where the sources
+        are split into several batches.
+        """
+        sources = self.graph2.get_vertices() + [self.v3_g2]
+        ref = graph_algorithms.GraphAlgorithms.multi_source_breadth_first_search(
+            self.graph2, sources)
+        res = graph_algorithms.GraphAlgorithms.multi_source_breadth_first_search(
+            self.graph2, sources, 3)
+        self.assertEqual(ref, res)
+        self.assertEqual(res[3], res[-1])
+
+    def test_graph_algorithms_multi_source_bfs_unreachable(self):
+        """
+        Test of multi-source breadth-first search, where some
+        vertices are unreachable from the source.
+        """
+        test_graph, vertices = create_graph(graph.DirectedUnWeightedGraph, 3,
+                                            [(0, 1)])
+        res = graph_algorithms.GraphAlgorithms.multi_source_breadth_first_search(
+            test_graph, [vertices[1], vertices[0]])
+        self.assertEqual([[-1, 0, -1], [0, 1, -1]], res)
+
+    def test_graph_algorithms_connected_components_connected(self):
+        """
+        Test of connected components of a connected graph.
+        """
+        res = graph_algorithms.GraphAlgorithms.connected_components(
+            self.graph1)
+        self.assertEqual(([0, 0, 0, 0, 0, 0, 0], [7]), res)
+
+    def test_graph_algorithms_connected_components(self):
+        """
+        Test of connected components of a graph with three components.
+        """
+        test_graph, _ = create_graph(graph.UnDirectedUnWeightedGraph, 6,
+                                     [(0, 3), (3, 5), (1, 4)])
+        ref = ([0, 1, 2, 0, 1, 0], [3, 2, 1])
+        res = graph_algorithms.GraphAlgorithms.connected_components(
+            test_graph)
+        self.assertEqual(ref, res)
+
+    def test_graph_algorithms_connected_components_directed(self):
+        """
+        Test of connected components of a directed graph, where the
+        weakly connected components are found.
+        """
+        res = graph_algorithms.GraphAlgorithms.connected_components(
+            self.graph2)
+        self.assertEqual(([0, 0, 0, 0, 0, 0, 0], [7]), res)
+
+    def test_graph_algorithms_connected_components_from_edges(self):
+        """
+        Test of connected components from a stream of edges.
+        """
+        lines = ["0 3", "3 5", "1 4"]
+        edges = (tuple(int(x) for x in line.split()) for line in lines)
+        ref = ([0, 1, 2, 0, 1, 0, 3], [3, 2, 1, 1])
+        res = graph_algorithms.GraphAlgorithms.connected_components_from_edges(
+            edges, 7)
+        self.assertEqual(ref, res)
+
+    def test_graph_algorithms_connected_components_from_edges_graph(self):
+        """
+        Test that connected components from a stream of edges equals
+        connected components computed from the graph.
+        """
+        edges = [(edge.get_head_vertex().get_vertex_number(),
+                  edge.get_tail_vertex().get_vertex_number())
+                 for edge in self.graph1.get_edges()]
+        ref = graph_algorithms.GraphAlgorithms.connected_components(
+            self.graph1)
+        res = graph_algorithms.GraphAlgorithms.connected_components_from_edges(
+            edges)
+        self.assertEqual(ref, res)
+
+    def test_graph_algorithms_strongly_connected_components(self):
+        """
+        Test of strongly connected components of a directed graph with
+        cycles, where the components are numbered in reverse
+        topological order.
+        """
+        test_graph, vertices = create_graph(
+            graph.DirectedGraph, 7, [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4),
+                                     (4, 3), (5, 4), (5, 6)])
+        labels, sizes = \
+            graph_algorithms.GraphAlgorithms.strongly_connected_components(
+                test_graph)
+        self.assertEqual(4, len(sizes))
+        self.assertEqual(labels[0], labels[1])
+        self.assertEqual(labels[0], labels[2])
+        self.assertEqual(labels[3], labels[4])
+        self.assertEqual(7, sum(sizes))
+        self.assertEqual(3, sizes[labels[0]])
+        self.assertEqual(2, sizes[labels[3]])
+        self.assertEqual(1, sizes[labels[6]])
+        for edge in test_graph.get_edges():
+            head = edge.get_head_vertex().get_vertex_number()
+            tail = edge.get_tail_vertex().get_vertex_number()
+            self.assertTrue(labels[tail] <= labels[head])
+
+    def test_graph_algorithms_strongly_connected_components_acyclic(self):
+        """
+        Test that every vertex of a directed acyclic graph is a
+        component of its own.
+        """
+        test_graph, _ = self.create_dag()
+        labels, sizes = \
+            graph_algorithms.GraphAlgorithms.strongly_connected_components(
+                test_graph)
+        self.assertEqual([1] * 6, sizes)
+        self.assertEqual(range(6), sorted(labels))
+        for edge in test_graph.get_edges():
+            head = edge.get_head_vertex().get_vertex_number()
+            tail = edge.get_tail_vertex().get_vertex_number()
+            self.assertTrue(labels[tail] < labels[head])
+
+    def create_bipartite_graph(self, number_of_left, number_of_right, pairs):
+        """
+        Creates an undirected unweighted graph with the specified number
+        of left and right vertices, where the edges are given as pairs
+        of left and right indices. Returns the graph and its vertices.
+        """
+        return create_graph(graph.UnDirectedUnWeightedGraph,
+                            number_of_left + number_of_right,
+                            [(left, number_of_left + right)
+                             for left, right in pairs])
+
+    def test_graph_algorithms_bipartite_coloring(self):
+        """
+        Test of 2-coloring a bipartite graph.
+        """
+        test_graph, _ = self.create_bipartite_graph(
+            3, 2, [(0, 0), (1, 0), (1, 1), (2, 1)])
+        res = graph_algorithms.GraphAlgorithms.bipartite_coloring(test_graph)
+        self.assertEqual([0, 0, 0, 1, 1], res)
+
+    def test_graph_algorithms_bipartite_coloring_odd_cycle(self):
+        """
+        Test that a graph with an odd cycle has no 2-coloring.
+        """
+        res = graph_algorithms.GraphAlgorithms.bipartite_coloring(self.graph1)
+        self.assertEqual(None, res)
+
+    def test_graph_algorithms_hopcroft_karp(self):
+        """
+        Test of Hopcroft-Karp, where the greedy initial matching
+        must be augmented.
+        """
+        test_graph, vertices = self.create_bipartite_graph(
+            3, 3, [(0, 0), (0, 1), (1, 0), (2, 1), (2, 2)])
+        res = graph_algorithms.GraphAlgorithms.hopcroft_karp(
+            test_graph, vertices[:3])
+        ref = [vertices[4], vertices[3], vertices[5],
+               vertices[1], vertices[0], vertices[2]]
+        self.assertEqual(ref, res)
+
+    def test_graph_algorithms_hopcroft_karp_unmatched(self):
+        """
+        Test of Hopcroft-Karp with unmatched vertices, where the left
+        side is found by 2-coloring.
+        """
+        test_graph, vertices = self.create_bipartite_graph(
+            3, 2, [(0, 0), (1, 0), (2, 0), (2, 1)])
+        res = graph_algorithms.GraphAlgorithms.hopcroft_karp(test_graph)
+        self.assertEqual(2, len([x for x in res if x is not None]) / 2)
+        self.assertEqual(vertices[4], res[2])
+        self.assertEqual(vertices[2], res[4])
+
+    def test_graph_algorithms_hopcroft_karp_not_bipartite(self):
+        """
+        Test that Hopcroft-Karp raises ValueError for a graph which is
+        not bipartite.
+        """
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.hopcroft_karp,
+                          self.graph1)
+        test_graph, vertices = self.create_bipartite_graph(2, 1, [(0, 0)])
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.hopcroft_karp,
+                          test_graph, [vertices[0], vertices[2]])
+
+    def test_graph_algorithms_hopcroft_karp_random_graphs(self):
+        """
+        Test that Hopcroft-Karp finds a valid matching of maximum size
+        in random bipartite graphs, compared to a simple augmenting
+        path algorithm.
+        """
+        rand = random.Random(31)
+        for _ in xrange(20):
+            number_of_left = rand.randint(1, 12)
+            number_of_right = rand.randint(1, 12)
+            pairs = set()
+            for _ in xrange(rand.randint(0, 30)):
+                pairs.add((rand.randrange(number_of_left),
+                           rand.randrange(number_of_right)))
+            test_graph, vertices = self.create_bipartite_graph(
+                number_of_left, number_of_right, pairs)
+            res = graph_algorithms.GraphAlgorithms.hopcroft_karp(
+                test_graph, vertices[:number_of_left])
+            size = 0
+            for i in xrange(number_of_left):
+                if res[i] is not None:
+                    right = res[i].get_vertex_number() - number_of_left
+                    self.assertTrue((i, right) in pairs)
+                    self.assertEqual(vertices[i],
+                                     res[res[i].get_vertex_number()])
+                    size += 1
+            # Reference size by augmenting paths from each left vertex.
+            match = {}
+
+            def augment(left, visited):
+                for right in xrange(number_of_right):
+                    if (left, right) in pairs and right not in visited:
+                        visited.add(right)
+                        if right not in match or augment(match[right], visited):
+                            match[right] = left
+                            return True
+                return False
+            ref = len([i for i in xrange(number_of_left)
+                       if augment(i, set())])
+            self.assertEqual(ref, size)
+
+    def create_directed_graph(self, number_of_vertices, pairs):
+        """
+        Creates a directed unweighted graph with the specified number
+        of vertices, where the edges are given as pairs of indices.
+        Returns the graph and its vertices.
+        """
+        return create_graph(graph.DirectedGraph, number_of_vertices, pairs)
+
+    def test_graph_algorithms_pagerank_cycle(self):
+        """
+        Test that the PageRank of a directed cycle is uniform.
+        """
+        test_graph, _ = self.create_directed_graph(
+            4, [(0, 1), (1, 2), (2, 3), (3, 0)])
+        res = graph_algorithms.GraphAlgorithms.pagerank(test_graph)
+        for rank in res:
+            self.assertAlmostEqual(0.25, rank)
+
+    def test_graph_algorithms_pagerank_dangling(self):
+        """
+        Test of PageRank in a graph with a dangling vertex, where the
+        ranks satisfy the PageRank equations -and sum to one.
+        """
+        pairs = [(0, 1), (0, 2), (1, 2), (2, 0), (3, 2), (2, 4)]
+        test_graph, _ = self.create_directed_graph(5, pairs)
+        damping = 0.85
+        res = graph_algorithms.GraphAlgorithms.pagerank(test_graph, damping,
+                                                        1.0e-12)
+        self.assertAlmostEqual(1.0, sum(res))
+        out_degree = [0] * 5
+        for vertex_u, _ in pairs:
+            out_degree[vertex_u] += 1
+        for vertex in xrange(5):
+            ref = (1.0 - damping + damping * res[4]) / 5
+            ref += damping * sum(res[vertex_u] / out_degree[vertex_u]
+                                 for vertex_u, vertex_v in pairs
+                                 if vertex_v == vertex)
+            self.assertAlmostEqual(ref, res[vertex])
+        self.assertTrue(res[2] > res[0] > res[1] > res[3])
+
+    def test_graph_algorithms_personalized_pagerank(self):
+        """
+        Test of personalized PageRank on a path, where the dangling end
+        of the path leads back to the seed.
+        """
+        test_graph, vertices = self.create_directed_graph(
+            4, [(0, 1), (1, 2), (3, 0)])
+        damping = 0.5
+        res = graph_algorithms.GraphAlgorithms.personalized_pagerank(
+            test_graph, [vertices[0]], damping, 1.0e-12)
+        ref = 1.0 / (1.0 + damping + damping ** 2)
+        self.assertAlmostEqual(ref, res[0])
+        self.assertAlmostEqual(ref * damping, res[1])
+        self.assertAlmostEqual(ref * damping ** 2, res[2])
+        self.assertAlmostEqual(0.0, res[3])
+        res = graph_algorithms.GraphAlgorithms.personalized_pagerank(
+            test_graph, {vertices[0]: 3, vertices[3]: 0}, damping, 1.0e-12)
+        self.assertAlmostEqual(ref, res[0])
+
+    def test_graph_algorithms_personalized_pagerank_warm_start(self):
+        """
+        Test that a warm start from a previous solution is a fixed point
+        of the iteration.
+        """
+        test_graph, vertices = self.create_directed_graph(
+            5, [(0, 1), (0, 2), (1, 2), (2, 0), (3, 2), (2, 4)])
+        seeds = {vertices[1]: 1, vertices[3]: 2}
+        ref = graph_algorithms.GraphAlgorithms.personalized_pagerank(
+            test_graph, seeds, tol=1.0e-14)
+        res = graph_algorithms.GraphAlgorithms.personalized_pagerank(
+            test_graph, seeds, max_iterations=1, start=ref)
+        for vertex in xrange(5):
+            self.assertAlmostEqual(ref[vertex], res[vertex])
+        res = graph_algorithms.GraphAlgorithms.personalized_pagerank(
+            test_graph, seeds, max_iterations=1)
+        self.assertNotAlmostEqual(ref[0], res[0])
+
+    def test_graph_algorithms_pagerank_invalid(self):
+        """
+        Test that an invalid damping factor -or seed weights are
+        rejected.
+        """
+        test_graph, vertices = self.create_directed_graph(2, [(0, 1)])
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.pagerank,
+                          test_graph, 1.5)
+        self.assertRaises(
+            ValueError,
+            graph_algorithms.GraphAlgorithms.personalized_pagerank,
+            test_graph, {vertices[0]: 0})
+        self.assertRaises(
+            ValueError,
+            graph_algorithms.GraphAlgorithms.personalized_pagerank,
+            test_graph, {vertices[0]: -1, vertices[1]: 2})
+
+    def brute_force_betweenness(self, test_graph):
+        """
+        Computes the betweenness centrality of the vertices in a small
+        graph by enumerating all simple paths between each ordered pair
+        of vertices. The edges of an undirected graph are stored in both
+        directions.
+        """
+        number_of_vertices = test_graph.get_number_of_vertices()
+        arcs = [[] for _ in xrange(number_of_vertices)]
+        for edge in test_graph.get_edges():
+            head = edge.get_head_vertex().get_vertex_number()
+            tail = edge.get_tail_vertex().get_vertex_number()
+            weight = edge.get_weight() if test_graph.is_weighted() else 1
+            arcs[head].append((tail, weight))
+        centrality = [0.0] * number_of_vertices
+        for source in xrange(number_of_vertices):
+            paths = []
+            stack = [([source], 0)]
+            while stack:
+                path, length = stack.pop()
+                paths.append((path, length))
+                for successor, weight in arcs[path[-1]]:
+                    if successor not in path:
+                        stack.append((path + [successor], length + weight))
+            for target in xrange(number_of_vertices):
+                if target == source:
+                    continue
+                lengths = [length for path, length in paths
+                           if path[-1] == target]
+                if not lengths:
+                    continue
+                shortest = [path for path, length in paths
+                            if path[-1] == target and length == min(lengths)]
+                for path in shortest:
+                    for vertex in path[1:-1]:
+                        centrality[vertex] += 1.0 / len(shortest)
+        if not test_graph.is_directed():
+            centrality = [value / 2 for value in centrality]
+        return centrality
+
+    def test_graph_algorithms_betweenness_centrality(self):
+        """
+        Test of betweenness centrality in an undirected weighted graph
+        -and a directed weighted graph.
+        """
+        for test_graph in [self.graph1, self.graph2]:
+            ref = self.brute_force_betweenness(test_graph)
+            res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+                test_graph)
+            for vertex in xrange(len(ref)):
+                self.assertAlmostEqual(ref[vertex], res[vertex])
+
+    def test_graph_algorithms_betweenness_centrality_path(self):
+        """
+        Test of betweenness centrality of a directed path, where each
+        inner vertex lies on the paths from the vertices before it to
+        the vertices after it.
+        """
+        test_graph, _ = self.create_directed_graph(
+            5, [(0, 1), (1, 2), (2, 3), (3, 4)])
+        res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            test_graph)
+        self.assertEqual([0.0, 3.0, 4.0, 3.0, 0.0], res)
+        res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            test_graph, normalized=True)
+        self.assertEqual([0.0, 0.25, 1.0 / 3, 0.25, 0.0], res)
+
+    def test_graph_algorithms_betweenness_centrality_random_graphs(self):
+        """
+        Test of betweenness centrality on random unweighted -and
+        weighted graphs, where ties between shortest paths are common.
+        """
+        random.seed(43)
+        for _ in xrange(30):
+            number_of_vertices = random.randint(1, 7)
+            directed = random.random() < 0.5
+            weighted = random.random() < 0.5
+            if directed and weighted:
+                graph_class = graph.DirectedWeightedGraph
+            elif directed:
+                graph_class = graph.DirectedUnWeightedGraph
+            elif weighted:
+                graph_class = graph.UnDirectedWeightedGraph
+            else:
+                graph_class = graph.UnDirectedUnWeightedGraph
+            test_graph, _ = create_random_graph(
+                graph_class, number_of_vertices, 0.4,
+                (lambda vertex_u, vertex_v: random.randint(1, 3))
+                if weighted else None)
+            ref = self.brute_force_betweenness(test_graph)
+            res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+                test_graph, batch_size=3)
+            for vertex in xrange(number_of_vertices):
+                self.assertAlmostEqual(ref[vertex], res[vertex])
+
+    def test_graph_algorithms_betweenness_centrality_zero_weights(self):
+        """
+        Test of betweenness centrality with edges of weight zero, where
+        vertices at equal distance are settled in an arbitrary order.
+        """
+        test_graph, _ = create_graph(
+            graph.DirectedWeightedGraph, 3,
+            [(0, 1, 0), (0, 2, 0), (1, 2, 1), (2, 1, 2), (2, 0, 2), (1, 0, 2)])
+        res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            test_graph)
+        self.assertEqual(self.brute_force_betweenness(test_graph), res)
+        self.assertEqual([0.5, 0.0, 0.0], res)
+
+        random.seed(143)
+        for _ in xrange(30):
+            number_of_vertices = random.randint(2, 7)
+            # Zero weights only on edges to higher numbers, so there is
+            # no cycle of weight zero.
+            test_graph, _ = create_random_graph(
+                graph.DirectedWeightedGraph, number_of_vertices, 0.5,
+                lambda vertex_u, vertex_v: random.randint(
+                    0 if vertex_u < vertex_v else 1, 3))
+            ref = self.brute_force_betweenness(test_graph)
+            res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+                test_graph)
+            for vertex in xrange(number_of_vertices):
+                self.assertAlmostEqual(ref[vertex], res[vertex])
+
+    def test_graph_algorithms_betweenness_centrality_zero_weight_cycles(self):
+        """
+        Test of betweenness centrality where edges of weight zero on
+        shortest paths form cycles, as every undirected edge of weight
+        zero does, on random undirected graphs whose edges of weight
+        zero form a forest, so the simple shortest paths are counted.
+        """
+        test_graph, _ = create_graph(graph.UnDirectedWeightedGraph, 3,
+                                     [(0, 1, 0), (1, 2, 1)])
+        res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            test_graph)
+        self.assertEqual([0.0, 1.0, 0.0], res)
+
+        test_graph, _ = create_graph(
+            graph.DirectedWeightedGraph, 5,
+            [(0, 1, 0), (1, 2, 0), (2, 0, 0), (3, 0, 1), (3, 2, 1), (1, 4, 2),
+             (2, 4, 1)])
+        ref = self.brute_force_betweenness(test_graph)
+        res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            test_graph)
+        for vertex in xrange(5):
+            self.assertAlmostEqual(ref[vertex], res[vertex])
+
+        random.seed(243)
+        for _ in xrange(30):
+            number_of_vertices = random.randint(2, 7)
+            test_graph, vertices = create_graph(
+                graph.UnDirectedWeightedGraph, number_of_vertices)
+            forest = partition.ArrayPartition(number_of_vertices)
+            for vertex_u in xrange(number_of_vertices):
+                for vertex_v in xrange(vertex_u + 1, number_of_vertices):
+                    if random.random() < 0.6:
+                        weight = random.randint(0, 3)
+                        if weight == 0 and not forest.union(vertex_u,
+                                                            vertex_v):
+                            weight = 1
+                        test_graph.add_edge(vertices[vertex_u],
+                                            vertices[vertex_v], weight)
+            ref = self.brute_force_betweenness(test_graph)
+            res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+                test_graph)
+            for vertex in xrange(number_of_vertices):
+                self.assertAlmostEqual(ref[vertex], res[vertex])
+
+    def test_graph_algorithms_betweenness_centrality_parallel_edges(self):
+        """
+        Test that parallel edges give separate shortest paths, in a
+        cycle of four vertices where one edge is doubled.
+        """
+        test_graph, _ = create_graph(graph.UnDirectedUnWeightedGraph, 4,
+                                     [(0, 1), (1, 2), (2, 3), (3, 0), (0, 1)])
+        ref = [2.0 / 3, 2.0 / 3, 1.0 / 3, 1.0 / 3]
+        res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            test_graph)
+        for vertex in xrange(4):
+            self.assertAlmostEqual(ref[vertex], res[vertex])
+
+    def test_graph_algorithms_betweenness_centrality_invalid_weights(self):
+        """
+        Test that negative weights are rejected.
+        """
+        test_graph, _ = create_graph(
+            graph.DirectedWeightedGraph, 3,
+            [(0, 1, 1), (1, 2, 0), (2, 1, 0), (2, 0, -1)])
+        self.assertRaises(
+            ValueError,
+            graph_algorithms.GraphAlgorithms.betweenness_centrality,
+            test_graph)
+
+    def test_graph_algorithms_betweenness_centrality_sampled(self):
+        """
+        Test of betweenness centrality from sampled source vertices,
+        where sampling every vertex gives the exact result.
+        """
+        ref = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            self.graph1)
+        res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            self.graph1, samples=7, seed=1)
+        self.assertEqual(ref, res)
+        res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            self.graph1, samples=3, seed=1)
+        self.assertEqual(res, graph_algorithms.GraphAlgorithms.
+                         betweenness_centrality(self.graph1, samples=3,
+                                                seed=1))
+        self.assertTrue(all(value >= 0.0 for value in res))
+        self.assertRaises(
+            ValueError,
+            graph_algorithms.GraphAlgorithms.betweenness_centrality,
+            self.graph1, 0)
+
+    def test_graph_algorithms_betweenness_centrality_pool(self):
+        """
+        Test of betweenness centrality computed by a thread pool, by a
+        process pool -and by a created process pool.
+        """
+        ref = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            self.graph2)
+        for pool in [ThreadPool(2), Pool(2)]:
+            try:
+                res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+                    self.graph2, pool=pool, batch_size=2)
+            finally:
+                pool.close()
+                pool.join()
+            for vertex in xrange(len(ref)):
+                self.assertAlmostEqual(ref[vertex], res[vertex])
+        res = graph_algorithms.GraphAlgorithms.betweenness_centrality(
+            self.graph2, processes=2, batch_size=3)
+        for vertex in xrange(len(ref)):
+            self.assertAlmostEqual(ref[vertex], res[vertex])
+
+    def test_graph_algorithms_closeness_centrality(self):
+        """
+        Test of closeness -and harmonic centrality of an undirected path.
+        """
+        test_graph, _ = create_graph(graph.UnDirectedUnWeightedGraph, 4,
+                                     [(i, i + 1) for i in xrange(3)])
+        res = graph_algorithms.GraphAlgorithms.closeness_centrality(
+            test_graph)
+        self.assertEqual([0.5, 0.75, 0.75, 0.5], res)
+        res = graph_algorithms.GraphAlgorithms.harmonic_centrality(test_graph)
+        ref = [1 + 1.0 / 2 + 1.0 / 3, 2.5, 2.5, 1 + 1.0 / 2 + 1.0 / 3]
+        for vertex in xrange(4):
+            self.assertAlmostEqual(ref[vertex], res[vertex])
+        res = graph_algorithms.GraphAlgorithms.harmonic_centrality(
+            test_graph, normalized=True)
+        self.assertAlmostEqual(2.5 / 3, res[1])
+
+    def test_graph_algorithms_closeness_centrality_directed(self):
+        """
+        Test of closeness -and harmonic centrality of a directed graph,
+        which uses the distances to each vertex and is scaled by the
+        fraction of vertices which can reach it.
+        """
+        test_graph, _ = self.create_directed_graph(
+            4, [(0, 1), (1, 2), (3, 2)])
+        res = graph_algorithms.GraphAlgorithms.closeness_centrality(
+            test_graph, batch_size=1)
+        self.assertEqual([0.0, 1.0 / 3, 0.75, 0.0], res)
+        res = graph_algorithms.GraphAlgorithms.harmonic_centrality(
+            test_graph, batch_size=3)
+        self.assertEqual([0.0, 1.0, 2.5, 0.0], res)
+
+    def test_graph_algorithms_closeness_centrality_random_graphs(self):
+        """
+        Test of closeness -and harmonic centrality on random directed
+        graphs against a breadth-first search from every vertex.
+        """
+        random.seed(44)
+        for _ in xrange(20):
+            number_of_vertices = random.randint(2, 12)
+            pairs = set()
+            for _ in xrange(random.randint(0, 3 * number_of_vertices)):
+                pair = (random.randrange(number_of_vertices),
+                        random.randrange(number_of_vertices))
+                if pair[0] != pair[1]:
+                    pairs.add(pair)
+            test_graph, _ = self.create_directed_graph(number_of_vertices,
+                                                       sorted(pairs))
+            view = compact_graph.CompactGraph(test_graph)
+            table = [view.breadth_first_distances(i)
+                     for i in xrange(number_of_vertices)]
+            closeness = graph_algorithms.GraphAlgorithms.closeness_centrality(
+                test_graph, batch_size=5)
+            harmonic = graph_algorithms.GraphAlgorithms.harmonic_centrality(
+                test_graph, batch_size=5)
+            for vertex in xrange(number_of_vertices):
+                distances = [table[i][vertex]
+                             for i in xrange(number_of_vertices)
+                             if table[i][vertex] > 0]
+                ref = 0.0
+                if distances:
+                    ref = float(len(distances)) / sum(distances) * \
+                        len(distances) / (number_of_vertices - 1)
+                self.assertAlmostEqual(ref, closeness[vertex])
+                ref = sum(1.0 / distance for distance in distances)
+                self.assertAlmostEqual(ref, harmonic[vertex])
+
+    def test_graph_algorithms_estimate_centrality(self):
+        """
+        Test that the estimated closeness -and harmonic centrality of a
+        connected graph lie in their intervals, which hold the exact
+        values.
+        """
+        for harmonic in [False, True]:
+            if harmonic:
+                ref = graph_algorithms.GraphAlgorithms.harmonic_centrality(
+                    self.graph1)
+            else:
+                ref = graph_algorithms.GraphAlgorithms.closeness_centrality(
+                    self.graph1)
+            for samples in [1, 5, 50]:
+                estimates, intervals = \
+                    graph_algorithms.GraphAlgorithms.estimate_centrality(
+                        self.graph1, samples, harmonic, seed=samples)
+                for vertex in xrange(len(ref)):
+                    low, high = intervals[vertex]
+                    self.assertTrue(low <= estimates[vertex] <= high)
+                    self.assertTrue(low - 1.0e-9 <= ref[vertex] <=
+                                    high + 1.0e-9)
+        estimates, intervals = \
+            graph_algorithms.GraphAlgorithms.estimate_centrality(
+                self.graph1, 5000, True, seed=1)
+        for vertex in xrange(len(ref)):
+            self.assertAlmostEqual(ref[vertex], estimates[vertex], 0)
+
+    def test_graph_algorithms_estimate_centrality_disconnected(self):
+        """
+        Test that the closeness of a graph which is not strongly
+        connected cannot be estimated, while the harmonic centrality can.
+        """
+        test_graph, _ = self.create_directed_graph(3, [(0, 1), (1, 2)])
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.estimate_centrality,
+                          test_graph, 10, False, seed=2)
+        estimates, _ = graph_algorithms.GraphAlgorithms.estimate_centrality(
+            test_graph, 10, True, seed=2)
+        self.assertEqual(0.0, estimates[0])
+
+    def test_graph_algorithms_triangles(self):
+        """
+        Test of triangle counting, local clustering -and transitivity.
+        """
+        # Triangles ABD, BCE, BDE, DEF and EFG.
+        total, counts = graph_algorithms.GraphAlgorithms.triangles(
+            self.graph1)
+        self.assertEqual(5, total)
+        self.assertEqual([1, 3, 1, 3, 4, 2, 1], counts)
+        neighbors = graph_algorithms.GraphAlgorithms.distinct_neighbors(
+            self.graph1)
+        self.assertEqual([1, 3], sorted(neighbors[0]))
+        self.assertEqual([1, 4], sorted(neighbors[2]))
+        self.assertEqual((total, counts),
+                         graph_algorithms.GraphAlgorithms.triangles(
+                             self.graph1, neighbors))
+        res = graph_algorithms.GraphAlgorithms.local_clustering(self.graph1)
+        ref = [1.0, 0.5, 1.0, 0.5, 0.4, 2.0 / 3, 1.0]
+        for vertex in xrange(7):
+            self.assertAlmostEqual(ref[vertex], res[vertex])
+        res = graph_algorithms.GraphAlgorithms.transitivity(self.graph1)
+        self.assertAlmostEqual(15.0 / 28, res)
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.triangles,
+                          self.graph2)
+
+    def test_graph_algorithms_triangles_multigraph(self):
+        """
+        Test that parallel edges -and self-loops do not change the
+        triangles, local clustering -or transitivity.
+        """
+        a, b, c, d, e, f, g = self.graph1.get_vertices()
+        self.graph1.add_edge(a, b, 3)
+        self.graph1.add_edge(b, a, 4)
+        self.graph1.add_edge(d, e, 15)
+        self.graph1.add_edge(c, c, 1)
+        self.graph1.add_edge(g, g, 2)
+        total, counts = graph_algorithms.GraphAlgorithms.triangles(
+            self.graph1)
+        self.assertEqual(5, total)
+        self.assertEqual([1, 3, 1, 3, 4, 2, 1], counts)
+        res = graph_algorithms.GraphAlgorithms.local_clustering(self.graph1)
+        ref = [1.0, 0.5, 1.0, 0.5, 0.4, 2.0 / 3, 1.0]
+        for vertex in xrange(7):
+            self.assertAlmostEqual(ref[vertex], res[vertex])
+        res = graph_algorithms.GraphAlgorithms.transitivity(self.graph1)
+        self.assertAlmostEqual(15.0 / 28, res)
+
+    def test_graph_algorithms_triangles_random_graphs(self):
+        """
+        Test of triangle counting on random graphs against a check of
+        every set of three vertices.
+        """
+        random.seed(45)
+        for _ in xrange(20):
+            number_of_vertices = random.randint(1, 12)
+            test_graph, vertices = create_random_graph(
+                graph.UnDirectedUnWeightedGraph, number_of_vertices,
+                random.random())
+            ref_total = 0
+            ref_counts = [0] * number_of_vertices
+            for vertex_u in xrange(number_of_vertices):
+                for vertex_v in xrange(vertex_u + 1, number_of_vertices):
+                    for vertex_w in xrange(vertex_v + 1, number_of_vertices):
+                        if test_graph.is_edge(vertices[vertex_u],
+                                              vertices[vertex_v]) and \
+                                test_graph.is_edge(vertices[vertex_v],
+                                                   vertices[vertex_w]) and \
+                                test_graph.is_edge(vertices[vertex_u],
+                                                   vertices[vertex_w]):
+                            ref_total += 1
+                            ref_counts[vertex_u] += 1
+                            ref_counts[vertex_v] += 1
+                            ref_counts[vertex_w] += 1
+            res = graph_algorithms.GraphAlgorithms.triangles(test_graph)
+            self.assertEqual((ref_total, ref_counts), res)
+
+    def test_graph_algorithms_core_numbers(self):
+        """
+        Test of core numbers -and k-core extraction of a graph made of
+        a complete graph on the vertices 0 to 3, a vertex 4 adjacent to
+        0 and 1, and a vertex 5 adjacent to 4.
+        """
+        pairs = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3), (0, 4),
+                 (1, 4), (4, 5)]
+        test_graph, _ = create_graph(
+            graph.UnDirectedWeightedGraph, 6,
+            [(vertex_u, vertex_v, vertex_u + vertex_v)
+             for vertex_u, vertex_v in pairs])
+        res = graph_algorithms.GraphAlgorithms.core_numbers(test_graph)
+        self.assertEqual([3, 3, 3, 3, 2, 1], res)
+        core, kept = graph_algorithms.GraphAlgorithms.k_core(test_graph, 3)
+        self.assertEqual([0, 1, 2, 3], kept)
+        self.assertEqual(graph.UnDirectedWeightedGraph, core.__class__)
+        self.assertEqual(["0", "1", "2", "3"],
+                         [vertex.get_vertex_name()
+                          for vertex in core.get_vertices()])
+        edges = sorted((edge.get_head_vertex().get_vertex_number(),
+                        edge.get_tail_vertex().get_vertex_number(),
+                        edge.get_weight())
+                       for edge in core.get_edges())
+        ref = [(vertex_u, vertex_v, vertex_u + vertex_v)
+               for vertex_u, vertex_v in pairs[:6]]
+        ref += [(tail, head, weight) for head, tail, weight in ref]
+        self.assertEqual(sorted(ref), edges)
+        core, kept = graph_algorithms.GraphAlgorithms.k_core(test_graph, 4)
+        self.assertEqual([], kept)
+        self.assertEqual(0, core.get_number_of_vertices())
+        res = graph_algorithms.GraphAlgorithms.core_numbers(self.graph1)
+        self.assertEqual([2] * 7, res)
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.core_numbers,
+                          self.graph2)
+
+    def test_graph_algorithms_core_numbers_multigraph(self):
+        """
+        Test that parallel edges -and self-loops do not change the core
+        numbers, in a triangle on the vertices 0 to 2 where vertex 3 is
+        joined to vertex 0 by three parallel edges.
+        """
+        test_graph, _ = create_graph(
+            graph.UnDirectedUnWeightedGraph, 4,
+            [(0, 1), (1, 2), (2, 0), (0, 3), (3, 0), (0, 3), (3, 3), (1, 1)])
+        res = graph_algorithms.GraphAlgorithms.core_numbers(test_graph)
+        self.assertEqual([2, 2, 2, 1], res)
+        order, cores = graph_algorithms.GraphAlgorithms.degeneracy_ordering(
+            test_graph, [[1, 2, 3], [0, 2], [0, 1], [0]])
+        self.assertEqual(3, order[0])
+        self.assertEqual(res, cores)
+
+    def test_graph_algorithms_core_numbers_random_graphs(self):
+        """
+        Test of core numbers on random graphs against repeated removal
+        of the vertices with degree below k.
+        """
+        random.seed(46)
+        for _ in xrange(20):
+            number_of_vertices = random.randint(1, 12)
+            test_graph, vertices = create_random_graph(
+                graph.UnDirectedUnWeightedGraph, number_of_vertices,
+                random.random())
+            ref = [0] * number_of_vertices
+            for k in xrange(1, number_of_vertices):
+                remaining = set(xrange(number_of_vertices))
+                removed = True
+                while removed:
+                    removed = False
+                    for vertex_u in list(remaining):
+                        degree = len([vertex_v for vertex_v in remaining
+                                      if test_graph.is_edge(
+                                          vertices[vertex_u],
+                                          vertices[vertex_v])])
+                        if degree < k:
+                            remaining.remove(vertex_u)
+                            removed = True
+                for vertex in remaining:
+                    ref[vertex] = k
+            res = graph_algorithms.GraphAlgorithms.core_numbers(test_graph)
+            self.assertEqual(ref, res)
+
+    def create_ring_of_cliques(self, number_of_cliques, clique_size):
+        """
+        Creates an undirected weighted graph made of complete graphs
+        with edges of weight 2, where consecutive complete graphs in a
+        ring are joined by a single edge of weight 1.
+        """
+        number_of_vertices = number_of_cliques * clique_size
+        edges = []
+        for clique in xrange(number_of_cliques):
+            first = clique * clique_size
+            for vertex_u in xrange(first, first + clique_size):
+                for vertex_v in xrange(vertex_u + 1, first + clique_size):
+                    edges.append((vertex_u, vertex_v, 2))
+            edges.append((first + clique_size - 1,
+                          (first + clique_size) % number_of_vertices, 1))
+        test_graph, _ = create_graph(graph.UnDirectedWeightedGraph,
+                                     number_of_vertices, edges)
+        return test_graph
+
+    def test_graph_algorithms_modularity(self):
+        """
+        Test of the modularity of a ring of two complete graphs.
+        """
+        test_graph = self.create_ring_of_cliques(2, 4)
+        labels = [0, 0, 0, 0, 1, 1, 1, 1]
+        res = graph_algorithms.GraphAlgorithms.modularity(test_graph, labels)
+        # Weight 12 inside each clique, 2 between them and 26 in total.
+        self.assertAlmostEqual(24.0 / 26 - 0.5, res)
+        res = graph_algorithms.GraphAlgorithms.modularity(test_graph,
+                                                          [0] * 8)
+        self.assertAlmostEqual(0.0, res)
+
+    def test_graph_algorithms_label_propagation(self):
+        """
+        Test that label propagation finds the complete graphs in a ring
+        of complete graphs.
+        """
+        test_graph = self.create_ring_of_cliques(5, 4)
+        ref = ([i / 4 for i in xrange(20)], [4] * 5)
+        for seed in xrange(5):
+            res = graph_algorithms.GraphAlgorithms.label_propagation(
+                test_graph, seed)
+            self.assertEqual(ref, res)
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.label_propagation,
+                          self.graph2)
+
+    def test_graph_algorithms_louvain(self):
+        """
+        Test that the Louvain method finds the complete graphs in a ring
+        of complete graphs.
+        """
+        test_graph = self.create_ring_of_cliques(6, 4)
+        ref = ([i / 4 for i in xrange(24)], [4] * 6)
+        for seed in xrange(5):
+            res = graph_algorithms.GraphAlgorithms.louvain(test_graph,
+                                                           seed=seed)
+            self.assertEqual(ref, res)
+        res = graph_algorithms.GraphAlgorithms.louvain(test_graph, 0.05)
+        self.assertTrue(len(res[1]) < 6)
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.louvain,
+                          self.graph2)
+
+    def test_graph_algorithms_louvain_random_graphs(self):
+        """
+        Test that the Louvain method on random graphs gives a modularity
+        at least as large as each vertex alone -and label propagation.
+        """
+        random.seed(47)
+        for _ in xrange(20):
+            number_of_vertices = random.randint(1, 16)
+            test_graph, _ = create_random_graph(
+                graph.UnDirectedWeightedGraph, number_of_vertices, 0.3,
+                lambda vertex_u, vertex_v: random.randint(1, 5))
+            labels, sizes = graph_algorithms.GraphAlgorithms.louvain(
+                test_graph, seed=1)
+            self.assertEqual(number_of_vertices, sum(sizes))
+            res = graph_algorithms.GraphAlgorithms.modularity(test_graph,
+                                                              labels)
+            ref = graph_algorithms.GraphAlgorithms.modularity(
+                test_graph, range(number_of_vertices))
+            self.assertTrue(res >= ref - 1.0e-9)
+            components, _ = \
+                graph_algorithms.GraphAlgorithms.connected_components(
+                    test_graph)
+            for vertex_u in xrange(number_of_vertices):
+                for vertex_v in xrange(number_of_vertices):
+                    if labels[vertex_u] == labels[vertex_v]:
+                        self.assertEqual(components[vertex_u],
+                                         components[vertex_v])
+
+    def check_coloring(self, test_graph, colors):
+        """
+        Checks that adjacent vertices have different colors, and that
+        the colors are 0, 1, ..., k - 1.
+        """
+        for edge in test_graph.get_edges():
+            self.assertNotEqual(
+                colors[edge.get_head_vertex().get_vertex_number()],
+                colors[edge.get_tail_vertex().get_vertex_number()])
+        self.assertEqual(range(max(colors) + 1 if colors else 0),
+                         sorted(set(colors)))
+
+    def test_graph_algorithms_greedy_coloring(self):
+        """
+        Test of greedy coloring with each strategy.
+        """
+        for strategy in ["largest_first", "smallest_last", "dsatur"]:
+            res = graph_algorithms.GraphAlgorithms.greedy_coloring(
+                self.graph1, strategy)
+            self.check_coloring(self.graph1, res)
+            self.assertEqual(3, max(res) + 1)
+        # A crown graph, where the order of the vertex numbers alternates
+        # sides, so visiting the vertices in that order uses four colors,
+        # while DSATUR colors it with two.
+        pairs = [(0, 3), (0, 5), (2, 1), (2, 5), (4, 1), (4, 3), (6, 1),
+                 (6, 3), (6, 5), (0, 7), (2, 7), (4, 7)]
+        test_graph, _ = create_graph(graph.UnDirectedUnWeightedGraph, 8, pairs)
+        res = graph_algorithms.GraphAlgorithms.greedy_coloring(test_graph)
+        self.check_coloring(test_graph, res)
+        self.assertEqual(4, max(res) + 1)
+        res = graph_algorithms.GraphAlgorithms.greedy_coloring(test_graph,
+                                                               "dsatur")
+        self.check_coloring(test_graph, res)
+        self.assertEqual(2, max(res) + 1)
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.greedy_coloring,
+                          test_graph, "random")
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.greedy_coloring,
+                          self.graph2)
+
+    def test_graph_algorithms_greedy_coloring_random_graphs(self):
+        """
+        Test of greedy coloring on random graphs, where largest first
+        uses at most one more color than the largest degree, and
+        smallest last at most one more color than the degeneracy.
+        """
+        random.seed(48)
+        for _ in xrange(20):
+            number_of_vertices = random.randint(1, 15)
+            test_graph, _ = create_random_graph(
+                graph.UnDirectedUnWeightedGraph, number_of_vertices,
+                random.random())
+            order, cores = \
+                graph_algorithms.GraphAlgorithms.degeneracy_ordering(
+                    test_graph)
+            self.assertEqual(range(number_of_vertices), sorted(order))
+            position = dict((vertex, i) for i, vertex in enumerate(order))
+            degree = [0] * number_of_vertices
+            later = [0] * number_of_vertices
+            for edge in test_graph.get_edges():
+                head = edge.get_head_vertex().get_vertex_number()
+                tail = edge.get_tail_vertex().get_vertex_number()
+                degree[head] += 1
+                if position[tail] > position[head]:
+                    later[head] += 1
+            self.assertTrue(max(later) <= max(cores))
+            for strategy in ["largest_first", "smallest_last", "dsatur"]:
+                res = graph_algorithms.GraphAlgorithms.greedy_coloring(
+                    test_graph, strategy)
+                self.check_coloring(test_graph, res)
+                if strategy == "largest_first":
+                    self.assertTrue(max(res) <= max(degree))
+                elif strategy == "smallest_last":
+                    self.assertTrue(max(res) <= max(cores))
+
+    def test_graph_algorithms_maximal_cliques(self):
+        """
+        Test of maximal clique enumeration, where the maximal cliques of
+        the graph are the triangles ABD, BCE, BDE, DEF and EFG.
+        """
+        res = graph_algorithms.GraphAlgorithms.maximal_cliques(self.graph1)
+        names = sorted("".join(vertex.get_vertex_name() for vertex in clique)
+                       for clique in res)
+        self.assertEqual(["ABD", "BCE", "BDE", "DEF", "EFG"], names)
+        res = graph_algorithms.GraphAlgorithms.maximal_cliques(self.graph1, 4)
+        self.assertEqual([], list(res))
+        res = graph_algorithms.GraphAlgorithms.maximal_cliques(
+            self.graph1, time_budget=0)
+        self.assertEqual([], list(res))
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.maximal_cliques,
+                          self.graph2)
+
+    def test_graph_algorithms_maximal_cliques_random_graphs(self):
+        """
+        Test of maximal clique enumeration on random graphs against a
+        check of every set of vertices.
+        """
+        random.seed(49)
+        for _ in xrange(20):
+            number_of_vertices = random.randint(1, 9)
+            probability = random.random()
+            pairs = [(vertex_u, vertex_v)
+                     for vertex_u in xrange(number_of_vertices)
+                     for vertex_v in xrange(vertex_u + 1, number_of_vertices)
+                     if random.random() < probability]
+            adjacent = set(pairs)
+            test_graph, _ = create_graph(graph.UnDirectedUnWeightedGraph,
+                                         number_of_vertices, pairs)
+            cliques = []
+            for subset in xrange(1, 1 << number_of_vertices):
+                members = [vertex for vertex in xrange(number_of_vertices)
+                           if subset >> vertex & 1]
+                if all((vertex_u, vertex_v) in adjacent
+                       for vertex_u in members for vertex_v in members
+                       if vertex_u < vertex_v):
+                    cliques.append(subset)
+            maximal = [subset for subset in cliques
+                       if not any(other != subset and other & subset == subset
+                                  for other in cliques)]
+            for min_size in [1, 3]:
+                ref = sorted([vertex for vertex in xrange(number_of_vertices)
+                              if subset >> vertex & 1]
+                             for subset in maximal
+                             if bin(subset).count("1") >= min_size)
+                res = sorted([vertex.get_vertex_number() for vertex in clique]
+                             for clique in graph_algorithms.GraphAlgorithms.
+                             maximal_cliques(test_graph, min_size))
+                self.assertEqual(ref, res)
+
+    def test_graph_algorithms_stoer_wagner(self):
+        """
+        Test of the global minimum cut of the graph with two complete
+        graphs in a ring, where the two joining edges form the cut.
+        """
+        test_graph = self.create_ring_of_cliques(2, 4)
+        weight, side = graph_algorithms.GraphAlgorithms.stoer_wagner(
+            test_graph)
+        self.assertEqual(2, weight)
+        numbers = [vertex.get_vertex_number() for vertex in side]
+        self.assertTrue(numbers in [[0, 1, 2, 3], [4, 5, 6, 7]])
+        weight, side = graph_algorithms.GraphAlgorithms.stoer_wagner(
+            self.graph1)
+        self.assertEqual(12, weight)
+        names = [vertex.get_vertex_name() for vertex in side]
+        self.assertTrue(names in [["A"], ["B", "C", "D", "E", "F", "G"]])
+        self.assertRaises(ValueError,
+                          graph_algorithms.GraphAlgorithms.stoer_wagner,
+                          self.graph2)
+
+    def test_graph_algorithms_stoer_wagner_random_graphs(self):
+        """
+        Test of the global minimum cut on random graphs against a check
+        of every division of the vertices.
+        """
+        random.seed(50)
+        for _ in xrange(20):
+            number_of_vertices = random.randint(2, 8)
+            edges = [(vertex_u, vertex_v, random.randint(1, 9))
+                     for vertex_u in xrange(number_of_vertices)
+                     for vertex_v in xrange(vertex_u + 1, number_of_vertices)
+                     if random.random() < 0.5]
+            test_graph, _ = create_graph(graph.UnDirectedWeightedGraph,
+                                         number_of_vertices, edges)
+
+            def cut_weight(side):
+                return sum(weight for vertex_u, vertex_v, weight in edges
+                           if (vertex_u in side) != (vertex_v in side))
+            ref = min(cut_weight(set(vertex
+                                     for vertex in xrange(number_of_vertices)
+                                     if subset >> vertex & 1))
+                      for subset in xrange(1, (1 << number_of_vertices) - 1))
+            weight, side = graph_algorithms.GraphAlgorithms.stoer_wagner(
+                test_graph)
+            numbers = set(vertex.get_vertex_number() for vertex in side)
+            self.assertEqual(ref, weight)
+            self.assertEqual(ref, cut_weight(numbers))
+            self.assertTrue(0 < len(numbers) < number_of_vertices)
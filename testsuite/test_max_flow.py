@@ -0,0 +1,265 @@
+#!/usr/bin/env py.test
+
+"""
+Test of maximum flow algorithms.
+"""
+
+import random
+import unittest
+
+from py_alg_dat import graph
+from py_alg_dat import graph_algorithms
+from py_alg_dat import graph_vertex
+from py_alg_dat import max_flow
+from testsuite import test_graph_algorithms
+
+
+class TestMaxFlow(unittest.TestCase):
+
+    """
+    Test of maximum flow algorithms.
+    """
+
+    def setUp(self):
+        # Flow network from Cormen page 727.
+        self.graph1 = graph.DirectedWeightedGraph(6)
+
+        self.s_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "s")
+        self.v1_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "v1")
+        self.v2_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "v2")
+        self.v3_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "v3")
+        self.v4_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "v4")
+        self.t_g1 = graph_vertex.UnWeightedGraphVertex(self.graph1, "t")
+
+        self.graph1.add_vertex(self.s_g1)
+        self.graph1.add_vertex(self.v1_g1)
+        self.graph1.add_vertex(self.v2_g1)
+        self.graph1.add_vertex(self.v3_g1)
+        self.graph1.add_vertex(self.v4_g1)
+        self.graph1.add_vertex(self.t_g1)
+
+        self.graph1.add_edge(self.s_g1, self.v1_g1, 16)
+        self.graph1.add_edge(self.s_g1, self.v2_g1, 13)
+        self.graph1.add_edge(self.v2_g1, self.v1_g1, 4)
+        self.graph1.add_edge(self.v1_g1, self.v3_g1, 12)
+        self.graph1.add_edge(self.v3_g1, self.v2_g1, 9)
+        self.graph1.add_edge(self.v2_g1, self.v4_g1, 14)
+        self.graph1.add_edge(self.v4_g1, self.v3_g1, 7)
+        self.graph1.add_edge(self.v3_g1, self.t_g1, 20)
+        self.graph1.add_edge(self.v4_g1, self.t_g1, 4)
+
+        self.algorithms = [graph_algorithms.GraphAlgorithms.edmonds_karp,
+                           graph_algorithms.GraphAlgorithms.dinic,
+                           graph_algorithms.GraphAlgorithms.push_relabel]
+
+    def check_flow(self, a_graph, source, sink, result):
+        """
+        Checks that the flow in the result respects the capacities,
+        is conserved in every vertex except the source and the sink,
+        and that the minimum cut has the same value as the flow.
+        """
+        balance = dict((vertex, 0) for vertex in a_graph.get_vertices())
+        for edge, flow in zip(result.get_edges(), result.get_edge_flows()):
+            self.assertTrue(0 <= flow <= edge.get_weight())
+            balance[edge.get_head_vertex()] -= flow
+            balance[edge.get_tail_vertex()] += flow
+        for vertex, value in balance.items():
+            if vertex != source and vertex != sink:
+                self.assertEqual(0, value)
+        self.assertEqual(result.get_flow_value(), balance[sink])
+        cut = sum(edge.get_weight() for edge in result.get_cut_edges())
+        self.assertEqual(result.get_flow_value(), cut)
+        self.assertTrue(source in result.get_source_side())
+        self.assertTrue(sink in result.get_sink_side())
+
+    def test_max_flow_value(self):
+        """
+        Test of the maximum flow value of each algorithm.
+        """
+        for algorithm in self.algorithms:
+            res = algorithm(self.graph1, self.s_g1, self.t_g1)
+            self.assertEqual(23, res.get_flow_value())
+            self.check_flow(self.graph1, self.s_g1, self.t_g1, res)
+
+    def test_max_flow_min_cut(self):
+        """
+        Test of the minimum cut of each algorithm.
+        """
+        ref = set([self.s_g1, self.v1_g1, self.v2_g1, self.v4_g1])
+        for algorithm in self.algorithms:
+            res = algorithm(self.graph1, self.s_g1, self.t_g1)
+            self.assertEqual(ref, res.get_source_side())
+            self.assertEqual(set([self.v3_g1, self.t_g1]), res.get_sink_side())
+
+    def test_max_flow_no_path(self):
+        """
+        Test of the maximum flow, when the sink cannot be reached.
+        """
+        for algorithm in self.algorithms:
+            res = algorithm(self.graph1, self.t_g1, self.s_g1)
+            self.assertEqual(0, res.get_flow_value())
+            self.assertEqual(set([self.t_g1]), res.get_source_side())
+
+    def test_max_flow_source_equals_sink(self):
+        """
+        Test that the source and the sink must differ.
+        """
+        network = max_flow.FlowNetwork(self.graph1)
+        self.assertRaises(ValueError, network.dinic, 0, 0)
+
+    def test_max_flow_negative_capacity(self):
+        """
+        Test that negative capacities are rejected.
+        """
+        self.graph1.add_edge(self.v1_g1, self.t_g1, -1)
+        self.assertRaises(ValueError, max_flow.FlowNetwork, self.graph1)
+
+    def test_max_flow_network_reuse(self):
+        """
+        Test that a network can be solved repeatedly.
+        """
+        network = max_flow.FlowNetwork(self.graph1)
+        self.assertEqual(23, network.push_relabel(0, 5))
+        self.assertEqual(23, network.edmonds_karp(0, 5))
+        self.assertEqual(23, network.dinic(0, 5))
+        self.assertEqual(20, network.dinic(0, 1))
+
+    def test_max_flow_parallel_edges(self):
+        """
+        Test that parallel edges with the same endpoints and capacity
+        each keep their own flow and are both in the minimum cut.
+        """
+        test_graph = graph.DirectedWeightedGraph(2)
+        source = graph_vertex.UnWeightedGraphVertex(test_graph, "s")
+        sink = graph_vertex.UnWeightedGraphVertex(test_graph, "t")
+        test_graph.add_vertex(source)
+        test_graph.add_vertex(sink)
+        test_graph.add_edge(source, sink, 5)
+        test_graph.add_edge(source, sink, 5)
+        for algorithm in self.algorithms:
+            res = algorithm(test_graph, source, sink)
+            self.assertEqual(10, res.get_flow_value())
+            self.assertEqual([5, 5], res.get_edge_flows())
+            self.assertEqual(5, res.get_edge_flow(1))
+            self.assertEqual(2, len(res.get_cut_edges()))
+            self.check_flow(test_graph, source, sink, res)
+
+    def test_max_flow_random_graphs(self):
+        """
+        Test that the algorithms agree on random graphs.
+        """
+        rand = random.Random(17)
+        for _ in xrange(20):
+            size = rand.randint(2, 12)
+            a_graph, vertices = test_graph_algorithms.create_graph(
+                graph.DirectedWeightedGraph, size)
+            for _ in xrange(rand.randint(0, 4 * size)):
+                vertex_u = rand.choice(vertices)
+                vertex_v = rand.choice(vertices)
+                if vertex_u != vertex_v:
+                    a_graph.add_edge(vertex_u, vertex_v, rand.randint(0, 10))
+            source = vertices[0]
+            sink = vertices[-1]
+            values = set()
+            for algorithm in self.algorithms:
+                res = algorithm(a_graph, source, sink)
+                self.check_flow(a_graph, source, sink, res)
+                values.add(res.get_flow_value())
+            self.assertEqual(1, len(values))
+
+    def create_cost_graph(self):
+        """
+        Creates a graph where the weight of an edge is its capacity,
+        together with a function returning the cost of an edge.
+        """
+        a_graph = graph.DirectedWeightedGraph(4)
+        vertices = [graph_vertex.UnWeightedGraphVertex(a_graph, name)
+                    for name in ["s", "a", "b", "t"]]
+        for vertex in vertices:
+            a_graph.add_vertex(vertex)
+        costs = {}
+        for vertex_u, vertex_v, capacity, cost in [(0, 1, 3, 1),
+                                                   (0, 2, 2, 4),
+                                                   (1, 2, 2, 1),
+                                                   (1, 3, 2, 5),
+                                                   (2, 3, 3, 1)]:
+            a_graph.add_edge(vertices[vertex_u], vertices[vertex_v], capacity)
+            costs[(vertex_u, vertex_v)] = cost
+
+        def cost_function(edge):
+            """
+            Returns the cost of the edge.
+            """
+            return costs[(edge.get_head_vertex().get_vertex_number(),
+                          edge.get_tail_vertex().get_vertex_number())]
+        return a_graph, vertices, cost_function
+
+    def test_max_flow_min_cost_flow(self):
+        """
+        Test of minimum cost maximum flow with and without capacity
+        scaling.
+        """
+        a_graph, vertices, cost = self.create_cost_graph()
+        for scaling in [False, True]:
+            res = graph_algorithms.GraphAlgorithms.min_cost_flow(
+                a_graph, vertices[0], vertices[3], cost=cost,
+                scaling=scaling)
+            self.check_flow(a_graph, vertices[0], vertices[3], res)
+            self.assertEqual(5, res.get_flow_value())
+            self.assertEqual(25, res.get_cost())
+
+    def test_max_flow_min_cost_flow_limit(self):
+        """
+        Test of minimum cost flow with a flow limit.
+        """
+        a_graph, vertices, cost = self.create_cost_graph()
+        for scaling in [False, True]:
+            res = graph_algorithms.GraphAlgorithms.min_cost_flow(
+                a_graph, vertices[0], vertices[3], cost=cost, flow_limit=2,
+                scaling=scaling)
+            self.assertEqual(2, res.get_flow_value())
+            self.assertEqual(6, res.get_cost())
+
+    def test_max_flow_min_cost_flow_negative_cycle(self):
+        """
+        Test that successive shortest paths raises ValueError for a
+        negative cycle, while capacity scaling saturates it.
+        """
+        a_graph, vertices, cost = self.create_cost_graph()
+        a_graph.add_edge(vertices[2], vertices[1], 1)
+        network = max_flow.MinCostFlowNetwork(
+            a_graph, cost=lambda edge: cost(edge) if edge.get_weight() > 1
+            else -3)
+        self.assertRaises(ValueError, network.successive_shortest_paths, 0, 3)
+        self.assertEqual(5, network.capacity_scaling(0, 3))
+        self.assertEqual(23, network.get_cost())
+
+    def test_max_flow_min_cost_flow_random_graphs(self):
+        """
+        Test that successive shortest paths and capacity scaling
+        agree on random graphs.
+        """
+        rand = random.Random(32)
+        for _ in xrange(20):
+            size = rand.randint(2, 10)
+            a_graph, vertices = test_graph_algorithms.create_graph(
+                graph.DirectedWeightedGraph, size)
+            costs = {}
+            for _ in xrange(rand.randint(0, 4 * size)):
+                vertex_u = rand.choice(vertices)
+                vertex_v = rand.choice(vertices)
+                if vertex_u != vertex_v:
+                    a_graph.add_edge(vertex_u, vertex_v, rand.randint(0, 100))
+            for edge in a_graph.get_edges():
+                costs[edge] = rand.randint(0, 10)
+            source = vertices[0]
+            sink = vertices[-1]
+            ref = graph_algorithms.GraphAlgorithms.dinic(a_graph, source, sink)
+            results = []
+            for scaling in [False, True]:
+                res = graph_algorithms.GraphAlgorithms.min_cost_flow(
+                    a_graph, source, sink, cost=costs.get, scaling=scaling)
+                self.check_flow(a_graph, source, sink, res)
+                self.assertEqual(ref.get_flow_value(), res.get_flow_value())
+                results.append(res.get_cost())
+            self.assertEqual(results[0], results[1])
@@ -228,3 +228,63 @@ class TestEntry(unittest.TestCase):
         self.assertEqual(ref.elems, res.elems)
 
     ### End test of class Partition ###
+
+    ### Begin test of class ArrayPartition ###
+
+    def test_array_partition_constructor(self):
+        """
+        Test constructor.
+        """
+        par = partition.ArrayPartition(3)
+        self.assertEqual(3, len(par))
+        self.assertEqual(3, par.get_number_of_sets())
+        self.assertEqual(([0, 1, 2], [1, 1, 1]), par.get_labels())
+
+    def test_array_partition_union(self):
+        """
+        Test method "union".
+        """
+        par = partition.ArrayPartition(5)
+        self.assertTrue(par.union(0, 3))
+        self.assertTrue(par.union(4, 3))
+        self.assertFalse(par.union(0, 4))
+        self.assertEqual(3, par.get_number_of_sets())
+        self.assertTrue(par.same_set(0, 4))
+        self.assertFalse(par.same_set(0, 1))
+        self.assertEqual(([0, 1, 2, 0, 0], [3, 1, 1]), par.get_labels())
+
+    def test_array_partition_find(self):
+        """
+        Test method "find".
+        """
+        par = partition.ArrayPartition(4)
+        par.union(0, 1)
+        par.union(2, 3)
+        par.union(1, 3)
+        root = par.find(0)
+        for elem in xrange(4):
+            self.assertEqual(root, par.find(elem))
+
+    def test_array_partition_make_set(self):
+        """
+        Test method "make_set".
+        """
+        par = partition.ArrayPartition(2)
+        self.assertEqual(2, par.make_set())
+        par.set_size(5)
+        self.assertEqual(5, len(par))
+        self.assertEqual(5, par.get_number_of_sets())
+
+    def test_array_partition_equal(self):
+        """
+        Test operator "equal".
+        """
+        par1 = partition.ArrayPartition(3)
+        par2 = partition.ArrayPartition(3)
+        par1.union(0, 2)
+        par2.union(2, 0)
+        self.assertEqual(par1, par2)
+        par2.union(1, 0)
+        self.assertNotEqual(par1, par2)
+
+    ### End test of class ArrayPartition ###
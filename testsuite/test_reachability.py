@@ -0,0 +1,104 @@
+#!/usr/bin/env py.test
+
+"""
+Test of the reachability index.
+"""
+
+import random
+import unittest
+
+from py_alg_dat import compact_graph
+from py_alg_dat import graph
+from py_alg_dat import reachability
+from testsuite import test_graph_algorithms
+
+
+class TestReachabilityIndex(unittest.TestCase):
+
+    """
+    Test of the reachability index.
+    """
+
+    def setUp(self):
+        # Two cycles {0, 1, 2} and {3, 4} joined by the edge (2, 3),
+        # a vertex 5 reaching the second cycle and a sink 6.
+        self.graph1, self.vertices = test_graph_algorithms.create_graph(
+            graph.DirectedGraph, 7, [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4),
+                                     (4, 3), (5, 4), (5, 6)])
+
+    def check_index(self, test_graph, vertices, index):
+        """
+        Checks the index against a breadth-first search from every
+        vertex.
+        """
+        view = compact_graph.CompactGraph(test_graph)
+        for vertex_u in vertices:
+            distances = view.breadth_first_distances(
+                vertex_u.get_vertex_number())
+            for vertex_v in vertices:
+                ref = distances[vertex_v.get_vertex_number()] >= 0
+                self.assertEqual(ref, index.reaches(vertex_u, vertex_v))
+
+    def test_reachability_components(self):
+        """
+        Test of the strongly connected components of the index.
+        """
+        index = reachability.ReachabilityIndex(self.graph1)
+        a, b, c, d, e, f, g = self.vertices
+        self.assertEqual(4, index.get_number_of_components())
+        self.assertEqual(index.get_component(a), index.get_component(b))
+        self.assertEqual(index.get_component(a), index.get_component(c))
+        self.assertEqual(index.get_component(d), index.get_component(e))
+        self.assertNotEqual(index.get_component(f), index.get_component(g))
+
+    def test_reachability_closure(self):
+        """
+        Test of reachability queries answered by the transitive closure.
+        """
+        index = reachability.ReachabilityIndex(self.graph1)
+        self.assertTrue(index.has_closure())
+        a, b, c, d, e, f, g = self.vertices
+        self.assertTrue(index.reaches(b, a))
+        self.assertTrue(index.reaches(a, e))
+        self.assertTrue(index.reaches(f, d))
+        self.assertTrue(index.reaches(g, g))
+        self.assertFalse(index.reaches(d, a))
+        self.assertFalse(index.reaches(a, f))
+        self.assertFalse(index.reaches(c, g))
+        self.check_index(self.graph1, self.vertices, index)
+
+    def test_reachability_intervals(self):
+        """
+        Test of reachability queries answered by interval labels.
+        """
+        index = reachability.ReachabilityIndex(self.graph1, closure=False)
+        self.assertFalse(index.has_closure())
+        self.check_index(self.graph1, self.vertices, index)
+
+    def test_reachability_max_closure_size(self):
+        """
+        Test that interval labels are built when the condensation has
+        more components than the maximum closure size.
+        """
+        index = reachability.ReachabilityIndex(self.graph1,
+                                               max_closure_size=3)
+        self.assertFalse(index.has_closure())
+        self.check_index(self.graph1, self.vertices, index)
+
+    def test_reachability_random_graphs(self):
+        """
+        Test of both kinds of index on random directed graphs.
+        """
+        random.seed(41)
+        for _ in xrange(20):
+            number_of_vertices = random.randint(1, 25)
+            # About as many edges as vertices on average.
+            probability = 2.0 * random.random() / number_of_vertices
+            test_graph, vertices = test_graph_algorithms.create_random_graph(
+                graph.DirectedGraph, number_of_vertices, probability)
+            for closure in [True, False]:
+                for number_of_labelings in [1, 2, 3]:
+                    index = reachability.ReachabilityIndex(
+                        test_graph, closure,
+                        number_of_labelings=number_of_labelings)
+                    self.check_index(test_graph, vertices, index)
@@ -526,6 +526,34 @@ class TestUnDirectedGraph(unittest.TestCase):
         a_graph.add_edge(v_3, v_1)
         self.assertFalse(a_graph.is_connected())
 
+    def test_un_directed_graph_bfs(self):
+        """
+        Test method "bfs".
+        """
+        ref = [(self.v_1, 0, None),
+               (self.v_2, 1, self.v_1),
+               (self.v_4, 1, self.v_1),
+               (self.v_3, 2, self.v_2),
+               (self.v_5, 2, self.v_2),
+               (self.v_6, 2, self.v_4),
+               (self.v_7, 3, self.v_5)]
+        res = list(self.g_1.bfs(0))
+        self.assertEqual(ref, res)
+
+    def test_un_directed_graph_dfs(self):
+        """
+        Test method "dfs".
+        """
+        ref = [(self.v_1, 0, None),
+               (self.v_2, 1, self.v_1),
+               (self.v_3, 2, self.v_2),
+               (self.v_5, 3, self.v_3),
+               (self.v_4, 4, self.v_5),
+               (self.v_6, 5, self.v_4),
+               (self.v_7, 6, self.v_6)]
+        res = list(self.g_1.dfs(0))
+        self.assertEqual(ref, res)
+
     def test_un_directed_graph_is_cyclic(self):
         """
         Test method "is_cyclic".
@@ -672,3 +700,68 @@ class TestUnDirectedGraph(unittest.TestCase):
         ref[e23] = graph_edge.EdgeClassification.TREE_EDGE
         ref[e24] = graph_edge.EdgeClassification.TREE_EDGE
         self.assertEqual(res, ref)
+
+    def test_un_directed_graph_classify_biconnectivity(self):
+        """
+        Test method "classify_biconnectivity".
+        """
+        a_graph = graph.UnDirectedGraph(7)
+        vertices = [graph_vertex.UnWeightedGraphVertex(a_graph, str(i))
+                    for i in xrange(7)]
+        for vertex in vertices:
+            a_graph.add_vertex(vertex)
+        a_graph.add_edge(vertices[0], vertices[1])
+        a_graph.add_edge(vertices[1], vertices[2])
+        a_graph.add_edge(vertices[2], vertices[0])
+        a_graph.add_edge(vertices[1], vertices[3])
+        a_graph.add_edge(vertices[3], vertices[4])
+        a_graph.add_edge(vertices[4], vertices[5])
+        a_graph.add_edge(vertices[5], vertices[3])
+        a_graph.add_edge(vertices[5], vertices[6])
+        res = a_graph.classify_biconnectivity()
+
+        ref = set([vertices[1], vertices[3], vertices[5]])
+        self.assertEqual(ref, res.get_articulation_points())
+
+        bridges = set((edge.get_head_vertex(), edge.get_tail_vertex())
+                      for edge in res.get_bridges())
+        ref = set([(vertices[1], vertices[3]), (vertices[5], vertices[6])])
+        self.assertEqual(ref, bridges)
+
+        components = sorted(
+            sorted(set(vertex.get_vertex_number()
+                       for edge in component
+                       for vertex in (edge.get_head_vertex(), edge.get_tail_vertex())))
+            for component in res.get_biconnected_components())
+        self.assertEqual([[0, 1, 2], [1, 3], [3, 4, 5], [5, 6]], components)
+        self.assertEqual(6, res.get_number_of_tree_edges())
+        self.assertEqual(2, res.get_number_of_back_edges())
+
+    def test_un_directed_graph_classify_biconnectivity_no_articulation(self):
+        """
+        Test method "classify_biconnectivity" - graph without
+        articulation points.
+        """
+        res = self.g_1.classify_biconnectivity()
+        self.assertEqual(set(), res.get_articulation_points())
+        self.assertEqual(set(), res.get_bridges())
+        self.assertEqual(1, len(res.get_biconnected_components()))
+        self.assertEqual(11, len(res.get_biconnected_components()[0]))
+
+    def test_un_directed_graph_classify_biconnectivity_deep(self):
+        """
+        Test method "classify_biconnectivity" - a path deeper
+        than the recursion limit.
+        """
+        size = 1100
+        a_graph = graph.UnDirectedGraph(size)
+        vertices = [graph_vertex.UnWeightedGraphVertex(a_graph, str(i))
+                    for i in xrange(size)]
+        for vertex in vertices:
+            a_graph.add_vertex(vertex)
+        for i in xrange(size - 1):
+            a_graph.add_edge(vertices[i], vertices[i + 1])
+        res = a_graph.classify_biconnectivity()
+        self.assertEqual(size - 2, len(res.get_articulation_points()))
+        self.assertEqual(size - 1, len(res.get_bridges()))
+        self.assertEqual(size - 1, len(res.get_biconnected_components()))